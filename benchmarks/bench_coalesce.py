@@ -0,0 +1,85 @@
+"""
+Benchmark request coalescing when many threads look up the same players.
+
+Sends bursts of lookups for a few popular uuids through one Client, with
+coalescing on and off, against a fake server that takes --latency seconds
+per response. Reports how many requests reached the server, how many
+lookups were coalesced and the time taken. Results are printed as JSON.
+
+    python -m benchmarks.bench_coalesce --lookups 200 --players 4 --threads 16
+"""
+
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter, sleep
+from typing import Any, Dict
+from urllib.parse import parse_qs, urlsplit
+
+from hyparse import Client, Player
+
+from .fake_server import FakeHypixelServer
+from .generators import make_profiles_response
+
+
+def run(
+    lookups: int, players: int, threads: int, latency: float, coalesce: bool
+) -> Dict[str, Any]:
+    uuids = [f"{index:032x}" for index in range(1, players + 1)]
+    bodies = {
+        uuid: json.dumps(make_profiles_response(uuid, backpacks=2)).encode()
+        for uuid in uuids
+    }
+
+    def body(path: str) -> bytes:
+        sleep(latency)
+        return bodies[parse_qs(urlsplit(path).query)["uuid"][0]]
+
+    with FakeHypixelServer(limit=10**6, body=body) as server:
+        base_url = Player._base_url
+        Player._base_url = f"{server.url}/v2/skyblock"
+        client = Client(pool_size=threads, coalesce=coalesce)
+        try:
+            start = perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(
+                    pool.map(
+                        lambda i: Player(
+                            "benchmark", uuid=uuids[i % players], client=client
+                        ),
+                        range(lookups),
+                    )
+                )
+            elapsed = perf_counter() - start
+        finally:
+            Player._base_url = base_url
+            client.close()
+
+    flight = client.single_flight
+    return {
+        "coalesce": coalesce,
+        "lookups": lookups,
+        "server_requests": server.served,
+        "coalesced": flight.stats()["coalesced"] if flight is not None else 0,
+        "elapsed_s": round(elapsed, 4),
+        "lookups_per_s": round(lookups / elapsed, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    results = [
+        run(args.lookups, args.players, args.threads, args.latency, coalesce)
+        for coalesce in (False, True)
+    ]
+    print(json.dumps({"benchmark": "coalesce", "results": results}, indent=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Find the crossover points between NBT batch decoding strategies.
+
+For batches of different blob counts and sizes, times decoding inline, on the
+persistent thread and process pools of NBTExecutor, and with a fresh
+ProcessPoolExecutor per batch (the previous behaviour), and reports which
+strategy NBTExecutor picks. Results are printed as JSON.
+
+    python -m benchmarks.bench_executor --repeat 3
+"""
+
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+from hyparse.player.Inventory.Executor import NBTExecutor
+from hyparse.player.Inventory.NBT import _nbt_to_json
+
+from .generators import make_inventory_blob
+
+# (number of blobs, slots per blob)
+BATCHES = [(3, 9), (11, 27), (11, 45), (30, 45), (30, 405), (60, 405)]
+
+
+def fresh_pool(blobs: List[str]) -> Any:
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(_nbt_to_json, blobs))
+
+
+def best_of(run: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return round(best * 1000, 3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    executor = NBTExecutor(max_workers=args.workers)
+    # Warm both pools so the persistent numbers exclude start-up
+    executor.map([make_inventory_blob(9)] * 2, "processes")
+    executor.map([make_inventory_blob(9)] * 2, "threads")
+
+    results: List[Dict[str, Any]] = []
+    for count, slots in BATCHES:
+        blobs = [make_inventory_blob(slots, seed=i) for i in range(count)]
+        timings = {
+            f"{mode}_ms": best_of(partial(executor.map, blobs, mode), args.repeat)
+            for mode in ("inline", "threads", "processes")
+        }
+        timings["fresh_pool_ms"] = best_of(partial(fresh_pool, blobs), args.repeat)
+        results.append(
+            {
+                "blobs": count,
+                "slots": slots,
+                "base64_bytes": sum(len(blob) for blob in blobs),
+                **timings,
+                "fastest": min(timings, key=timings.get)[: -len("_ms")],
+                "chosen": executor.strategy(blobs),
+            }
+        )
+    executor.shutdown()
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "nbt_executor",
+                "max_workers": executor.max_workers,
+                "results": results,
+            },
+            indent=3,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
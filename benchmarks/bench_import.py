@@ -0,0 +1,91 @@
+"""
+Benchmark how long importing hyparse takes.
+
+Runs each import statement in a fresh interpreter with -X importtime and
+reports the time spent importing (best of --repeat runs) and which heavy
+dependencies it pulled in. Results are printed as JSON, and the exit code
+is 1 when a statement is over its budget or imports a dependency it
+shouldn't. tests/test_imports.py checks the same budgets, with a margin
+for slow machines.
+
+    python -m benchmarks.bench_import --repeat 5
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+# statement → (budget in ms, modules it must not import)
+HEAVY = ("requests", "urllib3", "numpy", "nbtlib", "numerize", "asyncio", "sqlite3")
+BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "import hyparse": (25.0, HEAVY),
+    "from hyparse.levels import getSkillLevel": (25.0, HEAVY),
+    "from hyparse import Player": (40.0, HEAVY),
+    "from hyparse import Client": (250.0, ("numpy", "nbtlib", "asyncio")),
+}
+
+MARKER = "-- hyparse import starts --"
+_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S.*)$")
+
+
+def import_time(statement: str) -> Tuple[float, List[str]]:
+    """
+    (ms spent importing, modules loaded) for statement in a new interpreter.
+    Only imports made by statement count, not the interpreter's own startup.
+    """
+    code = (
+        f"import sys; print({MARKER!r}, file=sys.stderr); {statement}; "
+        "print('\\n'.join(sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    _, _, log = result.stderr.partition(MARKER)
+    total_us = 0
+    for line in log.splitlines():
+        # Only top level lines, nested imports are in their cumulative time
+        match = _LINE.match(line)
+        if match:
+            total_us += int(match.group(1))
+
+    return total_us / 1000, result.stdout.split()
+
+
+def measure(statement: str, repeat: int) -> Dict[str, Any]:
+    budget_ms, forbidden = BUDGETS.get(statement, (float("inf"), ()))
+    best = float("inf")
+    for _ in range(repeat):
+        ms, modules = import_time(statement)
+        best = min(best, ms)
+
+    imported = sorted(name for name in forbidden if name in modules)
+    return {
+        "best_ms": round(best, 2),
+        "budget_ms": budget_ms,
+        "forbidden_imported": imported,
+        "ok": best <= budget_ms and not imported,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("statements", nargs="*", default=list(BUDGETS))
+    args = parser.parse_args()
+
+    results = {
+        statement: measure(statement, args.repeat) for statement in args.statements
+    }
+    print(json.dumps({"benchmark": "import", "results": results}, indent=3))
+    sys.exit(0 if all(result["ok"] for result in results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Measure the memory kept per player by derived results, as dicts and compact.
+
+For a batch of synthetic members, computes skill levels, Catacombs and Master
+Catacombs floor stats and trophy fish, keeping every result alive the way a
+leaderboard would. Reports the bytes retained per player with the default
+dict results and with compact=True records. Results are printed as JSON.
+
+    python -m benchmarks.bench_models --players 1000
+"""
+
+import argparse
+import json
+import tracemalloc
+from random import Random
+from typing import Any, Dict, List
+
+from hyparse import Member
+
+from .generators import make_player_stats
+
+
+def results(member: Member, compact: bool) -> Dict[str, Any]:
+    dungeons = member.dungeons
+    fishing = member.fishing
+    return {
+        "skills": member.get_skill_levels(compact=compact),
+        "catacombs": dungeons.catacombs.format_data(compact=compact),
+        "master_catacombs": dungeons.master_catacombs.format_data(compact=compact),
+        "trophies": fishing.get_trophies(compact=compact),
+        "highest_trophies": fishing.get_highest_trophies(compact=compact),
+    }
+
+
+def make_members(players: int, seed: int) -> List[Member]:
+    rng = Random(seed)
+    return [Member(f"{index:032x}", make_player_stats(rng)) for index in range(players)]
+
+
+def retained_per_player(members: List[Member], compact: bool) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [results(member, compact) for member in members]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del kept
+    return (after - before) / len(members)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Fresh members for each form, as views are memoized on the member and
+    # the second run would otherwise reuse the ones the first one built
+    as_dicts = retained_per_player(make_members(args.players, args.seed), False)
+    compact = retained_per_player(make_members(args.players, args.seed), True)
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "result_models",
+                "players": args.players,
+                "dict_bytes_per_player": round(as_dicts),
+                "compact_bytes_per_player": round(compact),
+                "saving": round(1 - compact / as_dicts, 3),
+            },
+            indent=3,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
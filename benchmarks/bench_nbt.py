@@ -0,0 +1,85 @@
+"""
+Benchmark the single-pass NBT decoder against the nbtlib based path.
+
+Decodes ender chest and backpack sized blobs with both decoders, with the
+native decoder restricted to a few fields per slot, and from a warm NBTCache,
+and reports the best time per blob and peak allocation. Results are printed as JSON.
+
+    python -m benchmarks.bench_nbt --repeat 20
+"""
+
+import argparse
+import json
+import tracemalloc
+from base64 import b64decode
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+from hyparse.cache import NBTCache
+from hyparse.player.Inventory.Decoder import compile_fields
+from hyparse.player.Inventory.NBT import _nbt_to_json, _nbt_to_json_nbtlib
+
+from .generators import make_inventory_blob
+
+BLOBS = {
+    # 9 pages of 45 slots
+    "ender_chest": lambda: make_inventory_blob(9 * 45, fill=0.9),
+    "jumbo_backpack": lambda: make_inventory_blob(45, fill=0.9),
+    "small_backpack": lambda: make_inventory_blob(9, fill=0.9),
+}
+PROJECTION = compile_fields(
+    ["i.Count", "i.tag.ExtraAttributes.id", "i.tag.ExtraAttributes.uuid"]
+)
+CACHE = NBTCache()
+DECODERS: Dict[str, Callable[[str], Any]] = {
+    "nbtlib": _nbt_to_json_nbtlib,
+    "native": _nbt_to_json,
+    "native_projected": lambda blob: _nbt_to_json(blob, PROJECTION),
+    "cached": CACHE.get,
+}
+
+
+def measure(decode: Callable[[str], Any], blob: str, repeat: int) -> Dict[str, Any]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        decode(blob)
+        best = min(best, perf_counter() - start)
+
+    tracemalloc.start()
+    decode(blob)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"best_ms": round(best * 1000, 3), "peak_kib": round(peak / 1024, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    results = []
+    for name, make in BLOBS.items():
+        blob = make()
+        CACHE.set(blob, _nbt_to_json(blob))
+        timings = {
+            decoder: measure(decode, blob, args.repeat)
+            for decoder, decode in DECODERS.items()
+        }
+        results.append(
+            {
+                "blob": name,
+                "compressed_bytes": len(b64decode(blob)),
+                **timings,
+                "speedup": round(
+                    timings["nbtlib"]["best_ms"] / timings["native"]["best_ms"], 2
+                ),
+            }
+        )
+
+    print(json.dumps({"benchmark": "nbt_decode", "results": results}, indent=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark parsing a /profiles response in full against streaming mode.
+
+Builds a synthetic response with several coop profiles and compares
+json.loads, which materializes everything, with parse_profiles, which keeps
+only the selected profile's own member. Reports the best parse time and
+the peak allocation of each. Results are printed as JSON.
+
+    python -m benchmarks.bench_profiles --profiles 5 --members 4
+"""
+
+import argparse
+import json
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+from hyparse.ProfileParser import parse_profiles
+
+from .generators import make_profiles_response
+
+UUID = "0959dfbde98d4b348271ad0c5728f4fe"
+
+
+def measure(parse: Callable[[bytes], Any], body: bytes, repeat: int) -> Dict[str, Any]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        parse(body)
+        best = min(best, perf_counter() - start)
+
+    tracemalloc.start()
+    kept = parse(body)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    return {
+        "best_ms": round(best * 1000, 3),
+        "peak_mib": round(peak / 2**20, 2),
+        "retained_mib": round(current / 2**20, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", type=int, default=5)
+    parser.add_argument("--members", type=int, default=4)
+    parser.add_argument("--backpacks", type=int, default=18)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response = make_profiles_response(UUID, args.profiles, args.members, args.backpacks)
+    body = json.dumps(response, indent=2).encode()
+    del response
+
+    full = measure(json.loads, body, args.repeat)
+    streaming = measure(lambda b: parse_profiles(b, UUID), body, args.repeat)
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "profiles_parse",
+                "profiles": args.profiles,
+                "members": args.members,
+                "body_mib": round(len(body) / 2**20, 2),
+                "full": full,
+                "streaming": streaming,
+                "peak_ratio": round(full["peak_mib"] / streaming["peak_mib"], 2),
+                "speedup": round(full["best_ms"] / streaming["best_ms"], 2),
+            },
+            indent=3,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
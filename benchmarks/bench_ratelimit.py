@@ -0,0 +1,70 @@
+"""
+Benchmark the per-key RateLimiter against a fake server with a fixed quota.
+
+Runs the same burst of keyed requests through a Client with and without
+rate limiting and reports throughput, 429s and how much of the quota was
+used. Results are printed as JSON.
+
+    python -m benchmarks.bench_ratelimit --requests 400 --limit 100 --window 2
+"""
+
+import argparse
+import json
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Dict
+
+from hyparse import Client
+
+from .fake_server import FakeHypixelServer
+
+
+def run(
+    requests: int, threads: int, limit: int, window: float, rate_limit: bool
+) -> Dict[str, Any]:
+    with FakeHypixelServer(limit=limit, window=window) as server:
+        client = Client(pool_size=threads, rate_limit=rate_limit, throttle_retries=10)
+        url = f"{server.url}/v2/skyblock/profiles"
+
+        def call(_: int) -> int:
+            response = client.get(url, headers={"API-Key": "benchmark"})
+            return response.status_code
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            statuses = list(pool.map(call, range(requests)))
+        elapsed = perf_counter() - start
+        client.close()
+
+    ok = statuses.count(200)
+    # The best any scheduler can do is `limit` requests per started window
+    windows = max(int(elapsed // window) + 1, 1)
+    return {
+        "rate_limit": rate_limit,
+        "requests": requests,
+        "succeeded": ok,
+        "failed": requests - ok,
+        "server_429s": server.throttled,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(ok / elapsed, 2),
+        "quota_utilization": round(ok / (windows * limit), 4),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--window", type=float, default=2.0)
+    args = parser.parse_args()
+
+    results = [
+        run(args.requests, args.threads, args.limit, args.window, rate_limit)
+        for rate_limit in (False, True)
+    ]
+    print(json.dumps({"benchmark": "ratelimit", "results": results}, indent=3))
+
+
+if __name__ == "__main__":
+    main()
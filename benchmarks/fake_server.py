@@ -0,0 +1,105 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, Optional
+
+
+class FakeHypixelServer:
+    """
+    Local stand-in for api.hypixel.net that enforces a fixed quota.
+
+    Every request spends one of `limit` requests in the current `window`
+    seconds and gets the same RateLimit-* headers Hypixel sends. Once the
+    quota is spent the server answers 429 until the window resets.
+    """
+
+    def __init__(
+        self,
+        limit: int = 60,
+        window: float = 1.0,
+        body: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self.limit = limit
+        self.window = window
+        self.served = 0
+        self.throttled = 0
+        self._body = body or (lambda path: {"success": True, "profiles": []})
+        self._lock = Lock()
+        self._window_start = monotonic()
+        self._used = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                status, headers = server._spend()
+                body = (
+                    server._body(self.path)
+                    if status == 200
+                    else {
+                        "success": False,
+                        "cause": "Key throttle",
+                    }
+                )
+                payload = body if isinstance(body, bytes) else dumps(body).encode()
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    def __enter__(self) -> "FakeHypixelServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _spend(self) -> tuple[int, Dict[str, str]]:
+        with self._lock:
+            now = monotonic()
+            if now - self._window_start >= self.window:
+                self._window_start = now
+                self._used = 0
+
+            reset = max(self.window - (now - self._window_start), 0.0)
+            if self._used >= self.limit:
+                self.throttled += 1
+                status = 429
+            else:
+                self._used += 1
+                self.served += 1
+                status = 200
+
+            headers = {
+                "RateLimit-Limit": str(self.limit),
+                "RateLimit-Remaining": str(self.limit - self._used),
+                # Hypixel rounds the reset up to whole seconds
+                "RateLimit-Reset": str(max(round(reset + 0.4999), 0)),
+            }
+            if status == 429:
+                headers["Retry-After"] = headers["RateLimit-Reset"]
+            return status, headers
@@ -0,0 +1,253 @@
+"""Synthetic SkyBlock data for benchmarks."""
+
+from base64 import b64encode
+from gzip import compress
+from io import BytesIO
+from random import Random
+from typing import Any, Dict, List, Optional
+
+from hyparse.skills.Fishing import TROPHY_FISH
+from nbtlib import (
+    Byte,
+    ByteArray,
+    Compound,
+    File,
+    Int,
+    List as NBTList,
+    Long,
+    Short,
+    String,
+)
+
+ITEM_IDS = [
+    "HYPERION",
+    "TERMINATOR",
+    "ASPECT_OF_THE_END",
+    "JUJU_SHORTBOW",
+    "NECRON_HELMET",
+    "ENCHANTED_DIAMOND",
+    "SUPERBOOM_TNT",
+    "SPIRIT_LEAP",
+]
+ENCHANTMENTS = ["sharpness", "critical", "ender_slayer", "giant_killer", "looting"]
+
+
+def make_item(rng: Random, lore_lines: int = 12) -> Compound:
+    """One inventory slot shaped like the items Hypixel returns."""
+    item_id = rng.choice(ITEM_IDS)
+    extra = Compound(
+        {
+            "id": String(item_id),
+            "uuid": String(
+                f"{rng.getrandbits(32):08x}-{rng.getrandbits(16):04x}-4"
+                f"{rng.getrandbits(12):03x}-8{rng.getrandbits(12):03x}-"
+                f"{rng.getrandbits(48):012x}"
+            ),
+            "timestamp": Long(rng.getrandbits(40)),
+            "modifier": String("heroic"),
+            "hot_potato_count": Int(rng.randint(0, 15)),
+            "enchantments": Compound(
+                {name: Int(rng.randint(1, 7)) for name in rng.sample(ENCHANTMENTS, 3)}
+            ),
+        }
+    )
+    if rng.random() < 0.1:
+        extra["new_year_cake_bag_data"] = ByteArray(
+            [rng.randint(-128, 127) for _ in range(64)]
+        )
+
+    return Compound(
+        {
+            "id": Short(rng.randint(1, 400)),
+            "Count": Byte(rng.randint(1, 64)),
+            "Damage": Short(0),
+            "tag": Compound(
+                {
+                    "Unbreakable": Byte(1),
+                    "HideFlags": Int(254),
+                    "display": Compound(
+                        {
+                            "Name": String(f"§6Heroic {item_id.title()} §d✪✪✪✪✪"),
+                            "Lore": NBTList[String](
+                                String(
+                                    f"§7Damage: §c+{rng.randint(100, 900)} §8line {i}"
+                                )
+                                for i in range(lore_lines)
+                            ),
+                        }
+                    ),
+                    "ExtraAttributes": extra,
+                }
+            ),
+        }
+    )
+
+
+def encode_items(items: List[Compound]) -> str:
+    """Encode items the way inventory blobs are stored: NBT → gzip → base64."""
+    root = File({"i": NBTList[Compound](items)})
+    buffer = BytesIO()
+    root.write(buffer)
+    return b64encode(compress(buffer.getvalue())).decode()
+
+
+def make_inventory_blob(
+    slots: int,
+    fill: float = 0.8,
+    lore_lines: int = 12,
+    seed: Optional[int] = 0,
+) -> str:
+    """A base64 blob with `slots` slots, `fill` of them holding an item."""
+    rng = Random(seed)
+    items = [
+        make_item(rng, lore_lines) if rng.random() < fill else Compound()
+        for _ in range(slots)
+    ]
+    return encode_items(items)
+
+
+# Section name → slot count for the blobs found in a member's "inventory"
+SECTION_SLOTS: Dict[str, int] = {
+    "inv_contents": 36,
+    "ender_chest_contents": 9 * 45,
+    "inv_armor": 4,
+    "equipment_contents": 4,
+    "personal_vault_contents": 27,
+    "wardrobe_contents": 9 * 36,
+}
+
+
+def make_inventory(
+    backpacks: int = 18,
+    backpack_slots: int = 45,
+    scale: float = 1.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """A member["inventory"] section with every blob Inventory knows about."""
+    inventory: Dict[str, Any] = {}
+    for offset, (section, slots) in enumerate(SECTION_SLOTS.items()):
+        blob = make_inventory_blob(max(int(slots * scale), 1), seed=seed + offset)
+        inventory[section] = {"type": 0, "data": blob}
+
+    inventory["bag_contents"] = {
+        bag: {"type": 0, "data": make_inventory_blob(45, fill=0.5, seed=seed + i)}
+        for i, bag in enumerate(
+            ["talisman_bag", "potion_bag", "fishing_bag", "sacks_bag", "quiver"]
+        )
+    }
+    inventory["backpack_contents"] = {
+        str(index): {
+            "type": 0,
+            "data": make_inventory_blob(
+                max(int(backpack_slots * scale), 1), seed=seed + 100 + index
+            ),
+        }
+        for index in range(backpacks)
+    }
+    return inventory
+
+
+SKILLS = ["MINING", "FARMING", "COMBAT", "FISHING", "FORAGING", "ENCHANTING"]
+
+
+def make_catacombs(rng: Random, floors: int = 8) -> Dict[str, Any]:
+    """A dungeon_types.<catacombs> entry with per floor stats."""
+    catacombs: Dict[str, Any] = {"experience": rng.uniform(0, 600_000_000)}
+    for stat, low, high in [
+        ("tier_completions", 1, 2000),
+        ("fastest_time", 180_000, 900_000),
+        ("fastest_time_s", 180_000, 900_000),
+        ("fastest_time_s_plus", 180_000, 900_000),
+        ("best_score", 100, 317),
+    ]:
+        catacombs[stat] = {
+            str(floor): rng.randint(low, high) for floor in range(floors)
+        }
+    return catacombs
+
+
+def make_player_stats(
+    rng: Random, trophy_fish_kinds: int = len(TROPHY_FISH)
+) -> Dict[str, Any]:
+    """The parts of a member that skill levels, Dungeons and Fishing read."""
+    trophy_fish: Dict[str, Any] = {}
+    for fish in TROPHY_FISH[:trophy_fish_kinds]:
+        for suffix in ["", "_bronze", "_silver", "_gold", "_diamond"]:
+            if rng.random() < 0.7:
+                trophy_fish[fish + suffix] = rng.randint(1, 500)
+    trophy_fish.update(
+        {"rewards": [1, 2, 3], "total_caught": sum(trophy_fish.values())}
+    )
+
+    return {
+        "player_data": {
+            "experience": {
+                f"SKILL_{skill}": rng.uniform(0, 120_000_000) for skill in SKILLS
+            }
+        },
+        "dungeons": {
+            "dungeon_types": {
+                "catacombs": make_catacombs(rng),
+                "master_catacombs": make_catacombs(rng),
+            }
+        },
+        "trophy_fish": trophy_fish,
+    }
+
+
+def make_member(
+    rng: Random,
+    backpacks: int = 18,
+    scale: float = 1.0,
+    trophy_fish_kinds: int = len(TROPHY_FISH),
+) -> Dict[str, Any]:
+    """One profile member: skills, collections, stats and a full inventory."""
+    return {
+        **make_player_stats(rng, trophy_fish_kinds),
+        "collection": {
+            f"{item}_{tier}": rng.randint(0, 10**7)
+            for item in ITEM_IDS
+            for tier in range(40)
+        },
+        "player_stats": {
+            f"kills_{mob}_{level}": rng.randint(0, 5000)
+            for mob in ENCHANTMENTS
+            for level in range(200)
+        },
+        "inventory": make_inventory(backpacks, scale=scale, seed=rng.randint(0, 1000)),
+    }
+
+
+def make_profiles_response(
+    uuid: str,
+    profiles: int = 3,
+    members: int = 4,
+    backpacks: int = 18,
+    scale: float = 1.0,
+    trophy_fish_kinds: int = len(TROPHY_FISH),
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    A /v2/skyblock/profiles response where uuid is a member of every
+    profile, next to members - 1 coop members. The last profile is selected.
+    scale multiplies the slot count of every inventory blob.
+    """
+    rng = Random(seed)
+    response_profiles = []
+    for index in range(profiles):
+        member_ids = [uuid] + [
+            f"{rng.getrandbits(128):032x}" for _ in range(members - 1)
+        ]
+        response_profiles.append(
+            {
+                "profile_id": f"{rng.getrandbits(128):032x}",
+                "members": {
+                    member_id: make_member(rng, backpacks, scale, trophy_fish_kinds)
+                    for member_id in member_ids
+                },
+                "banking": {"balance": rng.uniform(0, 10**9), "transactions": []},
+                "cute_name": ["Apple", "Banana", "Kiwi", "Mango", "Pear"][index % 5],
+                "selected": index == profiles - 1,
+            }
+        )
+    return {"success": True, "profiles": response_profiles}
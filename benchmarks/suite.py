@@ -0,0 +1,259 @@
+"""
+Microbenchmark suite over synthetic profiles.
+
+Times Player construction (HTTP mocked out, in full and streaming parse
+mode), skill_levels, Dungeons.cata_level, Catacombs.format_data,
+Fishing.trophies, lazy vs eager Inventory loads and a report that reuses
+a Player's memoized views on generated profiles of
+a configurable size. Prints one JSON document with the environment and
+per-call timings. Pass --output to keep it, and --compare with an earlier
+document to see the ratio per benchmark between releases.
+
+    python -m benchmarks.suite --profiles 3 --members 4 --output before.json
+    python -m benchmarks.suite --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+from unittest.mock import patch
+
+import requests
+
+from hyparse import Client, Member, Player
+from hyparse.cache import set_nbt_cache
+from hyparse.player import Inventory
+
+from .generators import make_profiles_response
+
+UUID = "0959dfbde98d4b348271ad0c5728f4fe"
+API_KEY = "BENCHMARK"
+
+# name → setup(profiles_response, body) returning the function to time
+Timed = Callable[[], Any]
+Setup = Callable[[Dict[str, Any], bytes], Timed]
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(setup: Setup) -> Setup:
+    """Register setup as the benchmark named after it"""
+    BENCHMARKS[setup.__name__] = setup
+    return setup
+
+
+def _response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response._content_consumed = True
+    response.encoding = "utf-8"
+    return response
+
+
+def _player(body: bytes, **kwargs: Any) -> Player:
+    with patch.object(Client, "get", lambda *_, **__: _response(body)):
+        return Player(API_KEY, uuid=UUID, client=_CLIENT, **kwargs)
+
+
+def _member(response: Dict[str, Any]) -> Dict[str, Any]:
+    selected = next(p for p in response["profiles"] if p["selected"])
+    return selected["members"][UUID]
+
+
+_CLIENT = Client(rate_limit=False)
+
+
+@benchmark
+def player_construct(response: Dict[str, Any], body: bytes) -> Timed:
+    return lambda: _player(body)
+
+
+@benchmark
+def player_construct_streaming(response: Dict[str, Any], body: bytes) -> Timed:
+    return lambda: _player(body, streaming=True)
+
+
+# Views are memoized per Member, so each call starts from a fresh one
+
+
+@benchmark
+def skill_levels(response: Dict[str, Any], body: bytes) -> Timed:
+    member = _member(response)
+    return lambda: Member(UUID, member).skill_levels
+
+
+@benchmark
+def cata_level(response: Dict[str, Any], body: bytes) -> Timed:
+    member = _member(response)
+    return lambda: Member(UUID, member).dungeons.cata_level
+
+
+@benchmark
+def catacombs_format_data(response: Dict[str, Any], body: bytes) -> Timed:
+    member = _member(response)
+    return lambda: Member(UUID, member).dungeons.catacombs.format_data()
+
+
+@benchmark
+def fishing_trophies(response: Dict[str, Any], body: bytes) -> Timed:
+    member = _member(response)
+    return lambda: Member(UUID, member).fishing.trophies
+
+
+@benchmark
+def inventory_lazy_one_section(response: Dict[str, Any], body: bytes) -> Timed:
+    member = _member(response)
+    return lambda: Inventory(member, lazy_load=True).player_inventory
+
+
+@benchmark
+def inventory_lazy_all(response: Dict[str, Any], body: bytes) -> Timed:
+    member = _member(response)
+
+    def load() -> Any:
+        inventory = Inventory(member, lazy_load=True)
+        return [inventory[key] for key in inventory]
+
+    return load
+
+
+@benchmark
+def inventory_eager(response: Dict[str, Any], body: bytes) -> Timed:
+    member = _member(response)
+    return lambda: Inventory(member, lazy_load=False)
+
+
+@benchmark
+def report_memoized(response: Dict[str, Any], body: bytes) -> Timed:
+    """A report touching every view 20 times on the same Player"""
+    player = _player(body)
+
+    def report() -> None:
+        for _ in range(20):
+            player.skill_levels
+            player.dungeons.cata_level
+            player.dungeons.catacombs.format_data()
+            player.fishing.trophies
+            player.inventory().count("HYPERION")
+
+    return report
+
+
+def measure(function: Callable[[], Any], repeat: int, min_time: float) -> Dict:
+    """Per-call timings over repeat rounds, each running for at least min_time"""
+    function()
+
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            function()
+        if perf_counter() - start >= min_time:
+            break
+        number *= 2
+
+    rounds: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            function()
+        rounds.append((perf_counter() - start) / number)
+
+    return {
+        "calls": number * repeat,
+        "best_us": round(min(rounds) * 1e6, 2),
+        "median_us": round(statistics.median(rounds) * 1e6, 2),
+        "stdev_us": round(statistics.pstdev(rounds) * 1e6, 2),
+    }
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        hyparse_version = version("hyparse")
+    except PackageNotFoundError:
+        hyparse_version = None
+
+    return {
+        "hyparse": hyparse_version,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, float]:
+    """best time of each benchmark in results relative to baseline (< 1 is faster)"""
+    before = baseline.get("results", {})
+    return {
+        name: round(timing["best_us"] / before[name]["best_us"], 3)
+        for name, timing in results.items()
+        if name in before and before[name]["best_us"]
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", type=int, default=3)
+    parser.add_argument("--members", type=int, default=4)
+    parser.add_argument("--backpacks", type=int, default=18)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplies inventory blob sizes"
+    )
+    parser.add_argument("--trophy-fish", type=int, default=18)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS))
+    parser.add_argument("--output", help="also write the results to this file")
+    parser.add_argument("--compare", help="results file of an earlier run")
+    args = parser.parse_args(argv)
+
+    config = {
+        "profiles": args.profiles,
+        "members": args.members,
+        "backpacks": args.backpacks,
+        "scale": args.scale,
+        "trophy_fish_kinds": args.trophy_fish,
+        "seed": args.seed,
+    }
+    response = make_profiles_response(UUID, **config)
+    body = json.dumps(response).encode()
+
+    # Decoded blobs would otherwise be served from the shared NBT cache
+    previous_cache = set_nbt_cache(None)
+    try:
+        results = {
+            name: measure(setup(response, body), args.repeat, args.min_time)
+            for name, setup in BENCHMARKS.items()
+            if not args.only or name in args.only
+        }
+    finally:
+        set_nbt_cache(previous_cache)
+
+    document: Dict[str, Any] = {
+        "benchmark": "suite",
+        "environment": environment(),
+        "config": {**config, "body_bytes": len(body)},
+        "results": results,
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            document["relative_to_baseline"] = compare(results, json.load(f))
+
+    output = json.dumps(document, indent=3)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import asyncio
+import re
+from contextvars import copy_context
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from .Player import Player, SelectedProfile
+from .client.RateLimiter import Priority
+
+if TYPE_CHECKING:
+    from .client import Client
+
+# Minecraft usernames are 3-16 chars of [A-Za-z0-9_], so a 32 hex digit string
+# (optionally dashed) can only ever be a uuid.
+_UUID_PATTERN = re.compile(
+    r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$"
+)
+
+
+def _is_uuid(identifier: str) -> bool:
+    return _UUID_PATTERN.match(identifier) is not None
+
+
+class AsyncPlayer:
+    """
+    Asyncio front-end for Player.
+
+    The blocking HTTP calls made by Player are run on an executor so many
+    players can be fetched concurrently from a single event loop. The objects
+    returned are regular Player instances.
+
+    Coroutines creating the same Player at the same time share one fetch
+    (see Client.coalesce) and wait for it without holding an executor
+    thread each; every caller still gets a Player of its own.
+    """
+
+    @classmethod
+    async def create(
+        cls,
+        API_KEY: str,
+        player_name: Optional[str] = None,
+        uuid: Optional[str] = None,
+        selected_profile: Optional[SelectedProfile] = None,
+        *,
+        client: Optional["Client"] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        streaming: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> Player:
+        if client is None:
+            from .client.Client import get_default_client
+
+            client = get_default_client()
+
+        # Run in a copy of this context so an active Tracer sees the stages
+        build = partial(
+            copy_context().run,
+            Player,
+            API_KEY,
+            player_name=player_name,
+            uuid=uuid,
+            selected_profile=selected_profile,
+            client=client,
+            priority=priority,
+            streaming=streaming,
+        )
+        identifier = player_name.lower() if player_name else uuid
+        key = ("player", API_KEY, identifier, selected_profile, streaming)
+        player = await client.coalesce_async(key, build, executor)
+        return player._share(priority)
+
+
+async def fetch_players(
+    API_KEY: str,
+    players: Iterable[str],
+    concurrency: int = 8,
+    selected_profile: Optional[SelectedProfile] = None,
+    *,
+    client: Optional["Client"] = None,
+    priority: Priority = Priority.BACKGROUND,
+    return_exceptions: bool = False,
+    streaming: bool = False,
+) -> List[Player | BaseException]:
+    """
+    Fetch many players concurrently, keeping at most `concurrency` requests in flight.
+
+    Each entry of `players` may be either a player name or a uuid. Results are
+    returned in the same order as `players`. With `return_exceptions=True` a
+    failed lookup is returned in place of its Player instead of being raised.
+    Give a `client` whose pool_size is at least `concurrency` so every worker
+    keeps its connection alive. Bulk lookups are queued behind interactive
+    ones for the same API key unless a different `priority` is given.
+    `streaming=True` keeps only the selected profile of each player in memory.
+    """
+    if concurrency < 1:
+        raise ValueError("'concurrency' must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch(identifier: str, executor: Executor) -> Player:
+        if _is_uuid(identifier):
+            kwargs = {"uuid": identifier.replace("-", "")}
+        else:
+            kwargs = {"player_name": identifier}
+
+        async with semaphore:
+            return await AsyncPlayer.create(
+                API_KEY,
+                selected_profile=selected_profile,
+                client=client,
+                priority=priority,
+                streaming=streaming,
+                executor=executor,
+                **kwargs,
+            )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return await asyncio.gather(
+            *(_fetch(identifier, executor) for identifier in players),
+            return_exceptions=return_exceptions,
+        )
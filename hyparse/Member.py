@@ -0,0 +1,171 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .levels import SkillLevel, getSkillLevel
+from .tracing import stage
+
+if TYPE_CHECKING:
+    from .player import Inventory
+    from .skills import Dungeons, Fishing
+
+# view → top-level keys of the member data it is derived from
+VIEW_SOURCES: Dict[str, Tuple[str, ...]] = {
+    "skill_levels": ("player_data",),
+    "dungeons": ("dungeons",),
+    "fishing": ("trophy_fish",),
+    "inventory": ("inventory",),
+}
+
+
+class Member:
+    """
+    One member of a SkyBlock profile, built from the data that was already
+    fetched for it. Player is a Member too, for the player it was created for.
+
+    Views share the member's data, nothing is copied or requested. They
+    are built once and memoized along with what they compute, until the
+    data they come from changes (see invalidate()) or drop_caches() is called.
+    Memoized results are shared, so treat them as read-only.
+
+    shared=True is for data other objects use too, such as the profiles of
+    Players whose requests were coalesced: the first member[key] = value
+    then copies the top level of the data, so the write is only seen here.
+    Nested objects stay shared, replace them rather than change them in
+    place.
+    """
+
+    def __init__(
+        self, uuid: str, skyblock_data: Dict[str, Any], *, shared: bool = False
+    ) -> None:
+        self.uuid = uuid
+        self._data = skyblock_data
+        self._shared = shared
+        self._views: Dict[Tuple[str, Any], Any] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} uuid={self.uuid}>"
+
+    def __getitem__(self, key) -> Dict[str, Any]:
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        if self._shared:
+            self._unshare()
+        self._data[key] = value
+        self._forget((key,))
+
+    def __contains__(self, key: str | int):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data.keys())
+
+    @property
+    def skill_levels(self) -> Dict[str, Dict[str, int | float]]:
+        """Converts raw exp into skyblock level"""
+        return self.get_skill_levels()
+
+    def get_skill_levels(
+        self, compact: bool = False
+    ) -> Dict[str, Dict[str, int | float] | SkillLevel]:
+        """Converts raw exp into skyblock levels, as SkillLevel tuples if compact"""
+        return self._view("skill_levels", compact, lambda: self._skill_levels(compact))
+
+    def _skill_levels(
+        self, compact: bool
+    ) -> Dict[str, Dict[str, int | float] | SkillLevel]:
+        player_experience: Dict[str, Dict[str, int | float]] = self._data["player_data"]
+        experiences: Dict[str, int | float] | None = player_experience.get("experience")
+
+        # User doesn't have any skill unlocked
+        if experiences is None:
+            return {}
+
+        skill_levels = {}
+
+        with stage("levels", "skills"):
+            for skill_name, skill_exp in experiences.items():
+                skill_level = getSkillLevel(
+                    initial_exp=skill_exp, compact=compact, skill=skill_name
+                )
+                skill_levels[skill_name] = skill_level
+
+        return skill_levels
+
+    @property
+    def skyblock_data(self) -> Dict[str, Any]:
+        return self._data
+
+    @property
+    def dungeons(self) -> "Dungeons":
+        return self._view("dungeons", None, self._new_dungeons)
+
+    @property
+    def fishing(self) -> "Fishing":
+        return self._view("fishing", None, self._new_fishing)
+
+    def inventory(self, *, lazy_load: bool = True) -> "Inventory":
+        return self._view(
+            "inventory", lazy_load, lambda: self._new_inventory(lazy_load)
+        )
+
+    def _new_dungeons(self) -> "Dungeons":
+        from .skills.Dungeons.Dungeons import Dungeons
+
+        return Dungeons(self._data)
+
+    def _new_fishing(self) -> "Fishing":
+        from .skills.Fishing.Fishing import Fishing
+
+        return Fishing(self._data)
+
+    def _new_inventory(self, lazy_load: bool) -> "Inventory":
+        from .player.Inventory.Inventory import Inventory
+
+        return Inventory(self._data, lazy_load)
+
+    def _view(self, name: str, variant: Any, build: Callable[[], Any]) -> Any:
+        """The memoized view name (one per variant), built on first use"""
+        view = self._views.get((name, variant))
+        if view is None:
+            view = self._views[(name, variant)] = build()
+        return view
+
+    def _unshare(self) -> None:
+        """Copy on write: take a copy of the shared data of our own"""
+        self._data = dict(self._data)
+        self._shared = False
+        self._rebind_views()
+
+    def _rebind_views(self) -> None:
+        """Point the memoized views that hold the member data at the current copy"""
+        for (name, _), view in self._views.items():
+            if name in ("dungeons", "fishing"):
+                view.rebind(self._data)
+
+    def _forget(self, keys: Optional[Iterable[str]], inventories: str = "update"):
+        """
+        Drop the views derived from keys of the data, every view for None.
+        Inventories are dropped too, updated in place from the current data
+        so unchanged sections stay decoded, or kept as they are, depending
+        on inventories ("drop", "update" or "keep").
+        """
+        keys = None if keys is None else set(keys)
+        for (name, variant), view in list(self._views.items()):
+            if keys is not None and keys.isdisjoint(VIEW_SOURCES[name]):
+                continue
+            if name != "inventory" or inventories == "drop":
+                del self._views[(name, variant)]
+            elif inventories == "update":
+                view.update(self._data)
+
+    def invalidate(self, *keys: str) -> None:
+        """
+        Forget what was derived from these top-level keys of the member
+        data, or from all of it without keys. Needed after changing the data
+        in place; member[key] = value invalidates key by itself.
+        """
+        self._forget(keys or None, inventories="drop")
+
+    def drop_caches(self) -> None:
+        """Drop every memoized view and result, decoded inventories included"""
+        self._views.clear()
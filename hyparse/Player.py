@@ -1,13 +1,20 @@
-import requests
-from typing import Any, Dict, Optional, Literal, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Literal, Tuple
 from logging import getLogger
-from json import dumps
-from numerize.numerize import numerize
+from os import PathLike
+from os.path import isdir
+from weakref import ref
+from json import dumps, loads
 
+from .client.RateLimiter import Priority
 from .exceptions import HypixelSuccessError, ExpiredAPIKey, UserNotFound
-from .levels import getSkillLevel
-from .skills import Dungeons, Fishing
-from .player import Inventory
+from .Member import Member
+from .ProfileDiff import Fingerprints, ProfileDiff, diff_members, section_fingerprints
+from .ProfileParser import CHUNK_SIZE, Buffer, parse_profiles
+from .tracing import stage
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .player import Inventory
 
 logger = getLogger(__name__)
 
@@ -36,8 +43,9 @@ SelectedProfile = Literal[
 ]
 
 
-class Player:
+class Player(Member):
     _base_url = "https://api.hypixel.net/v2/skyblock"
+    _mojang_url = "https://api.mojang.com/users/profiles/minecraft"
 
     def __init__(
         self,
@@ -45,34 +53,114 @@ class Player:
         player_name: Optional[str] = None,
         uuid: Optional[str] = None,
         selected_profile: Optional[SelectedProfile] = None,
+        *,
+        client: Optional["Client"] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        streaming: bool = False,
     ) -> None:
-        self._auth_header = {"API-Key": API_KEY}
+        self._setup(API_KEY, client, priority, streaming)
         self.uuid = self._resolve_uuid(player_name, uuid)
         self.selected_profile = selected_profile
 
-        self.profiles = self._fetch_profiles()
-        self.profile_id, self.profile_index = self._get_profile_id_and_index(
-            self.profiles
-        )
-
-        self._data: Dict[str, Any] = self.profiles[self.profile_index]["members"][
-            self.uuid
-        ]
+        self._load_profiles(self._fetch_profiles())
 
-    def __str__(self) -> str:
-        return dumps(self.profiles, indent=3)
+    def _setup(
+        self,
+        API_KEY: Optional[str],
+        client: Optional["Client"],
+        priority: Priority,
+        streaming: bool,
+    ) -> None:
+        self._auth_header = {"API-Key": API_KEY} if API_KEY else {}
+        if client is None:
+            from .client.Client import get_default_client
+
+            client = get_default_client()
+        self._client = client
+        self._priority = priority
+        self._streaming = streaming
+
+        # Memoized views, see Member
+        self._views: Dict[Tuple[str, Any], Any] = {}
+        # Kept for refresh(): fingerprints of the data last diffed, and the
+        # inventories handed out so they can be updated in place
+        self._fingerprints: Optional[Fingerprints] = None
+        self._inventories: List[ref[Inventory]] = []
+
+    @classmethod
+    def from_response(
+        cls,
+        response: Dict[str, Any] | str | Buffer,
+        uuid: str,
+        selected_profile: Optional[SelectedProfile] = None,
+        *,
+        API_KEY: Optional[str] = None,
+        client: Optional["Client"] = None,
+        streaming: bool = False,
+    ) -> "Player":
+        """
+        Build a Player from a /v2/skyblock/profiles response that was already
+        fetched, without making any requests. response is the raw body (str,
+        bytes, or any buffer such as a memoryview of an mmap) or its decoded
+        JSON. API_KEY is only needed to refresh() the player later on.
+        """
+        player = cls.__new__(cls)
+        player._setup(API_KEY, client, Priority.INTERACTIVE, streaming)
+        player.uuid = uuid.replace("-", "")
+        player.selected_profile = selected_profile
+
+        data = (
+            response if isinstance(response, dict) else player._parse_profiles(response)
+        )
+        if not data.get("success", False):
+            raise HypixelSuccessError(
+                f"Response was not successful due to {data.get('cause')}"
+            )
 
-    def __getitem__(self, key) -> Dict[str, Any]:
-        return self._data[key]
+        player._load_profiles(data.get("profiles", []))
+        return player
 
-    def __setitem__(self, key, value):
-        self._data[key] = value
+    @classmethod
+    def from_file(
+        cls,
+        path: str | PathLike[str],
+        uuid: str,
+        selected_profile: Optional[SelectedProfile] = None,
+        **kwargs: Any,
+    ) -> "Player":
+        """
+        from_response for a saved response: either a file holding one
+        profiles response, or a snapshot directory (see hyparse.snapshot)
+        holding the response for uuid. Files are memory-mapped, not read.
+        """
+        from .snapshot import Snapshot, read_mapped
+
+        if isdir(path):
+            with Snapshot(path) as snapshot:
+                return snapshot.player(uuid, selected_profile, **kwargs)
+
+        return read_mapped(
+            path,
+            lambda body: cls.from_response(body, uuid, selected_profile, **kwargs),
+        )
 
-    def __contains__(self, key: str | int):
-        return key in self._data
+    def _share(self, priority: Priority) -> "Player":
+        """
+        A Player of its own over the same fetched profiles, for a caller
+        whose request was coalesced with the one that built self. Writes
+        copy the data first, so they aren't seen by the other callers.
+        """
+        player = self.__class__.__new__(self.__class__)
+        player._setup(
+            self._auth_header.get("API-Key"), self._client, priority, self._streaming
+        )
+        player.uuid = self.uuid
+        player.selected_profile = self.selected_profile
+        player._load_profiles(self.profiles)
+        return player
 
-    def __iter__(self):
-        return iter(self._data.keys())
+    def __str__(self) -> str:
+        return dumps(self.profiles, indent=3)
 
     def _resolve_uuid(self, player_name: Optional[str], uuid: Optional[str]) -> str:
         """Ensure exactly one of player_name or uuid is provided, and return a resolved uuid."""
@@ -89,13 +177,86 @@ class Player:
 
         return uuid
 
-    def _fetch_profiles(self) -> list[Dict[str, Any]]:
+    def _load_profiles(self, profiles: list[Dict[str, Any]]) -> None:
+        """Select the requested profile out of an already fetched profiles list"""
+        # Everything is looked up before anything is assigned, so a profile
+        # gone from profiles leaves the player as it was
+        profile_id, profile_index = self._get_profile_id_and_index(profiles)
+        data: Dict[str, Any] = profiles[profile_index]["members"][self.uuid]
+
+        self.profiles = profiles
+        self.profile_id, self.profile_index = profile_id, profile_index
+        self._data = data
+        # The profiles may be shared with Players whose requests were
+        # coalesced with this one, so the first write copies (see Member)
+        self._shared = True
+
+    def _unshare(self) -> None:
+        super()._unshare()
+        # Copy the path down to the member too, so profiles has the write
+        profiles = list(self.profiles)
+        profile = profiles[self.profile_index] = dict(profiles[self.profile_index])
+        profile["members"] = {**profile["members"], self.uuid: self._data}
+        self.profiles = profiles
+
+    def _fetch_profiles(self, use_cache: bool = True) -> list[Dict[str, Any]]:
+        with stage("fetch_profiles") as span:
+            cache = self._client.cache
+            if cache is not None and use_cache:
+                cached = cache.get("profiles", self.uuid)
+                if cached is not None:
+                    span.cache_hit = True
+                    span.bytes = len(cached)
+                    return self._parse_profiles(cached).get("profiles", [])
+
+            span.cache_hit = False
+            # Streaming keeps only part of the response, so it's its own request
+            key = (
+                "profiles",
+                self._auth_header.get("API-Key"),
+                self.uuid,
+                self.selected_profile if self._streaming else None,
+                self._streaming,
+            )
+            data = self._client.coalesce(key, lambda: self._request_profiles(span))
+            return data.get("profiles", [])
+
+    def _request_profiles(self, span: Any) -> Dict[str, Any]:
+        """GET the profiles response, shared by every coalesced caller"""
         url = f"{self._base_url}/profiles"
-        response = requests.get(
-            url, headers=self._auth_header, params={"uuid": self.uuid}
+        cache = self._client.cache
+        response = self._client.get(
+            url,
+            headers=self._auth_header,
+            params={"uuid": self.uuid},
+            priority=self._priority,
+            stream=self._streaming,
         )
 
-        data = response.json()
+        with response:
+            if self._streaming:
+                # Parsed as it arrives, the body is only kept for the cache
+                received: List[bytes] = []
+                size = [0]
+
+                def chunks() -> Iterator[bytes]:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        size[0] += len(chunk)
+                        if cache is not None:
+                            received.append(chunk)
+                        yield chunk
+
+                with stage("decode_profiles") as decode:
+                    data = parse_profiles(chunks(), self.uuid, self.selected_profile)
+                    span.bytes = decode.bytes = size[0]
+                content = b"".join(received)
+            else:
+                content = response.content
+                span.bytes = len(content)
+                with stage("decode_profiles") as decode:
+                    decode.bytes = span.bytes
+                    data = response.json()
+
         if not data.get("success", False):
             if response.status_code == 403:
                 raise ExpiredAPIKey("API Key is either expired or invalid")
@@ -103,7 +264,23 @@ class Player:
                 f"Response was not successful due to {data.get('cause')}"
             )
 
-        return data.get("profiles", [])
+        if cache is not None:
+            cache.set("profiles", self.uuid, content)
+
+        return data
+
+    def _parse_profiles(self, body: str | Buffer) -> Dict[str, Any]:
+        """
+        Decode a profiles response. In streaming mode only the selected
+        profile is kept in full, and without the other coop members.
+        """
+        with stage("decode_profiles") as span:
+            span.bytes = len(body)
+            if self._streaming:
+                return parse_profiles(body, self.uuid, self.selected_profile)
+            if isinstance(body, (str, bytes, bytearray)):
+                return loads(body)
+            return loads(str(body, "utf-8"))
 
     def _get_profile_id_and_index(
         self, profiles: list[Dict[str, Any]]
@@ -125,16 +302,107 @@ class Player:
         raise ValueError("No matching profile found.")
 
     def _minecraft_uuid(self, playername: str):
-        response = requests.get(
-            "https://api.mojang.com/users/profiles/minecraft/" + playername
-        )
+        with stage("minecraft_uuid", playername) as span:
+            span.cache_hit = True
+            known = self._client.name_index.get_uuid(playername)
+            if known is not None:
+                return known
+
+            # Names are case-insensitive on Mojang's side
+            cache = self._client.cache
+            if cache is not None:
+                cached = cache.get("uuid", playername.lower())
+                if cached is not None:
+                    return cached.decode()
+
+            span.cache_hit = False
+            return self._client.coalesce(
+                ("uuid", playername.lower()),
+                lambda: self._request_uuid(playername, span),
+            )
+
+    def _request_uuid(self, playername: str, span: Any) -> Optional[str]:
+        """Ask Mojang for the uuid of playername, shared by every coalesced caller"""
+        response = self._client.get(f"{self._mojang_url}/{playername}")
+        span.bytes = len(response.content)
 
         if response.status_code == 200:
-            return response.json().get("id")
+            data = response.json()
+            uuid = data.get("id")
+            if uuid:
+                self._client.name_index.add(data.get("name") or playername, uuid)
+                cache = self._client.cache
+                if cache is not None:
+                    cache.set("uuid", playername.lower(), uuid.encode())
+            return uuid
 
         else:
             raise UserNotFound("Minecraft user was not found")
 
+    def refresh(self) -> ProfileDiff:
+        """
+        Fetch the profiles again, skipping the response cache, and report
+        what changed for this player.
+
+        Every subtree of the member, and every raw inventory blob, is compared
+        by its hash, so nothing is decoded to find out what changed.
+        Inventories returned by inventory() are updated in place and keep
+        every section that didn't change. Other memoized views are only
+        dropped if the data they are derived from changed.
+        """
+        before = self._data
+        before_fingerprints = self._fingerprints or section_fingerprints(before)
+        profile_id = self.profile_id
+
+        self._load_profiles(self._fetch_profiles(use_cache=False))
+        self._fingerprints = section_fingerprints(self._data)
+
+        diff = diff_members(
+            before,
+            self._data,
+            before_fingerprints,
+            self._fingerprints,
+            profile_changed=self.profile_id != profile_id,
+        )
+
+        alive = []
+        for reference in self._inventories:
+            inventory = reference()
+            if inventory is not None:
+                inventory.update(self._data)
+                alive.append(reference)
+        self._inventories = alive
+
+        changed = {section.split("/")[0] for section in diff.sections_changed}
+        self._forget(None if diff.profile_changed else changed, inventories="keep")
+        # Views that are kept read sections that didn't change, move them onto
+        # the new copy so nothing keeps the old one alive
+        self._rebind_views()
+
+        return diff
+
+    def inventory(self, *, lazy_load: bool = True) -> "Inventory":
+        known = self._views.get(("inventory", lazy_load))
+        if known is not None:
+            return known
+
+        inventory = super().inventory(lazy_load=lazy_load)
+        self._inventories.append(ref(inventory))
+        return inventory
+
+    def coop_members(self) -> Dict[str, Member]:
+        """
+        A view of every member of the selected profile, this player included,
+        keyed by uuid. Built from the profile that was already fetched, so no
+        extra requests are made. With streaming=True the other members were
+        never kept and only this player is returned.
+        """
+        members: Dict[str, Any] = self.profiles[self.profile_index]["members"]
+        return {
+            uuid: self if uuid == self.uuid else Member(uuid, data, shared=True)
+            for uuid, data in members.items()
+        }
+
     @property
     def cute_name(self) -> str:
         if self.selected_profile:
@@ -144,40 +412,6 @@ class Player:
         cute_name = self.profiles[self.profile_index]["cute_name"]
         return cute_name
 
-    @property
-    def skill_levels(self) -> Dict[str, Dict[str, int | float]]:
-        """Converts raw exp into skyblock level"""
-
-        player_experience: Dict[str, Dict[str, int | float]] = self._data["player_data"]
-        experiences: Dict[str, int | float] | None = player_experience.get("experience")
-
-        # User doesn't have any skill unlocked
-        if experiences is None:
-            return {}
-
-        skill_levels = {}
-
-        for skill_name, skill_exp in experiences.items():
-            skill_level = getSkillLevel(initial_exp=skill_exp)
-            skill_levels[skill_name] = skill_level
-
-        return skill_levels
-
-    @property
-    def skyblock_data(self) -> Dict[str, Any]:
-        return self._data
-
-    @property
-    def dungeons(self) -> Dungeons:
-        return Dungeons(self._data)
-
-    @property
-    def fishing(self) -> Fishing:
-        return Fishing(self._data)
-
-    def inventory(self, *, lazy_load: bool = True) -> Inventory:
-        return Inventory(self._data, lazy_load)
-
     def purse(self, human_readable: bool = True) -> float | str:
         banking: Optional[Dict[str, Any]] = self.profiles[self.profile_index].get(
             "banking"
@@ -191,4 +425,6 @@ class Player:
         if not human_readable:
             return balance
 
+        from numerize.numerize import numerize
+
         return numerize(balance)
@@ -0,0 +1,141 @@
+from hashlib import blake2b
+from json import dumps
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+# Catacombs types whose floor completions are diffed
+DUNGEON_TYPES = ("catacombs", "master_catacombs")
+
+Fingerprints = Dict[str, str]
+
+
+def _digest(data: bytes) -> str:
+    return blake2b(data, digest_size=16).hexdigest()
+
+
+def fingerprint(value: Any) -> str:
+    """Digest of a JSON subtree, equal subtrees always give the same digest"""
+    if isinstance(value, str):
+        return _digest(value.encode())
+    return _digest(dumps(value, sort_keys=True, separators=(",", ":")).encode())
+
+
+def section_fingerprints(skyblock_data: Dict[str, Any]) -> Fingerprints:
+    """
+    Digest of every subtree of a member that is diffed on its own: each
+    top-level key, and each raw NBT blob of the inventory keyed by its
+    Inventory section name (e.g. "inventory/backpack_contents/3").
+    """
+    fingerprints = {
+        key: fingerprint(value)
+        for key, value in skyblock_data.items()
+        if key != "inventory"
+    }
+
+    def walk(node: Dict[str, Any], path: Tuple[str, ...]) -> None:
+        for key, value in node.items():
+            if not isinstance(value, dict):
+                continue
+            data = value.get("data")
+            if isinstance(data, str):
+                fingerprints["/".join(path + (key,))] = fingerprint(data)
+            else:
+                walk(value, path + (key,))
+
+    walk(skyblock_data.get("inventory", {}), ("inventory",))
+    return fingerprints
+
+
+class ProfileDiff(NamedTuple):
+    """What changed in a member between two fetches, see Player.refresh"""
+
+    profile_changed: bool
+    # keys of section_fingerprints that were added, removed or changed
+    sections_changed: Tuple[str, ...]
+    # skill → xp gained (negative if it went down), changed skills only
+    skill_xp: Dict[str, float]
+    # dungeon type → floor → completions since the last fetch
+    completions: Dict[str, Dict[str, int]]
+
+    def __bool__(self) -> bool:
+        return self.profile_changed or bool(self.sections_changed)
+
+    @property
+    def inventory_sections(self) -> List[str]:
+        """Changed Inventory section names, as accepted by Inventory[...]"""
+        prefix = "inventory/"
+        return [
+            section[len(prefix) :]
+            for section in self.sections_changed
+            if section.startswith(prefix)
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "profile_changed": self.profile_changed,
+            "sections_changed": list(self.sections_changed),
+            "skill_xp": self.skill_xp,
+            "completions": self.completions,
+        }
+
+
+def _skill_xp(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, float]:
+    old = before.get("player_data", {}).get("experience") or {}
+    new = after.get("player_data", {}).get("experience") or {}
+    deltas = {}
+    for skill in old.keys() | new.keys():
+        delta = new.get(skill, 0) - old.get(skill, 0)
+        if delta:
+            deltas[skill] = delta
+    return deltas
+
+
+def _completions(
+    before: Dict[str, Any], after: Dict[str, Any]
+) -> Dict[str, Dict[str, int]]:
+    def floors(data: Dict[str, Any], dungeon: str) -> Dict[str, int]:
+        dungeon_types = data.get("dungeons", {}).get("dungeon_types", {})
+        completions = dungeon_types.get(dungeon, {}).get("tier_completions", {})
+        return {
+            str(floor): count
+            for floor, count in completions.items()
+            if floor not in ("total", "best")
+        }
+
+    result = {}
+    for dungeon in DUNGEON_TYPES:
+        old, new = floors(before, dungeon), floors(after, dungeon)
+        gained = {
+            floor: int(count - old.get(floor, 0))
+            for floor, count in new.items()
+            if count > old.get(floor, 0)
+        }
+        if gained:
+            result[dungeon] = gained
+    return result
+
+
+def diff_members(
+    before: Dict[str, Any],
+    after: Dict[str, Any],
+    before_fingerprints: Fingerprints,
+    after_fingerprints: Fingerprints,
+    profile_changed: bool = False,
+) -> ProfileDiff:
+    """
+    Compare two versions of a member's data. Subtrees are compared by
+    fingerprint; skill xp and completions are only looked at when the
+    sections holding them changed.
+    """
+    sections = sorted(
+        key
+        for key in before_fingerprints.keys() | after_fingerprints.keys()
+        if before_fingerprints.get(key) != after_fingerprints.get(key)
+    )
+    changed = set(sections)
+
+    return ProfileDiff(
+        profile_changed,
+        tuple(sections),
+        _skill_xp(before, after) if "player_data" in changed else {},
+        _completions(before, after) if "dungeons" in changed else {},
+    )
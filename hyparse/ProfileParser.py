@@ -0,0 +1,211 @@
+import re
+from codecs import getincrementaldecoder
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+Buffer = bytes | bytearray | memoryview
+
+# Bytes decoded at a time when a whole body is given
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_raw_decode = JSONDecoder().raw_decode
+
+# What is left of a profile that wasn't selected
+STUB_KEYS = ("profile_id", "cute_name", "selected")
+
+
+def _chunks(body: Buffer) -> Iterator[bytes]:
+    with memoryview(body) as view:
+        for start in range(0, len(view), CHUNK_SIZE):
+            yield bytes(view[start : start + CHUNK_SIZE])
+
+
+class _Reader:
+    """
+    Walks the outer structure of a JSON document, one value at a time.
+
+    The document is pulled from chunks of UTF-8 bytes as it is read, and
+    what has been read is dropped, so the text held at once is about the
+    size of the largest value decoded (a single member) rather than the
+    whole body.
+    """
+
+    __slots__ = ("text", "pos", "_chunks", "_decoder")
+
+    def __init__(self, chunks: Iterable[bytes], text: str = "") -> None:
+        self.text = text
+        self.pos = 0
+        self._chunks: Optional[Iterator[bytes]] = iter(chunks)
+        self._decoder = getincrementaldecoder("utf-8")()
+
+    def _more(self) -> bool:
+        """
+        Read on, at least three times as much as is still unread, so a value
+        cut off by the end of the text is retried only a few times. False at
+        the end.
+        """
+        if self._chunks is None:
+            return False
+
+        pending = [self.text[self.pos :]]
+        wanted = max(3 * len(pending[0]), CHUNK_SIZE)
+        read = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            pending.append(text)
+            read += len(text)
+            if read >= wanted:
+                break
+        else:
+            pending.append(self._decoder.decode(b"", final=True))
+            self._chunks = None
+
+        self.text = "".join(pending)
+        self.pos = 0
+        return read > 0
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self._more():
+                raise JSONDecodeError("Unexpected end of data", self.text, self.pos)
+
+    def at_end(self) -> bool:
+        try:
+            self.peek()
+        except JSONDecodeError:
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise JSONDecodeError(f"Expecting {char!r}", self.text, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next value in full (at C speed)"""
+        self.peek()
+        while True:
+            try:
+                value, end = _raw_decode(self.text, self.pos)
+            except JSONDecodeError:
+                # Most likely cut off by the end of the text read so far
+                if self._more():
+                    continue
+                raise
+            # A number ending the text read so far may go on in the next chunk
+            if end == len(self.text) and self._more():
+                continue
+            self.pos = end
+            return value
+
+    def _container(self, start: str, end: str) -> Iterator[None]:
+        self.expect(start)
+        if self.peek() == end:
+            self.pos += 1
+            return
+
+        while True:
+            # The caller reads the element before asking for the next one
+            yield
+            if self.peek() != ",":
+                self.expect(end)
+                return
+            self.pos += 1
+
+    def keys(self) -> Iterator[str]:
+        """Yield each key of the next object, the caller must read its value"""
+        for _ in self._container("{", "}"):
+            key = self.value()
+            if not isinstance(key, str):
+                raise JSONDecodeError("Expecting property name", self.text, self.pos)
+            self.expect(":")
+            yield key
+
+    def elements(self) -> Iterator[None]:
+        """Yield once per element of the next array, the caller must read it"""
+        return self._container("[", "]")
+
+
+def _is_selected(profile: Dict[str, Any], selected_profile: Optional[str]) -> bool:
+    if selected_profile:
+        return profile.get("cute_name", "").lower() == selected_profile.lower()
+    return bool(profile.get("selected"))
+
+
+def _read_profiles(
+    reader: _Reader, uuid: str, selected_profile: Optional[str]
+) -> List[Any]:
+    profiles: List[Any] = []
+    found = False
+
+    for _ in reader.elements():
+        if reader.peek() != "{":
+            profiles.append(reader.value())
+            continue
+
+        profile: Dict[str, Any] = {}
+        for key in reader.keys():
+            if key != "members" or reader.peek() != "{":
+                profile[key] = reader.value()
+                continue
+
+            # Only this player's member is kept, the rest is dropped as soon
+            # as it has been read
+            members: Dict[str, Any] = {}
+            for member_uuid in reader.keys():
+                member = reader.value()
+                if member_uuid == uuid:
+                    members[member_uuid] = member
+            profile["members"] = members
+
+        # cute_name and selected come after members, so whether a profile is
+        # kept can only be decided once all of it has been read
+        if not found and _is_selected(profile, selected_profile):
+            found = True
+            profiles.append(profile)
+        else:
+            profiles.append({key: profile[key] for key in STUB_KEYS if key in profile})
+
+    return profiles
+
+
+def parse_profiles(
+    body: str | Buffer | Iterable[bytes],
+    uuid: str,
+    selected_profile: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Parse a /v2/skyblock/profiles response keeping only what Player uses.
+
+    The selected profile (the one called selected_profile, or the one marked
+    selected) keeps everything but the other coop members. Every other profile
+    becomes a stub with only its profile_id, cute_name and selected flag.
+
+    body is the response text, its bytes (any buffer, such as a memoryview
+    of an mmap) or an iterable of byte chunks such as
+    requests.Response.iter_content(). It is decoded a chunk at a time and
+    members one at a time, each dropped right away unless it is kept, so
+    neither the whole text nor the whole response as Python objects ever
+    exists at once.
+    """
+    if isinstance(body, str):
+        reader = _Reader((), body)
+    elif isinstance(body, (bytes, bytearray, memoryview)):
+        reader = _Reader(_chunks(body))
+    else:
+        reader = _Reader(body)
+
+    data: Dict[str, Any] = {}
+    for key in reader.keys():
+        if key == "profiles" and reader.peek() == "[":
+            data[key] = _read_profiles(reader, uuid, selected_profile)
+        else:
+            data[key] = reader.value()
+
+    if not reader.at_end():
+        raise JSONDecodeError("Extra data", reader.text, reader.pos)
+    return data
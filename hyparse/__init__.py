@@ -1,3 +1,35 @@
-from .Player import Player
+from typing import TYPE_CHECKING
 
-__all__ = ["Player"]
+from .utils import lazy_attributes
+
+# Everything is imported on first use, so `import hyparse` (or a submodule
+# such as hyparse.levels) doesn't pay for requests, asyncio or the decoders
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Player": ".Player",
+        "Member": ".Member",
+        "ProfileDiff": ".ProfileDiff",
+        "AsyncPlayer": ".AsyncPlayer",
+        "fetch_players": ".AsyncPlayer",
+        "Client": ".client",
+        "resolve_uuids": ".client",
+    },
+)
+
+if TYPE_CHECKING:
+    from .Player import Player
+    from .Member import Member
+    from .ProfileDiff import ProfileDiff
+    from .AsyncPlayer import AsyncPlayer, fetch_players
+    from .client import Client, resolve_uuids
+
+__all__ = [
+    "Player",
+    "Member",
+    "ProfileDiff",
+    "AsyncPlayer",
+    "fetch_players",
+    "Client",
+    "resolve_uuids",
+]
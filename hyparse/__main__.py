@@ -0,0 +1,82 @@
+"""
+hyparse: crawl SkyBlock profiles into NDJSON.
+
+    hyparse players.txt --views skills catacombs -o out.ndjson --checkpoint crawl.ckpt
+
+Reads one player name or uuid per line (stdin by default) and writes one
+JSON record per player as it finishes. The API key comes from --api-key or
+the HYPIXEL_API_KEY environment variable. Run again with the same
+--checkpoint to resume an interrupted crawl; the output is then appended to.
+"""
+
+import argparse
+import json
+import os
+import sys
+from contextlib import ExitStack
+from typing import List, Optional
+
+from .client import Client
+from .pipeline import DEFAULT_VIEWS, VIEWS, Checkpoint, read_identifiers, run_pipeline
+
+API_KEY_ENV = "HYPIXEL_API_KEY"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="hyparse",
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join(__doc__.strip().splitlines()[1:]),
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="file of names or uuids, - for stdin"
+    )
+    parser.add_argument("-o", "--output", default="-", help="NDJSON file, - for stdout")
+    parser.add_argument("-k", "--api-key", default=os.environ.get(API_KEY_ENV))
+    parser.add_argument(
+        "--views", nargs="+", choices=sorted(VIEWS), default=list(DEFAULT_VIEWS)
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument("--checkpoint", help="file of finished players, for resuming")
+    parser.add_argument("--profile", help="cute name of the profile to read")
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        parser.error(f"an API key is required, pass --api-key or set {API_KEY_ENV}")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    with ExitStack() as stack:
+        if args.input == "-":
+            source = sys.stdin
+        else:
+            source = stack.enter_context(open(args.input, "r", encoding="utf-8"))
+        checkpoint = None
+        if args.checkpoint:
+            checkpoint = stack.enter_context(Checkpoint(args.checkpoint))
+        if args.output == "-":
+            output = sys.stdout
+        else:
+            # A resumed crawl adds to what the earlier run wrote
+            mode = "a" if checkpoint is not None else "w"
+            output = stack.enter_context(open(args.output, mode, encoding="utf-8"))
+        client = stack.enter_context(Client(pool_size=args.concurrency))
+
+        stats = run_pipeline(
+            args.api_key,
+            read_identifiers(source),
+            output,
+            args.views,
+            checkpoint=checkpoint,
+            concurrency=args.concurrency,
+            client=client,
+            selected_profile=args.profile,
+        )
+
+    print(json.dumps(stats), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import sqlite3
+from os import PathLike, makedirs, path
+from threading import Lock
+from time import time
+from typing import Callable, Optional, Tuple
+
+
+class DiskCache:
+    """
+    Persistent key → bytes store backed by a single sqlite file.
+
+    Entries carry an absolute expiry time so they survive restarts with the
+    TTL they were written with. Expired rows are dropped when read, or all at
+    once with purge_expired().
+    """
+
+    def __init__(
+        self,
+        filename: str | PathLike[str],
+        *,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        self.filename = str(filename)
+        self._clock = clock
+        self._lock = Lock()
+
+        directory = path.dirname(path.abspath(self.filename))
+        makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            self.filename, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"<DiskCache filename={self.filename!r}>"
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Optional[float]]]:
+        """Return (value, expires_at) for key, or None if it is missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and self._clock() >= expires_at:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+
+            return bytes(value), expires_at
+
+    def set(self, key: str, value: bytes, expires_at: Optional[float] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (self._clock(),),
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypedDict, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    size: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe in-memory LRU cache with per-entry TTL.
+
+    The least recently used entries are evicted once there are more than
+    max_entries of them, or once their combined size (as measured by
+    sizeof, len() by default) goes over max_size. None disables a bound.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 1024,
+        max_size: Optional[int] = None,
+        *,
+        sizeof: Callable[[V], int] = len,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._sizeof = sizeof
+        self._clock = clock
+
+        self._lock = Lock()
+        # key → (value, size, expires_at)
+        self._entries: "OrderedDict[K, Tuple[V, int, Optional[float]]]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry[2])
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} entries={len(self)} size={self._size} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    def _expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and self._clock() >= expires_at
+
+    def _remove(self, key: K) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_size is not None and self._size > self.max_size)
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, _, expires_at = entry
+            if self._expired(expires_at):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def expires_at(self, key: K) -> Optional[float]:
+        """Absolute expiry time of a cached key, None if it never expires or is missing"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[2]
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl: Optional[float] = None,
+        *,
+        expires_at: Optional[float] = None,
+    ) -> None:
+        """Cache value for ttl seconds (or until expires_at), forever if neither is given."""
+        if ttl is not None:
+            expires_at = self._clock() + ttl
+
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # A value bigger than the whole cache would only evict everything else
+            if self.max_size is not None and size > self.max_size:
+                self.evictions += 1
+                return
+
+            self._entries[key] = (value, size, expires_at)
+            self._size += size
+            self._evict()
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "size": self._size,
+            }
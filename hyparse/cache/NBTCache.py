@@ -0,0 +1,120 @@
+import json
+from hashlib import blake2b
+from os import PathLike
+from threading import Lock
+from typing import Any, Optional
+
+from .DiskCache import DiskCache
+from .LRUCache import CacheStats, LRUCache
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+
+
+class NBTCacheStats(CacheStats):
+    disk_hits: int
+
+
+class NBTCache:
+    """
+    Content-addressed cache of decoded inventory NBT.
+
+    Entries are keyed by a digest of the base64 blob Hypixel sent, so an
+    unchanged section is only ever gunzipped and decoded once no matter which
+    Player or Inventory it belongs to. Decoded data is kept as compact JSON,
+    bounded by max_entries and max_size bytes, and every get() returns a
+    fresh copy the caller is free to modify. With disk_path the entries are
+    also written to a sqlite file that other processes can share.
+
+    Blobs never change under a digest, so entries don't expire.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_size: Optional[int] = DEFAULT_MAX_SIZE,
+        disk_path: Optional[str | PathLike[str]] = None,
+    ) -> None:
+        self.memory: LRUCache[str, bytes] = LRUCache(max_entries, max_size)
+        self.disk = DiskCache(disk_path) if disk_path else None
+
+        self._lock = Lock()
+        self.disk_hits = 0
+
+    def __repr__(self) -> str:
+        tiers = "memory+disk" if self.disk is not None else "memory"
+        return f"<NBTCache tiers={tiers} entries={len(self.memory)}>"
+
+    def __contains__(self, blob: str) -> bool:
+        digest = self.digest(blob)
+        return digest in self.memory or (
+            self.disk is not None and self.disk.get(digest) is not None
+        )
+
+    @staticmethod
+    def digest(blob: str) -> str:
+        return blake2b(blob.encode("ascii"), digest_size=16).hexdigest()
+
+    def get(self, blob: str) -> Optional[Any]:
+        """Return the decoded contents of blob, None if it isn't cached"""
+        digest = self.digest(blob)
+        value = self.memory.get(digest)
+        if value is None and self.disk is not None:
+            entry = self.disk.get(digest)
+            if entry is not None:
+                value = entry[0]
+                self.memory.set(digest, value)
+                with self._lock:
+                    self.disk_hits += 1
+
+        return None if value is None else json.loads(value)
+
+    def set(self, blob: str, decoded: Any) -> None:
+        digest = self.digest(blob)
+        value = json.dumps(decoded, separators=(",", ":")).encode()
+        self.memory.set(digest, value)
+        if self.disk is not None:
+            self.disk.set(digest, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
+
+    def stats(self) -> NBTCacheStats:
+        """Hits and misses across both tiers, a disk hit counts as a single hit"""
+        memory = self.memory.stats()
+        with self._lock:
+            disk_hits = self.disk_hits
+
+        return {
+            **memory,
+            "hits": memory["hits"] + disk_hits,
+            "misses": memory["misses"] - disk_hits,
+            "disk_hits": disk_hits,
+        }
+
+
+_nbt_cache: Optional[NBTCache] = NBTCache()
+_nbt_cache_lock = Lock()
+
+
+def get_nbt_cache() -> Optional[NBTCache]:
+    """Return the NBTCache shared by every Inventory, None if caching is off"""
+    return _nbt_cache
+
+
+def set_nbt_cache(cache: Optional[NBTCache]) -> Optional[NBTCache]:
+    """
+    Make cache the one shared by every Inventory (None turns caching off).
+    Returns the cache it replaced.
+    """
+    global _nbt_cache
+
+    with _nbt_cache_lock:
+        previous, _nbt_cache = _nbt_cache, cache
+    return previous
@@ -0,0 +1,111 @@
+from os import PathLike
+from threading import Lock
+from time import time
+from typing import Callable, Dict, Optional
+
+from .DiskCache import DiskCache
+from .LRUCache import CacheStats, LRUCache
+
+# Seconds each endpoint stays cached. Profiles change as people play, while a
+# name only maps to a different uuid after a rename, so uuids live far longer.
+DEFAULT_TTLS: Dict[str, Optional[float]] = {
+    "profiles": 60.0,
+    "uuid": 30 * 24 * 60 * 60.0,
+}
+DEFAULT_TTL = 60.0
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+
+class ResponseCacheStats(CacheStats):
+    disk_hits: int
+
+
+class ResponseCache:
+    """
+    Two tier cache for raw API responses, keyed by (endpoint, key).
+
+    The memory tier is an LRU bounded by entry count and total bytes. When
+    disk_path is given, every response is also written to a sqlite file that
+    survives restarts and refills the memory tier on a miss. ttls maps an
+    endpoint name to its TTL in seconds (None never expires) and is merged
+    over DEFAULT_TTLS.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_size: Optional[int] = DEFAULT_MAX_SIZE,
+        disk_path: Optional[str | PathLike[str]] = None,
+        *,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._clock = clock
+        self.memory: LRUCache[str, bytes] = LRUCache(max_entries, max_size, clock=clock)
+        self.disk = DiskCache(disk_path, clock=clock) if disk_path else None
+
+        self._lock = Lock()
+        self.disk_hits = 0
+
+    def __repr__(self) -> str:
+        tiers = "memory+disk" if self.disk is not None else "memory"
+        return f"<ResponseCache tiers={tiers} entries={len(self.memory)}>"
+
+    @staticmethod
+    def _key(endpoint: str, key: str) -> str:
+        return f"{endpoint}:{key}"
+
+    def get(self, endpoint: str, key: str) -> Optional[bytes]:
+        cache_key = self._key(endpoint, key)
+        value = self.memory.get(cache_key)
+        if value is not None or self.disk is None:
+            return value
+
+        entry = self.disk.get(cache_key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        self.memory.set(cache_key, value, expires_at=expires_at)
+        with self._lock:
+            self.disk_hits += 1
+        return value
+
+    def set(self, endpoint: str, key: str, value: bytes) -> None:
+        ttl = self.ttls.get(endpoint, DEFAULT_TTL)
+        expires_at = None if ttl is None else self._clock() + ttl
+
+        cache_key = self._key(endpoint, key)
+        self.memory.set(cache_key, value, expires_at=expires_at)
+        if self.disk is not None:
+            self.disk.set(cache_key, value, expires_at)
+
+    def invalidate(self, endpoint: str, key: str) -> None:
+        cache_key = self._key(endpoint, key)
+        self.memory.delete(cache_key)
+        if self.disk is not None:
+            self.disk.delete(cache_key)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
+
+    def stats(self) -> ResponseCacheStats:
+        """Hits and misses across both tiers, a disk hit counts as a single hit"""
+        memory = self.memory.stats()
+        with self._lock:
+            disk_hits = self.disk_hits
+
+        return {
+            **memory,
+            "hits": memory["hits"] + disk_hits,
+            "misses": memory["misses"] - disk_hits,
+            "disk_hits": disk_hits,
+        }
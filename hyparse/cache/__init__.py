@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING
+
+from ..utils import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "CacheStats": ".LRUCache",
+        "LRUCache": ".LRUCache",
+        "DiskCache": ".DiskCache",
+        "DEFAULT_TTLS": ".ResponseCache",
+        "ResponseCache": ".ResponseCache",
+        "ResponseCacheStats": ".ResponseCache",
+        "NBTCache": ".NBTCache",
+        "NBTCacheStats": ".NBTCache",
+        "get_nbt_cache": ".NBTCache",
+        "set_nbt_cache": ".NBTCache",
+    },
+)
+
+if TYPE_CHECKING:
+    from .LRUCache import CacheStats, LRUCache
+    from .DiskCache import DiskCache
+    from .ResponseCache import DEFAULT_TTLS, ResponseCache, ResponseCacheStats
+    from .NBTCache import NBTCache, NBTCacheStats, get_nbt_cache, set_nbt_cache
+
+__all__ = [
+    "CacheStats",
+    "LRUCache",
+    "DiskCache",
+    "DEFAULT_TTLS",
+    "ResponseCache",
+    "ResponseCacheStats",
+    "NBTCache",
+    "NBTCacheStats",
+    "get_nbt_cache",
+    "set_nbt_cache",
+]
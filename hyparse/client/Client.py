@@ -0,0 +1,343 @@
+import requests
+from concurrent.futures import Executor
+from contextvars import copy_context
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from typing import TypedDict, TypeVar
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ..cache import DEFAULT_TTLS, ResponseCache
+from ..exceptions import MojangAPIError
+from .NameIndex import NameIndex
+from .RateLimiter import Priority, RateLimiter
+from .SingleFlight import SingleFlight
+
+T = TypeVar("T")
+
+# (connect timeout, read timeout) in seconds
+Timeout = Tuple[float, float]
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT: Timeout = (3.05, 10.0)
+DEFAULT_THROTTLE_RETRIES = 3
+
+# Mojang's bulk endpoint accepts at most this many names per request
+MOJANG_BULK_LIMIT = 10
+
+# Requests carrying this header count against that key's Hypixel quota
+API_KEY_HEADER = "API-Key"
+
+
+class TransportStats(TypedDict):
+    requests: int
+    new_connections: int
+    reused_connections: int
+    throttled: int
+
+
+class ClientStats:
+    """Thread-safe counters describing how the pooled connections are used."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.throttled = 0
+
+    def _record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _record_throttled(self) -> None:
+        with self._lock:
+            self.throttled += 1
+
+    def _record_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    @property
+    def reused_connections(self) -> int:
+        return max(self.requests - self.new_connections, 0)
+
+    def snapshot(self) -> TransportStats:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": max(self.requests - self.new_connections, 0),
+                "throttled": self.throttled,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+            self.throttled = 0
+
+
+def _counting_pool(base: type, stats: ClientStats) -> type:
+    """Subclass a urllib3 pool so every real socket connect is counted."""
+
+    class CountingPool(base):
+        def _new_conn(self):
+            conn = super()._new_conn()
+            connect = conn.connect
+
+            # Pooled connections dropped by the server are reconnected in
+            # place, so count at connect() rather than at creation
+            def counted_connect():
+                stats._record_new_connection()
+                return connect()
+
+            conn.connect = counted_connect
+            return conn
+
+    return CountingPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    def __init__(self, stats: ClientStats, **kwargs: Any) -> None:
+        self._stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._stats),
+            "https": _counting_pool(HTTPSConnectionPool, self._stats),
+        }
+
+    def send(self, request, *args: Any, **kwargs: Any):
+        self._stats._record_request()
+        return super().send(request, *args, **kwargs)
+
+
+class Client:
+    """
+    Owns a pooled, keep-alive HTTP session shared by every Player that uses it.
+
+    pool_size is the number of connections kept open per host, timeout is a
+    (connect, read) tuple in seconds applied to every request.
+
+    Requests made with an API-Key header are scheduled through a RateLimiter
+    for that key (see rate_limiter()), and a 429 response is retried after
+    the quota resets up to throttle_retries times. Pass rate_limit=False to
+    send them unscheduled.
+
+    A ResponseCache given as cache is consulted by Player before it asks
+    Hypixel for profiles or Mojang for a uuid. Resolved names are recorded in
+    name_index, an in-memory NameIndex unless a persistent one is given; the
+    default one keeps names as long as the "uuid" TTL of cache (or of
+    DEFAULT_TTLS without one).
+
+    Identical requests made at the same time, say two threads building a
+    Player for the same uuid, are coalesced into one (see coalesce()); the
+    callers share its parsed result, the way coop members share a profile.
+    single_flight counts how many were, pass coalesce=False to turn it off.
+    """
+
+    mojang_bulk_url = "https://api.mojang.com/profiles/minecraft"
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        *,
+        rate_limit: bool = True,
+        throttle_retries: int = DEFAULT_THROTTLE_RETRIES,
+        pacing: bool = False,
+        cache: Optional[ResponseCache] = None,
+        name_index: Optional[NameIndex] = None,
+        coalesce: bool = True,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError("'pool_size' must be at least 1")
+
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.rate_limit = rate_limit
+        self.throttle_retries = throttle_retries
+        self.pacing = pacing
+        self.cache = cache
+        if name_index is None:
+            # A released name can be taken by another account, so resolved
+            # names are forgotten as cached uuid responses are
+            ttls = cache.ttls if cache is not None else DEFAULT_TTLS
+            name_index = NameIndex(max_age=ttls.get("uuid"))
+        self.name_index = name_index
+        self.stats = ClientStats()
+        self.single_flight = SingleFlight() if coalesce else None
+
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._limiters_lock = Lock()
+
+        self._session = requests.Session()
+        adapter = _CountingAdapter(self.stats, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<Client pool_size={self.pool_size} timeout={self.timeout}>"
+
+    def rate_limiter(self, api_key: str) -> RateLimiter:
+        """Return the RateLimiter tracking the quota of this API key."""
+        with self._limiters_lock:
+            limiter = self._limiters.get(api_key)
+            if limiter is None:
+                limiter = RateLimiter(pacing=self.pacing)
+                self._limiters[api_key] = limiter
+            return limiter
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        stream: bool = False,
+    ) -> requests.Response:
+        """
+        GET url. With stream=True the body is left unread, to be consumed
+        through iter_content(); close the response if it isn't read to the end.
+        """
+        api_key = (headers or {}).get(API_KEY_HEADER)
+        if not self.rate_limit or api_key is None:
+            return self._session.get(
+                url, headers=headers, params=params, timeout=self.timeout, stream=stream
+            )
+
+        limiter = self.rate_limiter(api_key)
+        for attempt in range(self.throttle_retries + 1):
+            limiter.acquire(priority)
+            try:
+                response = self._session.get(
+                    url,
+                    headers=headers,
+                    params=params,
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+            except BaseException:
+                limiter.release()
+                raise
+
+            throttled = response.status_code == 429
+            limiter.release(response.headers, throttled=throttled)
+            if not throttled:
+                break
+            self.stats._record_throttled()
+            if attempt < self.throttle_retries:
+                # Hands an unread streamed connection back before retrying
+                response.close()
+
+        return response
+
+    def coalesce(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """
+        fetch(), unless a request for key is already in flight, in which
+        case its result is waited for and returned instead. key must cover
+        everything the result depends on, e.g. ("profiles", api key, uuid).
+        """
+        if self.single_flight is None:
+            return fetch()
+        return self.single_flight.do(key, fetch)
+
+    async def coalesce_async(
+        self,
+        key: Hashable,
+        fetch: Callable[[], T],
+        executor: Optional[Executor] = None,
+    ) -> T:
+        """coalesce() for coroutines, the blocking fetch runs on executor"""
+        if self.single_flight is None:
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, copy_context().run, fetch)
+        return await self.single_flight.do_async(key, fetch, executor)
+
+    def post(self, url: str, *, json: Any = None) -> requests.Response:
+        return self._session.post(url, json=json, timeout=self.timeout)
+
+    def resolve_uuids(
+        self, names: Iterable[str], batch_size: int = MOJANG_BULK_LIMIT
+    ) -> Dict[str, Optional[str]]:
+        """
+        Resolve many player names to uuids at once.
+
+        Names are matched case-insensitively and looked up in name_index
+        first; only the misses are sent to Mojang, batch_size names per bulk
+        request. Returns every given name mapped to its uuid, or None if no
+        such player exists.
+        """
+        if not 1 <= batch_size <= MOJANG_BULK_LIMIT:
+            raise ValueError(f"'batch_size' must be between 1 and {MOJANG_BULK_LIMIT}")
+
+        names = list(names)
+        resolved: Dict[str, Optional[str]] = {}
+        missing: Dict[str, str] = {}
+        for name in names:
+            key = name.lower()
+            if key in resolved or key in missing:
+                continue
+            uuid = self.name_index.get_uuid(key)
+            if uuid is None:
+                missing[key] = name
+            else:
+                resolved[key] = uuid
+
+        pending: List[str] = list(missing.values())
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            response = self.post(self.mojang_bulk_url, json=batch)
+            if response.status_code != 200:
+                raise MojangAPIError(
+                    f"Bulk uuid lookup failed with status {response.status_code}"
+                )
+
+            found = [(entry["name"], entry["id"]) for entry in response.json()]
+            self.name_index.add_many(found)
+            for name, uuid in found:
+                resolved[name.lower()] = uuid
+
+        return {name: resolved.get(name.lower()) for name in names}
+
+    def close(self) -> None:
+        self._session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_default_client: Optional[Client] = None
+_default_client_lock = Lock()
+
+
+def get_default_client() -> Client:
+    """Return the process-wide Client used by Players that weren't given one."""
+    global _default_client
+
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = Client()
+        return _default_client
+
+
+def resolve_uuids(
+    names: Iterable[str],
+    *,
+    client: Optional[Client] = None,
+    batch_size: int = MOJANG_BULK_LIMIT,
+) -> Dict[str, Optional[str]]:
+    """Resolve many player names to uuids, see Client.resolve_uuids."""
+    client = client if client is not None else get_default_client()
+    return client.resolve_uuids(names, batch_size)
@@ -0,0 +1,105 @@
+import sqlite3
+from os import PathLike, makedirs, path
+from threading import Lock
+from time import time
+from typing import Callable, Iterable, Optional, Tuple
+
+MEMORY = ":memory:"
+
+
+class NameIndex:
+    """
+    Persistent, case-insensitive player name ↔ uuid index.
+
+    Backed by sqlite: pass a filename to keep the index across restarts, or
+    leave it out for an in-memory index that lives as long as the process.
+    A uuid only ever has one current name, so recording a rename drops the
+    old name. Entries older than max_age seconds are treated as missing.
+    """
+
+    def __init__(
+        self,
+        filename: str | PathLike[str] = MEMORY,
+        *,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        self.filename = str(filename)
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = Lock()
+
+        if self.filename != MEMORY:
+            makedirs(path.dirname(path.abspath(self.filename)), exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            self.filename, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS names ("
+            "name_key TEXT PRIMARY KEY, name TEXT NOT NULL, "
+            "uuid TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS names_uuid ON names (uuid)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM names").fetchone()[0]
+
+    def __contains__(self, name: str) -> bool:
+        return self.get_uuid(name) is not None
+
+    def __repr__(self) -> str:
+        return f"<NameIndex filename={self.filename!r}>"
+
+    def _oldest(self) -> float:
+        return float("-inf") if self.max_age is None else self._clock() - self.max_age
+
+    def get_uuid(self, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT uuid FROM names WHERE name_key = ? AND updated_at >= ?",
+                (name.lower(), self._oldest()),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def get_name(self, uuid: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name FROM names WHERE uuid = ? AND updated_at >= ?",
+                (uuid.replace("-", ""), self._oldest()),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def add(self, name: str, uuid: str) -> None:
+        self.add_many([(name, uuid)])
+
+    def add_many(self, entries: Iterable[Tuple[str, str]]) -> None:
+        now = self._clock()
+        rows = [
+            (name.lower(), name, uuid.replace("-", ""), now) for name, uuid in entries
+        ]
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "DELETE FROM names WHERE uuid = ?", ((row[2],) for row in rows)
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO names (name_key, name, uuid, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM names")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
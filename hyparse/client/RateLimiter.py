@@ -0,0 +1,193 @@
+from enum import IntEnum
+from heapq import heapify, heappop, heappush
+from itertools import count
+from threading import Condition
+from time import monotonic
+from typing import Callable, List, Mapping, Optional, Tuple
+
+# Hypixel keys default to 300 requests every 5 minutes until a response tells us otherwise
+DEFAULT_LIMIT = 300
+DEFAULT_WINDOW = 300.0
+
+# RateLimit-Reset is whole seconds, so window boundaries are only known to about 1s
+_RESET_TOLERANCE = 1.0
+
+
+class Priority(IntEnum):
+    """Lower values are scheduled first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 10
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    Token bucket for a single API key, kept in sync with Hypixel's
+    RateLimit-Limit / RateLimit-Remaining / RateLimit-Reset headers.
+
+    Callers block in acquire() until a token is free, highest priority first
+    and FIFO within a priority. Every acquire() must be paired with a
+    release(), which hands back the response headers so the bucket can be
+    corrected against the server's own count. With pacing=True the remaining
+    tokens are spread evenly over the rest of the window instead of being
+    spent in one burst.
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        window: float = DEFAULT_WINDOW,
+        *,
+        pacing: bool = False,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if limit < 1:
+            raise ValueError("'limit' must be at least 1")
+
+        self.limit = limit
+        self.window = window
+        self.pacing = pacing
+        self._clock = clock
+
+        self._cond = Condition()
+        self._tokens = limit
+        self._reset_at: Optional[float] = None
+        self._last_start: Optional[float] = None
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = count()
+
+    def __repr__(self) -> str:
+        return (
+            f"<RateLimiter tokens={self._tokens}/{self.limit} "
+            f"in_flight={self._in_flight} waiting={len(self._waiters)}>"
+        )
+
+    @property
+    def tokens(self) -> int:
+        with self._cond:
+            self._refill(self._clock())
+            return self._tokens
+
+    @property
+    def waiting(self) -> int:
+        with self._cond:
+            return len(self._waiters)
+
+    def _refill(self, now: float) -> None:
+        if self._reset_at is None:
+            self._reset_at = now + self.window
+        elif now >= self._reset_at:
+            self._tokens = self.limit
+            self._reset_at = now + self.window
+
+    def _delay(self, now: float) -> float:
+        """Seconds until the next request may start, 0 if it may start now"""
+        if self._tokens <= 0:
+            return max(self._reset_at - now, 0.0) or 1e-3
+
+        if not self.pacing or self._last_start is None:
+            return 0.0
+
+        interval = max(self._reset_at - self._last_start, 0.0) / self._tokens
+        return max(self._last_start + interval - now, 0.0)
+
+    def acquire(
+        self,
+        priority: Priority = Priority.INTERACTIVE,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Block until a request of this priority may be sent."""
+        with self._cond:
+            ticket = (int(priority), next(self._sequence))
+            heappush(self._waiters, ticket)
+            deadline = None if timeout is None else self._clock() + timeout
+
+            try:
+                while True:
+                    now = self._clock()
+                    self._refill(now)
+
+                    wait: Optional[float] = None
+                    if self._waiters[0] == ticket:
+                        wait = self._delay(now)
+                        if wait <= 0:
+                            heappop(self._waiters)
+                            self._tokens -= 1
+                            self._in_flight += 1
+                            self._last_start = now
+                            # Let the next waiter re-evaluate as the new head
+                            self._cond.notify_all()
+                            return
+
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            raise TimeoutError("Timed out waiting for API quota")
+                        wait = remaining if wait is None else min(wait, remaining)
+
+                    self._cond.wait(wait)
+            except BaseException:
+                if ticket in self._waiters:
+                    self._waiters.remove(ticket)
+                    heapify(self._waiters)
+                    self._cond.notify_all()
+                raise
+
+    def release(
+        self,
+        headers: Optional[Mapping[str, str]] = None,
+        *,
+        throttled: bool = False,
+    ) -> None:
+        """
+        Finish a request started with acquire().
+
+        headers are the response headers, if a response arrived. throttled
+        marks a 429, which empties the bucket until the server's reset.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            now = self._clock()
+            self._refill(now)
+
+            if headers is not None:
+                limit = _header_number(headers, "RateLimit-Limit")
+                remaining = _header_number(headers, "RateLimit-Remaining")
+                reset = _header_number(headers, "RateLimit-Reset")
+                if reset is None:
+                    reset = _header_number(headers, "Retry-After")
+
+                server_reset_at = None if reset is None else now + reset
+
+                if limit is not None and limit >= 1:
+                    self.limit = int(limit)
+                if remaining is not None:
+                    # Requests still in flight may not be counted by the
+                    # server yet, so they are taken off its figure too
+                    server_tokens = max(int(remaining) - self._in_flight, 0)
+                    if (
+                        server_reset_at is not None
+                        and server_reset_at > self._reset_at + _RESET_TOLERANCE
+                    ):
+                        # The server has already moved on to a new window
+                        self._tokens = server_tokens
+                    else:
+                        self._tokens = min(self._tokens, server_tokens)
+                if server_reset_at is not None:
+                    self._reset_at = server_reset_at
+
+            if throttled:
+                self._tokens = 0
+
+            self._cond.notify_all()
@@ -0,0 +1,161 @@
+from concurrent.futures import Executor, Future
+from contextlib import suppress
+from contextvars import copy_context
+from copy import copy
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypedDict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlightStats(TypedDict):
+    calls: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight:
+    """
+    Makes one call per key at a time.
+
+    A caller asking for a key that is already being fetched waits for that
+    call and gets its result, or a copy of its exception, instead of making
+    its own.
+    Threads go through do() and coroutines through do_async(), which waits
+    without holding a thread; both join the same calls. Nothing is kept
+    once a call is done, so later callers make a new one.
+
+    calls counts the calls made and coalesced the callers that waited on
+    someone else's call instead.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def __repr__(self) -> str:
+        return f"<SingleFlight in_flight={len(self._calls)}>"
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        """The future of the call for key, and whether the caller must make it"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+
+            future = self._calls[key] = Future()
+            # Running futures can't be cancelled, so a waiter giving up
+            # doesn't cancel the call for everyone else
+            future.set_running_or_notify_cancel()
+            self.calls += 1
+            return future, True
+
+    def _call(self, key: Hashable, future: Future, fn: Callable[[], T]) -> T:
+        """fn(), its result or exception also settling future for the waiters"""
+        try:
+            result = fn()
+        except Exception as error:
+            self._finish(key, future, None, error)
+            raise
+        else:
+            self._finish(key, future, result, None)
+            return result
+        finally:
+            if not future.done():
+                # Interrupted (KeyboardInterrupt, SystemExit...), which is only
+                # the caller's to handle. Waiters get an error rather than hang
+                self._finish(
+                    key, future, None, RuntimeError(f"Call for {key!r} was interrupted")
+                )
+
+    def _run(self, key: Hashable, future: Future, fn: Callable[[], Any]) -> None:
+        """_call() on an executor, where the outcome is only read from future"""
+        with suppress(Exception):
+            self._call(key, future, fn)
+
+    def _finish(
+        self,
+        key: Hashable,
+        future: Future,
+        result: Any,
+        error: Optional[Exception],
+    ) -> None:
+        # Callers arriving from now on make a new call
+        with self._lock:
+            del self._calls[key]
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    @staticmethod
+    def _result(future: Future) -> Any:
+        """
+        The result of a finished call. A failed call raises a copy of its
+        exception for each waiter, chained from the original, so waiters in
+        different threads never raise (and add tracebacks to) the same object.
+        """
+        error = future.exception()
+        if error is None:
+            return future.result()
+        try:
+            fresh = copy(error)
+        except Exception:
+            # Not copyable, e.g. __init__ takes other arguments than args
+            raise error
+        raise fresh from error
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """fn(), or the result of the call for key already in flight"""
+        future, leader = self._join(key)
+        if leader:
+            return self._call(key, future, fn)
+        return self._result(future)
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[[], T], executor: Optional[Executor] = None
+    ) -> T:
+        """do() for coroutines, a blocking fn is run on executor"""
+        # Imported here so importing the client doesn't load asyncio
+        import asyncio
+
+        future, leader = self._join(key)
+        if leader:
+            loop = asyncio.get_running_loop()
+            try:
+                loop.run_in_executor(
+                    executor, partial(copy_context().run, self._run, key, future, fn)
+                )
+            except Exception as error:
+                # e.g. the executor was shut down, don't leave waiters hanging
+                self._finish(key, future, None, error)
+        # Waited on rather than awaited, which would raise the exception
+        # itself; a waiter giving up doesn't cancel the call either. The
+        # outcome is read from future, so the wrapper's is marked as read
+        waiter = asyncio.wrap_future(future)
+        waiter.add_done_callback(_mark_retrieved)
+        await asyncio.wait((waiter,))
+        return self._result(future)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.coalesced = 0
+
+
+def _mark_retrieved(waiter: Any) -> None:
+    # Keeps asyncio from logging "exception was never retrieved"
+    if not waiter.cancelled():
+        waiter.exception()
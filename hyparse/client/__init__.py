@@ -0,0 +1,36 @@
+from typing import TYPE_CHECKING
+
+from ..utils import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Client": ".Client",
+        "ClientStats": ".Client",
+        "get_default_client": ".Client",
+        "resolve_uuids": ".Client",
+        "NameIndex": ".NameIndex",
+        "Priority": ".RateLimiter",
+        "RateLimiter": ".RateLimiter",
+        "SingleFlight": ".SingleFlight",
+        "SingleFlightStats": ".SingleFlight",
+    },
+)
+
+if TYPE_CHECKING:
+    from .Client import Client, ClientStats, get_default_client, resolve_uuids
+    from .NameIndex import NameIndex
+    from .RateLimiter import Priority, RateLimiter
+    from .SingleFlight import SingleFlight, SingleFlightStats
+
+__all__ = [
+    "Client",
+    "ClientStats",
+    "get_default_client",
+    "resolve_uuids",
+    "NameIndex",
+    "Priority",
+    "RateLimiter",
+    "SingleFlight",
+    "SingleFlightStats",
+]
@@ -4,6 +4,8 @@ from .exceptions import (
     ExpiredAPIKey,
     MissingAPIKey,
     UserNotFound,
+    MojangAPIError,
+    ResourceUnavailable,
 )
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     "ExpiredAPIKey",
     "MissingAPIKey",
     "UserNotFound",
+    "MojangAPIError",
+    "ResourceUnavailable",
 ]
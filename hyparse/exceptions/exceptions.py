@@ -16,3 +16,11 @@ class MissingAPIKey(Exception):
 
 class UserNotFound(Exception):
     pass
+
+
+class MojangAPIError(Exception):
+    pass
+
+
+class ResourceUnavailable(Exception):
+    pass
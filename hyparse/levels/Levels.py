@@ -1,10 +1,30 @@
 import json
+from bisect import bisect_right
 from os import path
-from typing import TypedDict
-
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 JSON_PATH = path.abspath(path.join(path.dirname(__file__), "json", "levels.json"))
 
+TableName = Literal["Skills", "Catacombs"]
+
+# XP needed for each level past the end of a table. Catacombs levels past 50
+# cost a flat 200M, skills keep costing what their last level did.
+OVERFLOW_XP: Dict[str, Optional[float]] = {
+    "Skills": None,
+    "Catacombs": 200_000_000,
+}
+
 
 class SkillInfo(TypedDict):
     skill_level: int
@@ -12,38 +32,235 @@ class SkillInfo(TypedDict):
     xp_required_to_level_up: float
 
 
-def getSkillLevel(
-    initial_exp: float,
-    is_catacombs: bool = False,
-) -> SkillInfo:
+class SkillLevel(NamedTuple):
+    """Compact SkillInfo, a tuple instead of a dict per level"""
+
+    skill_level: int
+    remaining_xp: float
+    xp_required_to_level_up: float
+
+    def to_dict(self) -> SkillInfo:
+        return {
+            "skill_level": self.skill_level,
+            "remaining_xp": self.remaining_xp,
+            "xp_required_to_level_up": self.xp_required_to_level_up,
+        }
+
+
+class SkillInfoArrays(TypedDict):
+    skill_level: Any
+    remaining_xp: Any
+    xp_required_to_level_up: Any
+
+
+class LevelTable:
+    """
+    Immutable level curve.
+
+    xp_required[i] is the xp needed to go from level i to level i + 1 and
+    cumulative_xp[i] is the total xp needed to reach level i + 1, so a level
+    is found by binary searching cumulative_xp.
+    """
+
+    __slots__ = ("name", "xp_required", "cumulative_xp", "overflow_xp", "_arrays")
+
+    def __init__(
+        self,
+        name: str,
+        xp_required: Sequence[float],
+        cumulative_xp: Sequence[float],
+        overflow_xp: Optional[float] = None,
+    ) -> None:
+        if len(xp_required) != len(cumulative_xp) or not cumulative_xp:
+            raise ValueError(f"Level table {name!r} is empty or misaligned")
+
+        self.name = name
+        self.xp_required: Tuple[float, ...] = tuple(xp_required)
+        self.cumulative_xp: Tuple[float, ...] = tuple(cumulative_xp)
+        self.overflow_xp = overflow_xp if overflow_xp else self.xp_required[-1]
+        self._arrays: Any = None
+
+    def __repr__(self) -> str:
+        return f"<LevelTable {self.name} max_level={self.max_level}>"
+
+    def __len__(self) -> int:
+        return len(self.cumulative_xp)
+
+    @property
+    def max_level(self) -> int:
+        return len(self.cumulative_xp)
+
+    @classmethod
+    def from_levels(
+        cls,
+        name: str,
+        levels: Dict[str, Sequence[float]],
+        overflow_xp: Optional[float] = None,
+    ) -> "LevelTable":
+        """Build a table from {"<level>": [xp required, total xp]} as in levels.json"""
+        rows = sorted((int(level), row) for level, row in levels.items())
+        return cls(
+            name,
+            [row[0] for _, row in rows],
+            [row[1] for _, row in rows],
+            overflow_xp,
+        )
+
+    def arrays(self) -> Tuple[Any, Any]:
+        """Read-only NumPy copies of (cumulative_xp, xp_required), built on first use"""
+        if self._arrays is None:
+            import numpy as np
+
+            cumulative = np.asarray(self.cumulative_xp, dtype=np.float64)
+            required = np.asarray(self.xp_required, dtype=np.float64)
+            cumulative.flags.writeable = False
+            required.flags.writeable = False
+            self._arrays = (cumulative, required)
+        return self._arrays
+
+    def level(
+        self, initial_exp: float, overflow: bool = False, compact: bool = False
+    ) -> Union[SkillInfo, SkillLevel]:
+        cumulative_xp = self.cumulative_xp
+        skill_level = bisect_right(cumulative_xp, initial_exp)
+
+        if skill_level == self.max_level and overflow:
+            extra_xp = initial_exp - cumulative_xp[-1]
+            extra_levels = int(extra_xp // self.overflow_xp)
+            skill_level += extra_levels
+            remaining_xp = extra_xp - extra_levels * self.overflow_xp
+            xp_to_next = self.overflow_xp
+        else:
+            remaining_xp = initial_exp - (
+                cumulative_xp[skill_level - 1] if skill_level else 0
+            )
+            xp_to_next = (
+                self.xp_required[skill_level] if skill_level < self.max_level else 0
+            )
+
+        if compact:
+            return SkillLevel(skill_level, remaining_xp, xp_to_next)
+        return {
+            "skill_level": skill_level,
+            "remaining_xp": remaining_xp,
+            "xp_required_to_level_up": xp_to_next,
+        }
+
+    def levels(self, xp: Any, overflow: bool = False) -> SkillInfoArrays:
+        import numpy as np
+
+        cumulative, required = self.arrays()
+        xp = np.asarray(xp, dtype=np.float64)
+
+        skill_level = np.searchsorted(cumulative, xp, side="right")
+        base_xp = np.concatenate(([0.0], cumulative))[skill_level]
+        xp_to_next = np.concatenate((required, [0.0]))[skill_level]
+        remaining_xp = xp - base_xp
+
+        if overflow:
+            capped = skill_level == self.max_level
+            extra_levels = np.where(capped, remaining_xp // self.overflow_xp, 0)
+            skill_level = skill_level + extra_levels.astype(skill_level.dtype)
+            remaining_xp = remaining_xp - extra_levels * self.overflow_xp
+            xp_to_next = np.where(capped, self.overflow_xp, xp_to_next)
+
+        return {
+            "skill_level": skill_level,
+            "remaining_xp": remaining_xp,
+            "xp_required_to_level_up": xp_to_next,
+        }
+
+
+# Swapped as a whole by set_level_tables(), so readers never see it half built
+_tables: Optional[Dict[str, LevelTable]] = None
+_tables_lock = Lock()
+
+
+def _load_bundled_tables() -> Dict[str, LevelTable]:
     with open(JSON_PATH, "r") as f:
         data = json.load(f)
 
-    skill_type = "Catacombs" if is_catacombs else "Skills"
-    skill_data = data[skill_type]
-
-    # Convert string keys to int and sort
-    cumulative_xp = {}
-    xp_required = {}
-    for level_str, (xp_req, total_xp) in skill_data.items():
-        level = int(level_str)
-        xp_required[level] = xp_req
-        cumulative_xp[level] = total_xp
-
-    # Determine skill level
-    skill_level = 0
-    for level in sorted(cumulative_xp):
-        if initial_exp < cumulative_xp[level]:
-            skill_level = level - 1
-            break
+    return {
+        name: LevelTable.from_levels(name, data[name], OVERFLOW_XP.get(name))
+        for name in ("Skills", "Catacombs")
+    }
+
+
+def _loaded_tables() -> Dict[str, LevelTable]:
+    """The level tables in use, parsing levels.json on first use only"""
+    global _tables
+
+    tables = _tables
+    if tables is None:
+        with _tables_lock:
+            if _tables is None:
+                _tables = _load_bundled_tables()
+            tables = _tables
+    return tables
+
+
+def get_level_table(name: TableName | str) -> LevelTable:
+    """Return the level table called name, parsing levels.json on first use only"""
+    return _loaded_tables()[name]
+
+
+def get_skill_table(skill: str) -> LevelTable:
+    """
+    The level table of skill, an experience key such as "SKILL_MINING": its
+    own curve if one was loaded (see update_level_tables), else "Skills"
+    """
+    tables = _loaded_tables()
+    return tables.get(skill) or tables["Skills"]
+
+
+def set_level_tables(tables: Optional[Dict[str, LevelTable]]) -> None:
+    """
+    Look levels up in tables from now on, falling back to the bundled
+    levels.json for names it doesn't have. None goes back to the bundled
+    tables only. Levels memoized by a Member before the swap are kept until
+    it drops them (see Member.drop_caches).
+    """
+    global _tables
+
+    bundled = _load_bundled_tables()
+    with _tables_lock:
+        _tables = {**bundled, **(tables or {})}
+
+
+def getSkillLevel(
+    initial_exp: float,
+    is_catacombs: bool = False,
+    overflow: bool = False,
+    compact: bool = False,
+    skill: Optional[str] = None,
+) -> Union[SkillInfo, SkillLevel]:
+    """
+    Convert raw xp into a level. With overflow=True xp past the last level of
+    the table keeps counting levels instead of stopping at the cap.
+    compact=True returns a SkillLevel tuple instead of a dict. skill, the
+    experience key ("SKILL_RUNECRAFTING"), picks that skill's own curve when
+    one is loaded.
+    """
+    if is_catacombs:
+        table = get_level_table("Catacombs")
+    elif skill is not None:
+        table = get_skill_table(skill)
     else:
-        skill_level = max(cumulative_xp)
+        table = get_level_table("Skills")
+    return table.level(initial_exp, overflow, compact)
 
-    remaining_xp = initial_exp - cumulative_xp.get(skill_level, 0)
-    xp_to_next = xp_required.get(skill_level + 1, 0)
 
-    return {
-        "skill_level": skill_level,
-        "remaining_xp": remaining_xp,
-        "xp_required_to_level_up": xp_to_next,
-    }
+def getSkillLevels(
+    xp_array: Any,
+    table: TableName | LevelTable = "Skills",
+    overflow: bool = False,
+) -> SkillInfoArrays:
+    """
+    Vectorized getSkillLevel: converts a whole array of xp values at once.
+
+    Returns the same keys as getSkillLevel, each holding a NumPy array shaped
+    like xp_array.
+    """
+    if not isinstance(table, LevelTable):
+        table = get_level_table(table)
+    return table.levels(xp_array, overflow)
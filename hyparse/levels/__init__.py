@@ -1,3 +1,19 @@
-from .Levels import getSkillLevel
+from .Levels import (
+    LevelTable,
+    SkillLevel,
+    get_level_table,
+    get_skill_table,
+    getSkillLevel,
+    getSkillLevels,
+    set_level_tables,
+)
 
-__all__ = ["getSkillLevel"]
+__all__ = [
+    "LevelTable",
+    "SkillLevel",
+    "get_level_table",
+    "get_skill_table",
+    "getSkillLevel",
+    "getSkillLevels",
+    "set_level_tables",
+]
@@ -0,0 +1,62 @@
+from os import PathLike, fsync
+from threading import Lock
+from typing import IO, Optional, Set
+
+
+class Checkpoint:
+    """
+    Append-only record of the identifiers a crawl has finished, one per line.
+
+    Reopening the same path resumes: every identifier already in the file
+    is in done. A line is only written once the record for that identifier
+    has been flushed, so a crash loses at most the records in flight and
+    can repeat at most one.
+    """
+
+    def __init__(self, path: str | PathLike[str], sync: bool = False) -> None:
+        self.path = path
+        self.sync = sync
+        self.done: Set[str] = set()
+        self._lock = Lock()
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                # A torn last line from a crash is just retried
+                lines = f.read().split("\n")
+                self.done.update(line for line in lines[:-1] if line)
+        except FileNotFoundError:
+            pass
+
+        # Kept open between marks, closed by close() or on leaving a with
+        self._file: Optional[IO[str]] = open(path, "a", encoding="utf-8")
+
+    def __repr__(self) -> str:
+        return f"<Checkpoint path={self.path!r} done={len(self.done)}>"
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self.done
+
+    def __len__(self) -> int:
+        return len(self.done)
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def mark(self, identifier: str) -> None:
+        with self._lock:
+            if self._file is None:
+                raise ValueError("Checkpoint is closed")
+            self.done.add(identifier)
+            self._file.write(identifier + "\n")
+            self._file.flush()
+            if self.sync:
+                fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
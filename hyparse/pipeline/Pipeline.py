@@ -0,0 +1,209 @@
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Set,
+    TypedDict,
+)
+
+from ..AsyncPlayer import _is_uuid
+from ..Player import Player, SelectedProfile
+from ..client import Client, Priority
+from .Checkpoint import Checkpoint
+
+View = Callable[[Player], Any]
+
+# Players fetched or waiting per worker. Caps how many fetched profiles can
+# pile up when writing records out is slower than fetching them.
+QUEUED_PER_WORKER = 2
+
+
+def _skills(player: Player) -> Any:
+    return player.skill_levels
+
+
+def _catacombs(player: Player) -> Any:
+    dungeons = player.dungeons
+    return {
+        "level": dungeons.cata_level,
+        "floors": dungeons.catacombs.format_data(),
+        "master_floors": dungeons.master_catacombs.format_data(),
+    }
+
+
+def _trophy_fish(player: Player) -> Any:
+    return player.fishing.trophies
+
+
+def _purse(player: Player) -> Any:
+    return player.purse(human_readable=False)
+
+
+def _inventory(player: Player) -> Any:
+    index = player.inventory().item_index()
+    return {
+        "items": len(index),
+        "counts": {item_id: index.count(item_id) for item_id in index.ids()},
+    }
+
+
+# view name → function building it from a Player
+VIEWS: Dict[str, View] = {
+    "skills": _skills,
+    "catacombs": _catacombs,
+    "trophy_fish": _trophy_fish,
+    "purse": _purse,
+    "inventory": _inventory,
+}
+DEFAULT_VIEWS = tuple(VIEWS)
+
+
+class PipelineStats(TypedDict):
+    done: int
+    failed: int
+    skipped: int
+
+
+def read_identifiers(lines: Iterable[str]) -> Iterator[str]:
+    """Player names or uuids from lines, skipping blank lines and # comments"""
+    for line in lines:
+        identifier = line.strip()
+        if identifier and not identifier.startswith("#"):
+            yield identifier
+
+
+def extract(player: Player, views: Sequence[str] = DEFAULT_VIEWS) -> Dict[str, Any]:
+    """The record of one player: who it is and every view asked for"""
+    record: Dict[str, Any] = {
+        "uuid": player.uuid,
+        "profile_id": player.profile_id,
+        "cute_name": player.cute_name,
+    }
+    for name in views:
+        record[name] = VIEWS[name](player)
+    return record
+
+
+def iter_records(
+    API_KEY: str,
+    identifiers: Iterable[str],
+    views: Sequence[str] = DEFAULT_VIEWS,
+    *,
+    concurrency: int = 8,
+    client: Optional[Client] = None,
+    selected_profile: Optional[SelectedProfile] = None,
+    priority: Priority = Priority.BACKGROUND,
+    skip: Optional[Checkpoint | Set[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch players concurrently and yield a record for each as soon as it
+    is done, in completion order.
+
+    identifiers are consumed lazily and at most concurrency * 2 players are
+    in flight, so memory stays flat however long the input is. Profiles are
+    parsed in streaming mode and each Player is dropped once its views are
+    extracted. Every record has the "input" it came from; a failed player
+    gets an "error" instead of its views. Identifiers in skip are left out.
+    """
+    if concurrency < 1:
+        raise ValueError("'concurrency' must be at least 1")
+    unknown = [name for name in views if name not in VIEWS]
+    if unknown:
+        raise ValueError(f"Unknown views {unknown}, choose from {list(VIEWS)}")
+
+    own_client = client is None
+    if client is None:
+        client = Client(pool_size=concurrency)
+
+    def fetch(identifier: str) -> Dict[str, Any]:
+        if _is_uuid(identifier):
+            kwargs = {"uuid": identifier.replace("-", "")}
+        else:
+            kwargs = {"player_name": identifier}
+
+        try:
+            player = Player(
+                API_KEY,
+                selected_profile=selected_profile,
+                client=client,
+                priority=priority,
+                streaming=True,
+                **kwargs,
+            )
+            return {"input": identifier, **extract(player, views)}
+        except Exception as exc:
+            return {"input": identifier, "error": f"{type(exc).__name__}: {exc}"}
+
+    pending: Set[Future] = set()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        for identifier in identifiers:
+            if skip is not None and identifier in skip:
+                continue
+
+            # Workers run in a copy of this context so an active Tracer sees them
+            pending.add(executor.submit(copy_context().run, fetch, identifier))
+            if len(pending) >= concurrency * QUEUED_PER_WORKER:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if own_client:
+            client.close()
+
+
+def run_pipeline(
+    API_KEY: str,
+    identifiers: Iterable[str],
+    output: IO[str],
+    views: Sequence[str] = DEFAULT_VIEWS,
+    *,
+    checkpoint: Optional[Checkpoint] = None,
+    **options: Any,
+) -> PipelineStats:
+    """
+    Write the records of iter_records to output as NDJSON, one line each,
+    flushed as they finish.
+
+    With a checkpoint, identifiers it already holds are skipped and every
+    successful record is marked in it after being written, so running again
+    with the same checkpoint resumes where a crash left off. Failed players
+    aren't marked and are retried on the next run.
+    """
+    stats: PipelineStats = {"done": 0, "failed": 0, "skipped": 0}
+
+    def counted(identifiers: Iterable[str]) -> Iterator[str]:
+        for identifier in identifiers:
+            if checkpoint is not None and identifier in checkpoint:
+                stats["skipped"] += 1
+                continue
+            yield identifier
+
+    for record in iter_records(API_KEY, counted(identifiers), views, **options):
+        output.write(json.dumps(record, separators=(",", ":")) + "\n")
+        output.flush()
+
+        if "error" in record:
+            stats["failed"] += 1
+            continue
+        stats["done"] += 1
+        if checkpoint is not None:
+            checkpoint.mark(record["input"])
+
+    return stats
@@ -0,0 +1,21 @@
+from .Checkpoint import Checkpoint
+from .Pipeline import (
+    DEFAULT_VIEWS,
+    VIEWS,
+    PipelineStats,
+    extract,
+    iter_records,
+    read_identifiers,
+    run_pipeline,
+)
+
+__all__ = [
+    "Checkpoint",
+    "DEFAULT_VIEWS",
+    "VIEWS",
+    "PipelineStats",
+    "extract",
+    "iter_records",
+    "read_identifiers",
+    "run_pipeline",
+]
@@ -0,0 +1,67 @@
+// Placeholder for a native build of Decoder.py.
+//
+// The Python decoder walks the NBT payload once, but every tag still costs a
+// bytecode dispatch and a struct call. A C++ version can keep the same single
+// pass over the buffer and build the dict/list/int/str objects directly with
+// the CPython API. Nothing here is compiled yet.
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+
+namespace hyparse::nbt {
+
+enum Tag : std::uint8_t {
+    End = 0,
+    Byte = 1,
+    Short = 2,
+    Int = 3,
+    Long = 4,
+    Float = 5,
+    Double = 6,
+    ByteArray = 7,
+    String = 8,
+    List = 9,
+    Compound = 10,
+    IntArray = 11,
+    LongArray = 12,
+};
+
+class Reader {
+public:
+    Reader(const std::uint8_t* data, std::size_t size) : data_(data), size_(size) {}
+
+    std::uint8_t u8() { require(1); return data_[pos_++]; }
+
+    std::uint16_t u16() {
+        require(2);
+        std::uint16_t value = (data_[pos_] << 8) | data_[pos_ + 1];
+        pos_ += 2;
+        return value;
+    }
+
+    std::int32_t i32() {
+        require(4);
+        std::uint32_t value = 0;
+        for (int i = 0; i < 4; ++i) value = (value << 8) | data_[pos_ + i];
+        pos_ += 4;
+        return static_cast<std::int32_t>(value);
+    }
+
+    void skip(std::size_t count) { require(count); pos_ += count; }
+
+    std::size_t position() const { return pos_; }
+
+private:
+    void require(std::size_t count) const {
+        if (pos_ + count > size_) throw std::out_of_range("Truncated or malformed NBT data");
+    }
+
+    const std::uint8_t* data_;
+    std::size_t size_;
+    std::size_t pos_ = 0;
+};
+
+// TODO: decode_payload(Reader&, Tag) -> PyObject*, mirroring _read_payload
+
+}  // namespace hyparse::nbt
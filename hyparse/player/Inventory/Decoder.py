@@ -0,0 +1,311 @@
+from struct import Struct, error as StructError, unpack_from
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+# NBT tag ids
+TAG_END = 0
+TAG_BYTE = 1
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_LONG = 4
+TAG_FLOAT = 5
+TAG_DOUBLE = 6
+TAG_BYTE_ARRAY = 7
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+TAG_INT_ARRAY = 11
+TAG_LONG_ARRAY = 12
+
+# tag id → (struct format character, byte size) for fixed width payloads
+_NUMERIC: Dict[int, Tuple[str, int]] = {
+    TAG_BYTE: ("b", 1),
+    TAG_SHORT: ("h", 2),
+    TAG_INT: ("i", 4),
+    TAG_LONG: ("q", 8),
+    TAG_FLOAT: ("f", 4),
+    TAG_DOUBLE: ("d", 8),
+}
+_SCALAR_STRUCTS = {tag: Struct(">" + fmt) for tag, (fmt, _) in _NUMERIC.items()}
+_SIZES = {tag: size for tag, (_, size) in _NUMERIC.items()}
+
+# array tag id → element tag id
+_ARRAY_ITEMS = {
+    TAG_BYTE_ARRAY: TAG_BYTE,
+    TAG_INT_ARRAY: TAG_INT,
+    TAG_LONG_ARRAY: TAG_LONG,
+}
+
+_USHORT = Struct(">H")
+_INT = Struct(">i")
+_unpack_ushort = _USHORT.unpack_from
+_unpack_int = _INT.unpack_from
+
+Buffer = bytes | bytearray | memoryview
+
+# A compiled field projection: each key maps to either True (keep the whole
+# subtree) or a nested projection. Lists are transparent, a projection on a
+# list applies to each of its elements.
+Projection = Dict[str, Union[bool, "Projection"]]
+
+
+def _read_numbers(tag_id: int, count: int, buf: Buffer, pos: int) -> Tuple[list, int]:
+    """Read count fixed width values of one type with a single unpack"""
+    fmt, size = _NUMERIC[tag_id]
+    if count <= 0:
+        return [], pos
+    return list(unpack_from(f">{count}{fmt}", buf, pos)), pos + count * size
+
+
+def _read_payload(tag_id: int, buf: Buffer, pos: int) -> Tuple[Any, int]:
+    """Decode the payload of a tag_id tag starting at pos, returning (value, next pos)"""
+    if tag_id == TAG_COMPOUND:
+        compound: Dict[str, Any] = {}
+        while True:
+            child_id = buf[pos]
+            if child_id == TAG_END:
+                return compound, pos + 1
+
+            (length,) = _unpack_ushort(buf, pos + 1)
+            pos += 3 + length
+            name = str(buf[pos - length : pos], "utf-8", "replace")
+
+            # Strings and numbers are decoded inline, they make up most tags
+            if child_id == TAG_STRING:
+                (length,) = _unpack_ushort(buf, pos)
+                pos += 2 + length
+                compound[name] = str(buf[pos - length : pos], "utf-8", "replace")
+            elif child_id in _SCALAR_STRUCTS:
+                scalar = _SCALAR_STRUCTS[child_id]
+                compound[name] = scalar.unpack_from(buf, pos)[0]
+                pos += scalar.size
+            else:
+                compound[name], pos = _read_payload(child_id, buf, pos)
+
+    if tag_id == TAG_STRING:
+        (length,) = _unpack_ushort(buf, pos)
+        pos += 2 + length
+        return str(buf[pos - length : pos], "utf-8", "replace"), pos
+
+    scalar = _SCALAR_STRUCTS.get(tag_id)
+    if scalar is not None:
+        return scalar.unpack_from(buf, pos)[0], pos + scalar.size
+
+    if tag_id == TAG_LIST:
+        item_id = buf[pos]
+        (count,) = _unpack_int(buf, pos + 1)
+        pos += 5
+
+        if item_id in _NUMERIC:
+            return _read_numbers(item_id, count, buf, pos)
+
+        items = []
+        if item_id == TAG_STRING:
+            for _ in range(count):
+                (length,) = _unpack_ushort(buf, pos)
+                pos += 2 + length
+                items.append(str(buf[pos - length : pos], "utf-8", "replace"))
+            return items, pos
+
+        for _ in range(count):
+            item, pos = _read_payload(item_id, buf, pos)
+            items.append(item)
+        return items, pos
+
+    if tag_id in _ARRAY_ITEMS:
+        (count,) = _unpack_int(buf, pos)
+        return _read_numbers(_ARRAY_ITEMS[tag_id], count, buf, pos + 4)
+
+    raise ValueError(f"Unknown NBT tag id {tag_id} at offset {pos}")
+
+
+def _skip_payload(tag_id: int, buf: Buffer, pos: int) -> int:
+    """Return the position just past a tag_id payload without decoding it"""
+    if tag_id == TAG_COMPOUND:
+        while True:
+            child_id = buf[pos]
+            if child_id == TAG_END:
+                return pos + 1
+            (length,) = _unpack_ushort(buf, pos + 1)
+            pos += 3 + length
+            if child_id == TAG_STRING:
+                pos += 2 + _unpack_ushort(buf, pos)[0]
+            elif child_id in _SIZES:
+                pos += _SIZES[child_id]
+            else:
+                pos = _skip_payload(child_id, buf, pos)
+
+    if tag_id == TAG_STRING:
+        return pos + 2 + _unpack_ushort(buf, pos)[0]
+
+    if tag_id in _SIZES:
+        return pos + _SIZES[tag_id]
+
+    if tag_id == TAG_LIST:
+        item_id = buf[pos]
+        (count,) = _unpack_int(buf, pos + 1)
+        pos += 5
+        if item_id in _SIZES:
+            return pos + max(count, 0) * _SIZES[item_id]
+        if item_id == TAG_STRING:
+            for _ in range(count):
+                pos += 2 + _unpack_ushort(buf, pos)[0]
+            return pos
+        for _ in range(count):
+            pos = _skip_payload(item_id, buf, pos)
+        return pos
+
+    if tag_id in _ARRAY_ITEMS:
+        (count,) = _unpack_int(buf, pos)
+        return pos + 4 + max(count, 0) * _SIZES[_ARRAY_ITEMS[tag_id]]
+
+    raise ValueError(f"Unknown NBT tag id {tag_id} at offset {pos}")
+
+
+def _encode_projection(projection: Projection) -> Dict[bytes, Tuple[str, Any]]:
+    """Key a Projection by encoded tag names so they can be matched undecoded"""
+    return {
+        name.encode(): (
+            name,
+            True if selected is True else _encode_projection(selected),
+        )
+        for name, selected in projection.items()
+    }
+
+
+def _read_projected(
+    tag_id: int, buf: Buffer, pos: int, projection: Dict[bytes, Tuple[str, Any]]
+) -> Tuple[Any, int]:
+    """
+    Like _read_payload but only builds the parts selected by an encoded
+    projection. Returns (None, next pos) when nothing under this tag was selected.
+    """
+    if tag_id == TAG_COMPOUND:
+        compound: Dict[str, Any] = {}
+        while True:
+            child_id = buf[pos]
+            if child_id == TAG_END:
+                return (compound or None), pos + 1
+
+            (length,) = _unpack_ushort(buf, pos + 1)
+            pos += 3 + length
+
+            match = projection.get(buf[pos - length : pos])
+            if match is None:
+                pos = _skip_payload(child_id, buf, pos)
+                continue
+
+            name, selected = match
+            if selected is True:
+                compound[name], pos = _read_payload(child_id, buf, pos)
+            else:
+                value, pos = _read_projected(child_id, buf, pos, selected)
+                if value is not None:
+                    compound[name] = value
+
+    if tag_id == TAG_LIST:
+        item_id = buf[pos]
+        (count,) = _unpack_int(buf, pos + 1)
+        if count <= 0:
+            return [], pos + 5
+
+        if item_id in (TAG_COMPOUND, TAG_LIST):
+            pos += 5
+            # Keep one entry per element so list indices (inventory slots) line up
+            items = []
+            for _ in range(count):
+                item, pos = _read_projected(item_id, buf, pos, projection)
+                items.append({} if item is None and item_id == TAG_COMPOUND else item)
+            return items, pos
+
+    # A leaf was reached while the projection still wants to go deeper
+    return None, _skip_payload(tag_id, buf, pos)
+
+
+def compile_fields(fields: Iterable[str]) -> Projection:
+    """
+    Turn dotted paths such as "i.tag.ExtraAttributes.id" into a Projection.
+    A path that is a prefix of another keeps the whole subtree.
+    """
+    projection: Projection = {}
+    for field in fields:
+        parts = field.split(".")
+        if not all(parts):
+            raise ValueError(f"Invalid field path {field!r}")
+
+        node = projection
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[parts[-1]] = True
+
+    return projection
+
+
+def project(value: Any, projection: Projection) -> Any:
+    """Apply a Projection to already decoded data, mirroring _read_projected"""
+    if isinstance(value, list):
+        if not value:
+            return []
+        if not isinstance(value[0], (dict, list)):
+            return None
+        projected = [project(item, projection) for item in value]
+        return [
+            {} if item is None and isinstance(original, dict) else item
+            for item, original in zip(projected, value)
+        ]
+
+    if not isinstance(value, dict):
+        return None
+
+    compound: Dict[str, Any] = {}
+    for name, selected in projection.items():
+        if name not in value:
+            continue
+        if selected is True:
+            compound[name] = value[name]
+        else:
+            child = project(value[name], selected)
+            if child is not None:
+                compound[name] = child
+    return compound or None
+
+
+def decode_nbt(
+    data: Buffer, fields: Optional[Iterable[str] | Projection] = None
+) -> Dict[str, Any]:
+    """
+    Decode uncompressed, big-endian NBT into plain Python objects in one pass.
+
+    Compounds become dicts, lists and arrays become lists, numbers become
+    int/float and strings str. The root compound's name is dropped and its
+    contents returned, like nbtlib.File.
+
+    fields restricts decoding to the given dotted paths (see compile_fields);
+    everything else is skipped over without creating Python objects.
+    """
+    projection = None
+    if fields is not None:
+        projection = fields if isinstance(fields, dict) else compile_fields(fields)
+
+    if not isinstance(data, bytes):
+        # Slices of the buffer are used as dict keys, so it must be hashable;
+        # a writable memoryview isn't, whatever it views
+        data = bytes(memoryview(data))
+
+    try:
+        if data[0] != TAG_COMPOUND:
+            raise ValueError(f"Non-Compound root tags is not supported: {data[0]}")
+
+        (length,) = _unpack_ushort(data, 1)
+        if projection is None:
+            root, _ = _read_payload(TAG_COMPOUND, data, 3 + length)
+        else:
+            encoded = _encode_projection(projection)
+            root, _ = _read_projected(TAG_COMPOUND, data, 3 + length, encoded)
+    except (IndexError, StructError) as exc:
+        raise ValueError("Truncated or malformed NBT data") from exc
+
+    return root or {}
@@ -0,0 +1,184 @@
+import atexit
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, List, Literal, Optional, Sequence, Tuple
+
+from .NBT import JsonType, _nbt_to_json
+
+Strategy = Literal["inline", "threads", "processes"]
+
+# Below this many base64 characters in total a batch is decoded inline, the
+# cost of handing it to another worker is larger than the work itself
+DEFAULT_INLINE_THRESHOLD = 256 * 1024
+# Batches at least this large are worth shipping to worker processes
+DEFAULT_PROCESS_THRESHOLD = 2 * 1024 * 1024
+# Each worker gets about this many chunks so uneven blobs still balance out
+CHUNKS_PER_WORKER = 2
+
+
+def _free_threaded() -> bool:
+    """True on a free-threaded (no GIL) CPython build"""
+    is_gil_enabled: Optional[Callable[[], bool]] = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _decode_chunk(blobs: Sequence[str]) -> List[JsonType]:
+    return [_nbt_to_json(blob) for blob in blobs]
+
+
+def _decode_chunk_timed(blobs: Sequence[str]) -> List[Tuple[JsonType, float]]:
+    """_decode_chunk that also reports how long each blob took, where it ran"""
+    results = []
+    for blob in blobs:
+        start = perf_counter()
+        results.append((_nbt_to_json(blob), perf_counter() - start))
+    return results
+
+
+def _chunk(blobs: Sequence[str], chunks: int) -> List[List[int]]:
+    """Split blob indices into roughly equal sized groups, largest blobs first"""
+    chunks = max(min(chunks, len(blobs)), 1)
+    groups: List[List[int]] = [[] for _ in range(chunks)]
+    sizes = [0] * chunks
+
+    for index in sorted(range(len(blobs)), key=lambda i: -len(blobs[i])):
+        smallest = sizes.index(min(sizes))
+        groups[smallest].append(index)
+        sizes[smallest] += len(blobs[index])
+
+    return [group for group in groups if group]
+
+
+class NBTExecutor:
+    """
+    Process-wide, reusable worker pool for decoding batches of NBT blobs.
+
+    Every batch picks its own strategy: small batches are decoded inline,
+    free-threaded builds use threads, and large batches go to a persistent
+    process pool in size balanced chunks so IPC overhead stays low. Pools are
+    created on first use and reused until shutdown().
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        process_threshold: int = DEFAULT_PROCESS_THRESHOLD,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.inline_threshold = inline_threshold
+        self.process_threshold = process_threshold
+
+        self._lock = Lock()
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._pid = os.getpid()
+
+    def __repr__(self) -> str:
+        return (
+            f"<NBTExecutor max_workers={self.max_workers} "
+            f"threads={self._threads is not None} "
+            f"processes={self._processes is not None}>"
+        )
+
+    def strategy(self, blobs: Sequence[str]) -> Strategy:
+        total = sum(len(blob) for blob in blobs)
+        if len(blobs) < 2 or self.max_workers < 2 or total < self.inline_threshold:
+            return "inline"
+        if _free_threaded():
+            return "threads"
+        if total >= self.process_threshold:
+            return "processes"
+        return "inline"
+
+    def _pool(self, strategy: Strategy) -> Executor:
+        with self._lock:
+            # A forked child can't use the parent's workers
+            if self._pid != os.getpid():
+                self._threads = self._processes = None
+                self._pid = os.getpid()
+
+            if strategy == "threads":
+                if self._threads is None:
+                    self._threads = ThreadPoolExecutor(self.max_workers)
+                return self._threads
+
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(self.max_workers)
+            return self._processes
+
+    def map(
+        self,
+        blobs: Sequence[str],
+        strategy: Optional[Strategy] = None,
+        *,
+        timed: bool = False,
+    ) -> List[Any]:
+        """
+        Decode every blob, returning results in the same order. With
+        timed=True each result is a (decoded, seconds spent decoding) pair.
+        """
+        decode = _decode_chunk_timed if timed else _decode_chunk
+        blobs = list(blobs)
+        strategy = strategy or self.strategy(blobs)
+        if strategy == "inline" or not blobs:
+            return decode(blobs)
+
+        groups = _chunk(blobs, self.max_workers * CHUNKS_PER_WORKER)
+        chunks = [[blobs[index] for index in group] for group in groups]
+
+        try:
+            decoded = list(self._pool(strategy).map(decode, chunks))
+        except BrokenProcessPool:
+            # A worker died, start over with a fresh pool next time
+            with self._lock:
+                self._processes = None
+            raise
+
+        results: List[Any] = [None] * len(blobs)
+        for group, values in zip(groups, decoded):
+            for index, value in zip(group, values):
+                results[index] = value
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            for pool in (self._threads, self._processes):
+                if pool is not None:
+                    pool.shutdown(wait=wait)
+            self._threads = self._processes = None
+
+
+_default_executor: Optional[NBTExecutor] = None
+_default_executor_lock = Lock()
+
+
+def get_executor() -> NBTExecutor:
+    """Return the NBTExecutor shared by every Inventory"""
+    global _default_executor
+
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = NBTExecutor()
+            atexit.register(_default_executor.shutdown, False)
+        return _default_executor
+
+
+def configure_executor(**options: Any) -> NBTExecutor:
+    """
+    Replace the shared executor with one built from options (max_workers,
+    inline_threshold, process_threshold). The old pools are shut down.
+    """
+    global _default_executor
+
+    executor = NBTExecutor(**options)
+    with _default_executor_lock:
+        previous, _default_executor = _default_executor, executor
+    if previous is not None:
+        previous.shutdown(wait=False)
+    atexit.register(executor.shutdown, False)
+    return executor
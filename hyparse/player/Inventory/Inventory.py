@@ -1,8 +1,13 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional
 from json import dumps
-from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
 
+from ...cache import get_nbt_cache
+from ...tracing import get_tracer, record, stage
 from .NBT import JsonType, _nbt_to_json, _get_nested
+from .Decoder import compile_fields, project
+from .Executor import get_executor
+from .ItemIndex import INDEX_FIELDS, ItemIndex, ItemRecord
 
 
 class Inventory:
@@ -13,6 +18,7 @@ class Inventory:
 
         # Prepare parsed cache, but don’t fill it until needed (unless eager)
         self._parsed_nbt: Dict[str, Any] = {}
+        self._item_index: Optional[ItemIndex] = None
 
         if not self.lazy_load:
             # eager: parse everything up front
@@ -46,6 +52,10 @@ class Inventory:
         if not isinstance(other, Inventory):
             return NotImplemented
 
+        # Identical raw blobs decode to identical sections
+        if self.inventory == other.inventory:
+            return True
+
         # force-evaluate both sides
         self.load_all()
         other.load_all()
@@ -60,8 +70,8 @@ class Inventory:
     def items(self):
         return ((k, self[k]) for k in self.inventory.keys())
 
-    def _batch_parse_nbt(self) -> Dict[str, Any]:
-        # build a list of all the dotted keys we want
+    def _section_paths(self) -> List[List[str]]:
+        """Paths of every NBT section, including each backpack_contents.<idx>"""
         static_paths = [
             ["inv_contents"],
             ["ender_chest_contents"],
@@ -80,26 +90,76 @@ class Inventory:
         if isinstance(bc, dict):
             for idx in bc:
                 static_paths.append(["backpack_contents", str(idx)])
+        return static_paths
 
-        # gather (key → base64‑blob)
+    def _batch_parse_nbt(self) -> Dict[str, Any]:
+        # gather (key → base64‑blob) of every section not decoded yet
         tasks: Dict[str, str] = {}
-        for path in static_paths:
+        for path in self._section_paths():
             blob = _get_nested(self.inventory, path + ["data"], "")
             key = "/".join(path)
+            if key in self._parsed_nbt:
+                continue
             if isinstance(blob, str) and blob:
                 tasks[key] = blob
             else:
                 self._parsed_nbt[key] = {}
 
-        # parallel decode
+        # sections decoded before, by any Inventory, come from the cache
+        cache = get_nbt_cache()
+        if cache is not None:
+            for key, blob in list(tasks.items()):
+                start = perf_counter()
+                cached = cache.get(blob)
+                if cached is not None:
+                    duration = perf_counter() - start
+                    record("nbt_to_json", duration, key, len(blob), cache_hit=True)
+                    self._parsed_nbt[key] = cached
+                    del tasks[key]
+
+        # decode the rest inline or in parallel, depending on how much there is
         if tasks:
-            with ProcessPoolExecutor() as exe:
-                results = exe.map(_nbt_to_json, tasks.values())
-                for key, res in zip(tasks, results):
-                    self._parsed_nbt[key] = res
+            # Workers time each section themselves when someone is tracing
+            timed = get_tracer() is not None
+            results = get_executor().map(list(tasks.values()), timed=timed)
+            for (key, blob), res in zip(tasks.items(), results):
+                if timed:
+                    res, duration = res
+                    record("nbt_to_json", duration, key, len(blob), cache_hit=False)
+                self._parsed_nbt[key] = res
+                if cache is not None:
+                    cache.set(blob, res)
 
         return self._parsed_nbt
 
+    def update(self, skyblock_data: Dict[str, Any]) -> List[str]:
+        """
+        Switch to a newer copy of the member's data. Sections whose raw blob
+        is unchanged keep their decoded form, the others are dropped and
+        decoded again on next use (right away when eager). Returns the keys
+        of the sections that changed.
+        """
+        previous = self.inventory
+        # Backpacks can come and go, so look at the sections of both versions
+        paths = {"/".join(path): path for path in self._section_paths()}
+        self.inventory = skyblock_data.get("inventory", {})
+        paths.update(("/".join(path), path) for path in self._section_paths())
+
+        changed = [
+            key
+            for key, path in paths.items()
+            if _get_nested(previous, path + ["data"], "")
+            != _get_nested(self.inventory, path + ["data"], "")
+        ]
+
+        for key in changed:
+            self._parsed_nbt.pop(key, None)
+        if changed:
+            self._item_index = None
+            if not self.lazy_load:
+                self._batch_parse_nbt()
+        return changed
+
     def _get_nbt_json(self, *path: str) -> JsonType:
         """
         Return the JSON for inventory[path].data, caching it.
@@ -107,9 +167,74 @@ class Inventory:
         key = "/".join(path)
         if key not in self._parsed_nbt:
             blob = _get_nested(self.inventory, list(path) + ["data"], "")
-            self._parsed_nbt[key] = _nbt_to_json(blob)
+            self._parsed_nbt[key] = self._decode(key, blob)
         return self._parsed_nbt[key]
 
+    @staticmethod
+    def _decode(key: str, blob: str) -> JsonType:
+        """Decode a blob, going through the shared NBTCache when there is one"""
+        with stage("nbt_to_json", key) as span:
+            span.bytes = len(blob)
+            cache = get_nbt_cache()
+            if cache is None or not blob:
+                return _nbt_to_json(blob)
+
+            decoded = cache.get(blob)
+            span.cache_hit = decoded is not None
+            if decoded is None:
+                decoded = _nbt_to_json(blob)
+                cache.set(blob, decoded)
+            return decoded
+
+    def select(self, section: str, fields: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Return only the given fields of every slot in a section.
+
+        section is a raw inventory key, with "/" between nested keys
+        (e.g. "inv_contents" or "backpack_contents/3"). fields are dotted
+        paths inside a slot such as "tag.ExtraAttributes.id" or "Count".
+        Slots keep their index; empty or unmatched slots become {}. Sections
+        that aren't decoded or cached yet are read with everything else skipped.
+        """
+        path = section.split("/")
+        key = "/".join(path)
+        projection = compile_fields(f"i.{field}" for field in fields)
+
+        blob = _get_nested(self.inventory, path + ["data"], "")
+        cache = get_nbt_cache()
+        decoded = self._parsed_nbt.get(key)
+        if decoded is None and cache is not None and blob:
+            decoded = cache.get(blob)
+
+        if decoded is not None:
+            selected = project(decoded, projection) or {}
+        else:
+            selected = _nbt_to_json(blob, projection)
+
+        return selected.get("i", [])
+
+    def item_index(self) -> ItemIndex:
+        """
+        The ItemIndex of every section, built on first use. Sections that
+        aren't decoded yet are only read for the fields the index needs.
+        """
+        if self._item_index is None:
+            sections = ("/".join(path) for path in self._section_paths())
+            self._item_index = ItemIndex.from_sections(
+                (section, self.select(section, INDEX_FIELDS)) for section in sections
+            )
+        return self._item_index
+
+    def find_items(
+        self, id: Optional[str] = None, *, uuid: Optional[str] = None
+    ) -> List[ItemRecord]:
+        """Where items with this id and/or uuid are, see ItemIndex.find_items"""
+        return self.item_index().find_items(id, uuid=uuid)
+
+    def count(self, id: str) -> int:
+        """Total stack size of an item id across every section"""
+        return self.item_index().count(id)
+
     # ──────────────────────────────── @property functions ────────────────────────────────
     @property
     def player_inventory(self):
@@ -0,0 +1,137 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Everything the index needs from a slot, see Inventory.select()
+INDEX_FIELDS = ("Count", "tag.ExtraAttributes.id", "tag.ExtraAttributes.uuid")
+
+
+class ItemRecord(NamedTuple):
+    section: str
+    slot: int
+    item_id: str
+    count: int
+    uuid: Optional[str]
+
+
+class ItemIndex:
+    """
+    Flat, columnar table of every SkyBlock item in an inventory.
+
+    Each row is one occupied slot: (section, slot, item id, count, uuid),
+    stored column by column. Rows are looked up through hash maps on item id
+    and uuid, and per-id totals are summed while building, so find_items()
+    and count() don't walk any NBT. Slots without an ExtraAttributes id
+    (empty slots, plain vanilla items) are left out.
+    """
+
+    __slots__ = (
+        "sections",
+        "_section",
+        "slots",
+        "item_ids",
+        "counts",
+        "uuids",
+        "_by_id",
+        "_by_uuid",
+        "_totals",
+    )
+
+    def __init__(self) -> None:
+        self.sections: List[str] = []
+        # Row → index into sections
+        self._section = array("H")
+        self.slots = array("i")
+        self.item_ids: List[str] = []
+        self.counts = array("i")
+        self.uuids: List[Optional[str]] = []
+
+        self._by_id: Dict[str, List[int]] = {}
+        self._by_uuid: Dict[str, List[int]] = {}
+        self._totals: Dict[str, int] = {}
+
+    @classmethod
+    def from_sections(
+        cls, sections: Iterable[Tuple[str, List[Dict[str, Any]]]]
+    ) -> "ItemIndex":
+        """Build an index from (section key, slots) pairs"""
+        index = cls()
+        for section, slots in sections:
+            index.add_section(section, slots)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    def __getitem__(self, row: int) -> ItemRecord:
+        return ItemRecord(
+            self.sections[self._section[row]],
+            self.slots[row],
+            self.item_ids[row],
+            self.counts[row],
+            self.uuids[row],
+        )
+
+    def __iter__(self) -> Iterator[ItemRecord]:
+        return (self[row] for row in range(len(self)))
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._by_id
+
+    def __repr__(self) -> str:
+        return (
+            f"<ItemIndex items={len(self)} distinct={len(self._by_id)} "
+            f"sections={len(self.sections)}>"
+        )
+
+    def add_section(self, section: str, slots: List[Dict[str, Any]]) -> None:
+        """Append every item of one decoded (or selected) section"""
+        section_code = len(self.sections)
+        self.sections.append(section)
+
+        for slot, item in enumerate(slots):
+            extra = item.get("tag", {}).get("ExtraAttributes", {}) if item else {}
+            item_id = extra.get("id")
+            if not isinstance(item_id, str):
+                continue
+
+            count = item.get("Count", 1)
+            uuid = extra.get("uuid")
+            row = len(self.item_ids)
+
+            self._section.append(section_code)
+            self.slots.append(slot)
+            self.item_ids.append(item_id)
+            self.counts.append(count)
+            self.uuids.append(uuid)
+
+            self._by_id.setdefault(item_id, []).append(row)
+            self._totals[item_id] = self._totals.get(item_id, 0) + count
+            if uuid is not None:
+                self._by_uuid.setdefault(uuid, []).append(row)
+
+    def ids(self) -> List[str]:
+        """Every distinct item id, in order of first appearance"""
+        return list(self._by_id)
+
+    def find_items(
+        self, id: Optional[str] = None, *, uuid: Optional[str] = None
+    ) -> List[ItemRecord]:
+        """
+        Every item with this id and/or uuid, in section and slot order.
+        Without either, every indexed item.
+        """
+        if id is None and uuid is None:
+            return list(self)
+
+        if uuid is None:
+            rows = self._by_id.get(id, [])
+        else:
+            rows = self._by_uuid.get(uuid, [])
+            if id is not None:
+                rows = [row for row in rows if self.item_ids[row] == id]
+
+        return [self[row] for row in rows]
+
+    def count(self, id: str) -> int:
+        """Total stack size of an item id across every section"""
+        return self._totals.get(id, 0)
@@ -1,13 +1,14 @@
 import operator
 from base64 import b64decode
-from typing import Union, List, Dict, Any, Tuple, Deque
+from typing import Union, List, Dict, Any, Tuple, Deque, Optional
 from gzip import decompress
 from collections import deque
 
-from nbtlib import File
 from io import BytesIO
 from functools import reduce
 
+from .Decoder import Projection, decode_nbt
+
 JsonType = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
 
 
@@ -64,7 +65,24 @@ def _convert_nbt_tag(tag: Any) -> Any:
     return root
 
 
-def _nbt_to_json(nbt_data: str) -> JsonType:
+def _nbt_to_json(nbt_data: str, fields: Optional[Projection] = None) -> JsonType:
+    if not nbt_data:
+        return {}
+
+    decoded = b64decode(nbt_data)
+    decompressed = decompress(decoded)
+    return decode_nbt(decompressed, fields)
+
+
+def _nbt_to_json_nbtlib(nbt_data: str) -> JsonType:
+    """
+    Reference decoder that builds an nbtlib tag tree and converts it.
+
+    Kept for comparison with decode_nbt, which reads the same bytes without
+    materializing nbtlib objects.
+    """
+    from nbtlib import File
+
     if not nbt_data:
         return {}
 
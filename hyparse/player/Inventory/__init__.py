@@ -1,3 +1,29 @@
-from .Inventory import Inventory
+from typing import TYPE_CHECKING
 
-__all__ = ["Inventory"]
+from ...utils import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Inventory": ".Inventory",
+        "NBTExecutor": ".Executor",
+        "configure_executor": ".Executor",
+        "get_executor": ".Executor",
+        "ItemIndex": ".ItemIndex",
+        "ItemRecord": ".ItemIndex",
+    },
+)
+
+if TYPE_CHECKING:
+    from .Inventory import Inventory
+    from .Executor import NBTExecutor, configure_executor, get_executor
+    from .ItemIndex import ItemIndex, ItemRecord
+
+__all__ = [
+    "Inventory",
+    "NBTExecutor",
+    "configure_executor",
+    "get_executor",
+    "ItemIndex",
+    "ItemRecord",
+]
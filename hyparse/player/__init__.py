@@ -1,3 +1,29 @@
-from .Inventory.Inventory import Inventory
+from typing import TYPE_CHECKING
 
-__all__ = ["Inventory"]
+from ..utils import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Inventory": ".Inventory.Inventory",
+        "NBTExecutor": ".Inventory.Executor",
+        "configure_executor": ".Inventory.Executor",
+        "get_executor": ".Inventory.Executor",
+        "ItemIndex": ".Inventory.ItemIndex",
+        "ItemRecord": ".Inventory.ItemIndex",
+    },
+)
+
+if TYPE_CHECKING:
+    from .Inventory.Inventory import Inventory
+    from .Inventory.Executor import NBTExecutor, configure_executor, get_executor
+    from .Inventory.ItemIndex import ItemIndex, ItemRecord
+
+__all__ = [
+    "Inventory",
+    "NBTExecutor",
+    "configure_executor",
+    "get_executor",
+    "ItemIndex",
+    "ItemRecord",
+]
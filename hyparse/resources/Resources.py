@@ -0,0 +1,260 @@
+import json
+from os import PathLike
+from threading import Lock
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, NamedTuple, Optional, Tuple
+from typing import TypedDict
+
+import requests
+
+from ..cache import DiskCache
+from ..exceptions import ResourceUnavailable
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+# Resource endpoints used by hyparse, any other name under base_url works too
+RESOURCES = ("skills", "collections", "items")
+
+# Part of every disk cache key, bump it when the entry layout changes so
+# older entries are ignored instead of misread
+CACHE_VERSION = 1
+
+# Resources change with game updates, so an hour old copy is used as is
+DEFAULT_MAX_AGE = 60 * 60.0
+
+
+class Resource(NamedTuple):
+    """
+    A resource endpoint's response, with the validators it was served with.
+
+    source tells where it came from: "network" (downloaded), "not_modified"
+    (revalidated, Hypixel answered 304), "cache" (fresh enough to not ask)
+    or "stale" (Hypixel couldn't be reached, the cached copy was used).
+    """
+
+    name: str
+    data: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    source: str
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.data.get("version")
+
+    @property
+    def last_updated(self) -> Optional[int]:
+        """When Hypixel last changed the resource, in milliseconds"""
+        return self.data.get("lastUpdated")
+
+
+class ResourceStats(TypedDict):
+    requests: int
+    downloaded: int
+    not_modified: int
+    stale: int
+
+
+class Resources:
+    """
+    Hypixel's SkyBlock resource endpoints (skills, collections, items...).
+
+    A resource younger than max_age seconds is used as is. An older one is
+    revalidated with If-None-Match and If-Modified-Since, which Hypixel
+    answers with an empty 304 when nothing changed. If Hypixel can't be
+    reached, or answers with an error, the last copy is used however old it
+    is; ResourceUnavailable is raised only when there is none. offline=True
+    never makes a request.
+
+    Copies are kept in memory, and in a sqlite file when cache_path is given
+    so they (and their validators) survive restarts. No API key is needed.
+    """
+
+    base_url = "https://api.hypixel.net/v2/resources/skyblock"
+
+    def __init__(
+        self,
+        cache_path: Optional[str | PathLike[str]] = None,
+        *,
+        client: Optional["Client"] = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        offline: bool = False,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        self.max_age = max_age
+        self.offline = offline
+        self.disk = DiskCache(cache_path, clock=clock) if cache_path else None
+        self._client = client
+        self._clock = clock
+        self._resources: Dict[str, Resource] = {}
+        self._lock = Lock()
+        self._stats: ResourceStats = {
+            "requests": 0,
+            "downloaded": 0,
+            "not_modified": 0,
+            "stale": 0,
+        }
+
+    def __repr__(self) -> str:
+        tiers = "memory+disk" if self.disk is not None else "memory"
+        return f"<Resources tiers={tiers} loaded={sorted(self._resources)}>"
+
+    def __enter__(self) -> "Resources":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def client(self) -> "Client":
+        if self._client is None:
+            from ..client import get_default_client
+
+            self._client = get_default_client()
+        return self._client
+
+    def stats(self) -> ResourceStats:
+        with self._lock:
+            return {**self._stats}
+
+    # ───────────────────────────────────── cache ─────────────────────────────────────
+    @staticmethod
+    def _key(name: str) -> str:
+        return f"resources/v{CACHE_VERSION}/{name}"
+
+    def _cached(self, name: str) -> Optional[Resource]:
+        resource = self._resources.get(name)
+        if resource is not None or self.disk is None:
+            return resource
+
+        entry = self.disk.get(self._key(name))
+        if entry is None:
+            return None
+
+        # A line of metadata, then the body exactly as Hypixel sent it
+        meta, _, body = entry[0].partition(b"\n")
+        try:
+            validators = json.loads(meta)
+            data = json.loads(body)
+        except ValueError:
+            return None
+
+        resource = Resource(
+            name,
+            data,
+            validators["etag"],
+            validators["last_modified"],
+            validators["fetched_at"],
+            "cache",
+        )
+        self._resources[name] = resource
+        return resource
+
+    def _store(self, resource: Resource, body: Optional[bytes] = None) -> Resource:
+        self._resources[resource.name] = resource
+        if self.disk is None:
+            return resource
+
+        if body is None:
+            # Revalidated, only the metadata changed
+            entry = self.disk.get(self._key(resource.name))
+            if entry is None:
+                return resource
+            body = entry[0].partition(b"\n")[2]
+
+        meta = {
+            "etag": resource.etag,
+            "last_modified": resource.last_modified,
+            "fetched_at": resource.fetched_at,
+        }
+        self.disk.set(
+            self._key(resource.name), json.dumps(meta).encode() + b"\n" + body
+        )
+        return resource
+
+    # ───────────────────────────────────── fetching ────────────────────────────────────
+    def get(self, name: str, *, revalidate: bool = False) -> Resource:
+        """
+        The resource called name, e.g. "skills". revalidate=True asks
+        Hypixel whether it changed even if the copy is younger than max_age.
+        """
+        with self._lock:
+            cached = self._cached(name)
+            if cached is not None and (
+                self.offline
+                or (not revalidate and self._clock() - cached.fetched_at < self.max_age)
+            ):
+                return cached._replace(source="cache")
+            if self.offline:
+                raise ResourceUnavailable(f"No cached copy of resource {name!r}")
+            self._stats["requests"] += 1
+
+        return self._fetch(name, cached)
+
+    def _fetch(self, name: str, cached: Optional[Resource]) -> Resource:
+        headers: Dict[str, str] = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        # The request is made without the lock, so other threads can read
+        # what is cached meanwhile; the lock is only taken to store the result
+        try:
+            response = self.client.get(f"{self.base_url}/{name}", headers=headers)
+            update = self._read(name, cached, response)
+        except requests.RequestException as error:
+            update = f"{type(error).__name__}: {error}"
+
+        with self._lock:
+            if not isinstance(update, str):
+                resource, body = update
+                self._stats["downloaded" if body is not None else "not_modified"] += 1
+                return self._store(resource, body)
+            if cached is None:
+                raise ResourceUnavailable(
+                    f"Could not fetch resource {name!r}: {update}"
+                )
+
+            self._stats["stale"] += 1
+            return cached._replace(source="stale")
+
+    def _read(
+        self, name: str, cached: Optional[Resource], response: requests.Response
+    ) -> Tuple[Resource, Optional[bytes]] | str:
+        """
+        The resource response says name is now, with the body to store (None
+        if it didn't change), or why it can't be used
+        """
+        now = self._clock()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if response.status_code == 304 and cached is not None:
+            resource = cached._replace(
+                etag=etag or cached.etag,
+                last_modified=last_modified or cached.last_modified,
+                fetched_at=now,
+                source="not_modified",
+            )
+            return resource, None
+
+        if response.status_code != 200:
+            return f"status {response.status_code}"
+        try:
+            data = json.loads(response.content)
+        except ValueError:
+            return "response is not JSON"
+        if not isinstance(data, dict) or not data.get("success"):
+            return "response was not successful"
+
+        return (
+            Resource(name, data, etag, last_modified, now, "network"),
+            response.content,
+        )
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
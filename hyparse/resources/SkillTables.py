@@ -0,0 +1,65 @@
+from typing import Any, Dict, Optional
+
+from ..exceptions import ResourceUnavailable
+from ..levels import LevelTable, set_level_tables
+from ..levels.Levels import OVERFLOW_XP
+from .Resources import Resources
+
+
+def compile_skill_tables(skills: Dict[str, Any]) -> Dict[str, LevelTable]:
+    """
+    Level tables from the skills resource: one per skill, named like the
+    experience keys of member data ("SKILL_RUNECRAFTING") so getSkillLevel
+    and PlayerTable find them, and "Skills", the curve of the skill with the
+    most levels, for skills the resource doesn't list.
+    Raises ValueError if the resource isn't shaped as expected.
+    """
+    tables: Dict[str, LevelTable] = {}
+    for key, skill in skills.get("skills", {}).items():
+        levels = sorted(skill.get("levels", []), key=lambda level: level["level"])
+        cumulative_xp = [float(level["totalExpRequired"]) for level in levels]
+        if not cumulative_xp:
+            continue
+
+        xp_required = [
+            total - previous
+            for previous, total in zip([0.0] + cumulative_xp, cumulative_xp)
+        ]
+        if min(xp_required) <= 0:
+            raise ValueError(f"Skill {key!r} has levels that cost no xp")
+
+        name = f"SKILL_{key}"
+        tables[name] = LevelTable(name, xp_required, cumulative_xp)
+
+    if not tables:
+        raise ValueError("Skills resource has no level curves")
+
+    longest = max(tables.values(), key=len)
+    tables["Skills"] = LevelTable(
+        "Skills", longest.xp_required, longest.cumulative_xp, OVERFLOW_XP["Skills"]
+    )
+    return tables
+
+
+def update_level_tables(
+    resources: Optional[Resources] = None, *, revalidate: bool = False
+) -> str:
+    """
+    Look skill levels up in curves compiled from Hypixel's skills resource,
+    so they follow game updates without a new hyparse release. Catacombs
+    keep the bundled curve, which the resource doesn't have.
+
+    Without a cached or downloadable copy, or if it can't be compiled, the
+    bundled levels.json is used. Returns where the curves came from: the
+    Resource's source, or "bundled".
+    """
+    resources = resources if resources is not None else Resources()
+    try:
+        resource = resources.get("skills", revalidate=revalidate)
+        tables = compile_skill_tables(resource.data)
+    except (ResourceUnavailable, ValueError, KeyError, TypeError):
+        set_level_tables(None)
+        return "bundled"
+
+    set_level_tables(tables)
+    return resource.source
@@ -0,0 +1,18 @@
+from .Resources import (
+    CACHE_VERSION,
+    RESOURCES,
+    Resource,
+    Resources,
+    ResourceStats,
+)
+from .SkillTables import compile_skill_tables, update_level_tables
+
+__all__ = [
+    "CACHE_VERSION",
+    "RESOURCES",
+    "Resource",
+    "Resources",
+    "ResourceStats",
+    "compile_skill_tables",
+    "update_level_tables",
+]
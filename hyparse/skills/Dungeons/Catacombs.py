@@ -1,12 +1,32 @@
-from typing import Any, Dict
+from typing import Any, Dict, NamedTuple, Optional
 from json import dumps
 from datetime import timedelta
-from concurrent.futures import ThreadPoolExecutor
+
+
+class FloorStats(NamedTuple):
+    """One floor of Catacombs.format_data(compact=True)"""
+
+    completions: Optional[int]
+    fastest_time: Optional[str]
+    fastest_time_s: Optional[str]
+    fastest_time_s_plus: Optional[str]
+    best_score: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "completions": self.completions,
+            "fastest_time": self.fastest_time,
+            "fastest_time_s": self.fastest_time_s,
+            "fastest_time_s_plus": self.fastest_time_s_plus,
+            "best_score": self.best_score,
+        }
 
 
 class Catacombs:
     def __init__(self, catacombs: Dict[str, Any]) -> None:
         self._data = catacombs
+        # compact → format_data() result, computed once per form
+        self._formatted: Dict[bool, Dict[int, Any]] = {}
 
     def __str__(self) -> str:
         return dumps(self._data, indent=3)
@@ -30,25 +50,17 @@ class Catacombs:
     def _strip_excess(self, d: Dict[int | str, Any]) -> Dict[int | str, Any]:
         return {k: v for k, v in d.items() if k not in ["total", "best"]}
 
-    def format_data(self) -> Dict[int, Any]:
-        with ThreadPoolExecutor() as executor:
-            futures = {
-                "completions": executor.submit(self._strip_excess, self.completions),
-                "fastest_time": executor.submit(self._strip_excess, self.fastest_time),
-                "fastest_time_s": executor.submit(
-                    self._strip_excess, self.fastest_time_s
-                ),
-                "fastest_time_s_plus": executor.submit(
-                    self._strip_excess, self.fastest_time_s_plus
-                ),
-                "best_score": executor.submit(self._strip_excess, self.best_score),
-            }
+    def format_data(self, compact: bool = False) -> Dict[int, Any]:
+        """Stats per floor, as FloorStats tuples instead of dicts if compact"""
+        formatted = self._formatted.get(compact)
+        if formatted is not None:
+            return formatted
 
-            completions = futures["completions"].result()
-            fastest_time = futures["fastest_time"].result()
-            fastest_time_s = futures["fastest_time_s"].result()
-            fastest_time_s_plus = futures["fastest_time_s_plus"].result()
-            best_score = futures["best_score"].result()
+        completions = self._strip_excess(self.completions)
+        fastest_time = self._strip_excess(self.fastest_time)
+        fastest_time_s = self._strip_excess(self.fastest_time_s)
+        fastest_time_s_plus = self._strip_excess(self.fastest_time_s_plus)
+        best_score = self._strip_excess(self.best_score)
 
         all_keys = (
             set(completions)
@@ -60,6 +72,16 @@ class Catacombs:
 
         formatted_data = {}
         for key in all_keys:
+            if compact:
+                formatted_data[int(key)] = FloorStats(
+                    completions.get(key),
+                    fastest_time.get(key),
+                    fastest_time_s.get(key),
+                    fastest_time_s_plus.get(key),
+                    best_score.get(key),
+                )
+                continue
+
             formatted_data[int(key)] = {
                 "completions": completions.get(key),
                 "fastest_time": fastest_time.get(key),
@@ -68,6 +90,7 @@ class Catacombs:
                 "best_score": best_score.get(key),
             }
 
+        self._formatted[compact] = formatted_data
         return formatted_data
 
     @property
@@ -1,29 +1,54 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from hyparse.levels import getSkillLevel
+from hyparse.tracing import stage
 from .Catacombs import Catacombs
 
 
 class Dungeons:
     def __init__(self, skyblock_data: Dict[str, Any]) -> None:
+        # Computed once and kept, even across rebind()
+        self._cata_level: Optional[Dict[str, Any]] = None
+        self.rebind(skyblock_data)
+
+    def rebind(self, skyblock_data: Dict[str, Any]) -> None:
+        """
+        Read from skyblock_data, a newer copy of the member data with the same
+        dungeons section. Nothing keeps pointing into the old copy; the level,
+        which holds no part of it, is kept.
+        """
         self._data = skyblock_data
         self.dungeon_data = self._get_dungeon_data()
         self.dungeon_types: Dict[str, Any] = self.dungeon_data.get("dungeon_types", {})
+        # Built on first use and kept, like the level
+        self._catacombs: Dict[str, Catacombs] = {}
 
     def _get_dungeon_data(self) -> Dict[str, Any]:
         return self._data.get("dungeons", {})
 
+    def _dungeon_type(self, name: str) -> Catacombs:
+        catacombs = self._catacombs.get(name)
+        if catacombs is None:
+            catacombs = Catacombs(self.dungeon_types.get(name, {}))
+            self._catacombs[name] = catacombs
+        return catacombs
+
     @property
     def catacombs(self) -> Catacombs:
-        return Catacombs(self.dungeon_types.get("catacombs", {}))
+        return self._dungeon_type("catacombs")
 
     @property
     def master_catacombs(self) -> Catacombs:
-        return Catacombs(self.dungeon_types.get("master_catacombs", {}))
+        return self._dungeon_type("master_catacombs")
 
     @property
     def cata_level(self):
+        if self._cata_level is not None:
+            return self._cata_level
+
         catacombs_data: Dict[str, Any] = self.dungeon_types.get("catacombs", {})
         experience: float = catacombs_data.get("experience", 0)
-        level = getSkillLevel(experience, is_catacombs=True)
+        with stage("levels", "catacombs"):
+            level = getSkillLevel(experience, is_catacombs=True)
+        self._cata_level = level
         return level
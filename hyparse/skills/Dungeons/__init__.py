@@ -1,4 +1,14 @@
-from .Dungeons import Dungeons
-from .Catacombs import Catacombs
+from typing import TYPE_CHECKING
 
-__all__ = ["Dungeons", "Catacombs"]
+from ...utils import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {"Dungeons": ".Dungeons", "Catacombs": ".Catacombs", "FloorStats": ".Catacombs"},
+)
+
+if TYPE_CHECKING:
+    from .Dungeons import Dungeons
+    from .Catacombs import Catacombs, FloorStats
+
+__all__ = ["Dungeons", "Catacombs", "FloorStats"]
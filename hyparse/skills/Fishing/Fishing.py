@@ -1,7 +1,14 @@
-from typing import Any, Dict
-from concurrent.futures import ThreadPoolExecutor
-
-trophy_tiers = ["diamond", "gold", "silver", "bronze", None]
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
 
 # Define the suffix→tier-name mapping (empty suffix is "normal")
 tier_suffixes = {
@@ -12,9 +19,107 @@ tier_suffixes = {
     "_diamond": "diamond",
 }
 
+# Tier names from lowest to highest, a tier's position is its rank index
+TIERS: Tuple[str, ...] = tuple(tier_suffixes.values())
+
+# Every trophy fish in the game, in the order Hypixel lists them
+TROPHY_FISH: Tuple[str, ...] = (
+    "sulphur_skitter",
+    "obfuscated_fish_1",
+    "steaming_hot_flounder",
+    "gusher",
+    "blobfish",
+    "obfuscated_fish_2",
+    "slugfish",
+    "flyfish",
+    "obfuscated_fish_3",
+    "lava_horse",
+    "mana_ray",
+    "volcanic_stonefish",
+    "vanille",
+    "skeleton_fish",
+    "moldfin",
+    "soul_fish",
+    "karate_fish",
+    "golden_fish",
+)
+
+# Keys of the trophy_fish section that aren't catch counts
+EXTRA_KEYS = ("last_caught", "rewards", "total_caught")
+
+# "<fish><suffix>" → (fish, tier index) for every fish in the catalog
+_CATALOG: Dict[str, Tuple[str, int]] = {
+    fish + suffix: (fish, tier)
+    for fish in TROPHY_FISH
+    for tier, suffix in enumerate(tier_suffixes)
+}
+_SUFFIX_TIERS = {
+    suffix[1:]: tier for tier, suffix in enumerate(tier_suffixes) if suffix
+}
+
+
+class TrophyCounts(NamedTuple):
+    """Catches of one trophy fish per tier, compact form of Fishing.trophies"""
+
+    normal: int = 0
+    bronze: int = 0
+    silver: int = 0
+    gold: int = 0
+    diamond: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "normal": self.normal,
+            "bronze": self.bronze,
+            "silver": self.silver,
+            "gold": self.gold,
+            "diamond": self.diamond,
+        }
+
+
+class HighestTrophy(NamedTuple):
+    """Best tier caught of one fish, compact form of Fishing.highest_trophies"""
+
+    count: int
+    rank: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "rank": self.rank}
+
+
+class TrophyArrays(TypedDict):
+    fish: List[str]
+    counts: Any
+    highest: Any
+
+
+def _split_key(key: str) -> Optional[Tuple[str, int]]:
+    """(fish, tier index) of a trophy_fish key, None for keys that aren't catches"""
+    known = _CATALOG.get(key)
+    if known is not None:
+        return known
+    if key in EXTRA_KEYS:
+        return None
+
+    # A fish added to the game after this catalog
+    name, _, suffix = key.rpartition("_")
+    if name and suffix in _SUFFIX_TIERS:
+        return name, _SUFFIX_TIERS[suffix]
+    return key, 0
+
 
 class Fishing:
     def __init__(self, skyblock_data: Dict[str, Any]):
+        # fish → (TrophyCounts, HighestTrophy), filled on first use
+        self._aggregate: Optional[Dict[str, Tuple[TrophyCounts, HighestTrophy]]] = None
+        self.rebind(skyblock_data)
+
+    def rebind(self, skyblock_data: Dict[str, Any]) -> None:
+        """
+        Read from skyblock_data, a newer copy of the member data with the same
+        trophy_fish section. Nothing keeps pointing into the old copy; the
+        counts, which hold no part of it, are kept.
+        """
         self._data = skyblock_data
         self._trophy_fishes: Dict[str, int] = skyblock_data.get("trophy_fish", {})
 
@@ -25,62 +130,77 @@ class Fishing:
             "total_caught": self._trophy_fishes.get("total_caught"),
         }
 
-    def _get_highest_trophies(self) -> Dict[str, int]:
+        # (view, compact) → the dicts built from it, also kept once built. They
+        # hold the extra data, so they are rebuilt (from the counts) too
+        self._results: Dict[Tuple[str, bool], Dict[str, Any]] = {}
+
+    def _aggregated(self) -> Dict[str, Tuple[TrophyCounts, HighestTrophy]]:
+        """Per tier counts and best tier of every fish, from one pass over the keys"""
+        if self._aggregate is not None:
+            return self._aggregate
+
+        # fish → [count per tier..., bitmask of the tiers that have a key]
+        rows: Dict[str, List[int]] = {}
+        for key, count in self._trophy_fishes.items():
+            split = _split_key(key)
+            if split is None:
+                continue
+            fish, tier = split
+            row = rows.get(fish)
+            if row is None:
+                row = rows[fish] = [0] * (len(TIERS) + 1)
+            row[tier] = count
+            row[-1] |= 1 << tier
+
+        aggregate = {}
+        for fish, row in rows.items():
+            best = row[-1].bit_length() - 1
+            aggregate[fish] = (
+                TrophyCounts(*row[:-1]),
+                HighestTrophy(row[best], TIERS[best] if best else None),
+            )
+
+        self._aggregate = aggregate
+        return aggregate
+
+    def _get_highest_trophies(self, compact: bool = False) -> Dict[str, Any]:
         # Checks if {} was assigned to trophy_fishes or not
         if not self._trophy_fishes:
             raise ValueError("User has no trophy fishes")
 
-        all_keys = set(self._trophy_fishes)
-
-        # Collect all base fish names
-        base_names = set()
-        for key in all_keys:
-            parts = key.rsplit("_", 1)
-            if parts[-1] in {"diamond", "gold", "silver", "bronze"}:
-                base_names.add(parts[0])
-            else:
-                base_names.add(key)
-
-        def _best(name):
-            for tier in trophy_tiers:
-                k = f"{name}_{tier}" if tier else name
-                if k in all_keys:
-                    return name, {"count": self._trophy_fishes[k], "rank": tier}
-            return name, {"count": 0, "rank": None}
-
-        highest = {}
-        with ThreadPoolExecutor() as pool:
-            for name, result in pool.map(_best, base_names):
-                highest[name] = result
+        cached = self._results.get(("highest", compact))
+        if cached is not None:
+            return cached
 
+        highest: Dict[str, Any] = {
+            fish: best if compact else best.to_dict()
+            for fish, (_, best) in self._aggregated().items()
+        }
         highest.update(self._extra_data)
+        self._results[("highest", compact)] = highest
         return highest
 
-    def _get_trophies(self) -> Dict[str, Dict[str, int]]:
-        # collect every base fish name
-        base_names = set()
-        for key in self._trophy_fishes:
-            for suffix in tier_suffixes:
-                if key.endswith(suffix):
-                    base_names.add(key[: len(key) - len(suffix)])
-                    break
-
-        # build result in one pass per base
-        result = {}
-        for name in base_names:
-            # start with zeros for all tiers
-            breakdown = {tier: 0 for tier in tier_suffixes.values()}
-            # fill in whatever exists
-            for suffix, tier in tier_suffixes.items():
-                full_key = name + suffix
-                if full_key in self._trophy_fishes:
-                    breakdown[tier] = self._trophy_fishes[full_key]
-            result[name] = breakdown
+    def _get_trophies(self, compact: bool = False) -> Dict[str, Any]:
+        cached = self._results.get(("trophies", compact))
+        if cached is not None:
+            return cached
 
+        result: Dict[str, Any] = {
+            fish: counts if compact else counts.to_dict()
+            for fish, (counts, _) in self._aggregated().items()
+        }
         result.update(self._extra_data)
-
+        self._results[("trophies", compact)] = result
         return result
 
+    def get_highest_trophies(self, compact: bool = False) -> Dict[str, Any]:
+        """highest_trophies, with HighestTrophy tuples per fish if compact"""
+        return self._get_highest_trophies(compact)
+
+    def get_trophies(self, compact: bool = False) -> Dict[str, Any]:
+        """trophies, with TrophyCounts tuples per fish if compact"""
+        return self._get_trophies(compact)
+
     @property
     def highest_trophies(self):
         return self._get_highest_trophies()
@@ -88,3 +208,35 @@ class Fishing:
     @property
     def trophies(self):
         return self._get_trophies()
+
+
+def rank_trophies(
+    players: Iterable[Fishing | Dict[str, Any]],
+    fish: Sequence[str] = TROPHY_FISH,
+) -> TrophyArrays:
+    """
+    Trophy fish of many players as NumPy arrays, for ranking and leaderboards.
+
+    players are Fishing instances or the member data they are built from.
+    counts[p, f, t] is how many of fish[f] player p caught at tier TIERS[t],
+    and highest[p, f] the index into TIERS of the best tier caught, -1 if
+    that fish was never caught. Fish outside of fish are ignored.
+    """
+    import numpy as np
+
+    fishings = [
+        player if isinstance(player, Fishing) else Fishing(player) for player in players
+    ]
+    columns = {name: column for column, name in enumerate(fish)}
+
+    counts = np.zeros((len(fishings), len(fish), len(TIERS)), dtype=np.int64)
+    highest = np.full((len(fishings), len(fish)), -1, dtype=np.int8)
+    for row, fishing in enumerate(fishings):
+        for name, (tier_counts, best) in fishing._aggregated().items():
+            column = columns.get(name)
+            if column is None:
+                continue
+            counts[row, column] = tier_counts
+            highest[row, column] = TIERS.index(best.rank) if best.rank else 0
+
+    return {"fish": list(fish), "counts": counts, "highest": highest}
@@ -1,3 +1,19 @@
-from .Fishing import Fishing
+from .Fishing import (
+    TIERS,
+    TROPHY_FISH,
+    Fishing,
+    HighestTrophy,
+    TrophyArrays,
+    TrophyCounts,
+    rank_trophies,
+)
 
-__all__ = ["Fishing"]
+__all__ = [
+    "TIERS",
+    "TROPHY_FISH",
+    "Fishing",
+    "HighestTrophy",
+    "TrophyArrays",
+    "TrophyCounts",
+    "rank_trophies",
+]
@@ -1,4 +1,14 @@
-from .Fishing import Fishing
-from .Dungeons import Dungeons
+from typing import TYPE_CHECKING
+
+from ..utils import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {"Fishing": ".Fishing", "Dungeons": ".Dungeons"},
+)
+
+if TYPE_CHECKING:
+    from .Fishing import Fishing
+    from .Dungeons import Dungeons
 
 __all__ = ["Fishing", "Dungeons"]
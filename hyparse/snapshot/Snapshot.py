@@ -0,0 +1,188 @@
+import json
+import mmap
+from os import PathLike, fstat, makedirs
+from os.path import exists, getsize, join
+from threading import Lock
+from time import time
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional
+from typing import TypeVar
+
+from ..Player import Player, SelectedProfile
+
+FORMAT = "hyparse-snapshot"
+VERSION = 1
+
+META_FILE = "snapshot.json"
+DATA_FILE = "responses.bin"
+INDEX_FILE = "index.ndjson"
+
+T = TypeVar("T")
+
+
+class SnapshotEntry(NamedTuple):
+    """Where the response of one uuid is in the data file"""
+
+    uuid: str
+    offset: int
+    length: int
+    fetched_at: float
+
+
+def read_mapped(path: str | PathLike[str], read: Callable[[memoryview], T]) -> T:
+    """Call read with a memoryview of the memory-mapped file, unmapped afterwards"""
+    with open(path, "rb") as f:
+        # Empty files can't be mapped
+        if not fstat(f.fileno()).st_size:
+            return read(memoryview(b""))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return read(view)
+
+
+class Snapshot:
+    """
+    A directory of raw /v2/skyblock/profiles responses, to replay offline.
+
+    Bodies are appended back to back to responses.bin and located through
+    index.ndjson, one {"uuid", "offset", "length", "fetched_at"} line each;
+    the newest line of a uuid wins. Reads go through a memory map of the
+    data file, so opening a snapshot only loads its index and a response is
+    paged in when it is used. Views returned by get() are only valid until
+    the snapshot is closed.
+
+    Pass writable=True to create the directory or add() to it.
+    """
+
+    def __init__(self, path: str | PathLike[str], writable: bool = False) -> None:
+        self.path = path
+        self.writable = writable
+        self._entries: Dict[str, SnapshotEntry] = {}
+        self._lock = Lock()
+        self._map: Optional[mmap.mmap] = None
+        self._data: Optional[IO[bytes]] = None
+        self._index: Optional[IO[str]] = None
+
+        meta_path = join(path, META_FILE)
+        if writable and not exists(meta_path):
+            makedirs(path, exist_ok=True)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"format": FORMAT, "version": VERSION}, f)
+
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT or meta.get("version") != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} hyparse snapshot")
+
+        self._load_index()
+        if writable:
+            self._data = open(join(path, DATA_FILE), "ab")
+            self._index = open(join(path, INDEX_FILE), "a", encoding="utf-8")
+
+    def __repr__(self) -> str:
+        return f"<Snapshot path={self.path!r} entries={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid.replace("-", "") in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _load_index(self) -> None:
+        data_path = join(self.path, DATA_FILE)
+        size = getsize(data_path) if exists(data_path) else 0
+        try:
+            with open(join(self.path, INDEX_FILE), "r", encoding="utf-8") as f:
+                lines = f.read().split("\n")
+        except FileNotFoundError:
+            return
+
+        # The last line is either empty or torn by a crash mid-write
+        for line in lines[:-1]:
+            if not line:
+                continue
+            entry = SnapshotEntry(**json.loads(line))
+            if entry.offset + entry.length <= size:
+                self._entries[entry.uuid] = entry
+
+    def entry(self, uuid: str) -> SnapshotEntry:
+        return self._entries[uuid.replace("-", "")]
+
+    def add(self, uuid: str, body: bytes | str, fetched_at: Optional[float] = None):
+        """Append the response for uuid, replacing any earlier one"""
+        if self._data is None or self._index is None:
+            raise ValueError("Snapshot was not opened with writable=True")
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        uuid = uuid.replace("-", "")
+        with self._lock:
+            offset = self._data.seek(0, 2)
+            self._data.write(body)
+            # The body must be on disk before the index points at it
+            self._data.flush()
+
+            entry = SnapshotEntry(
+                uuid, offset, len(body), time() if fetched_at is None else fetched_at
+            )
+            self._index.write(json.dumps(entry._asdict(), separators=(",", ":")))
+            self._index.write("\n")
+            self._index.flush()
+            self._entries[uuid] = entry
+
+    def get(self, uuid: str) -> memoryview:
+        """The raw response for uuid, a view into the mapped data file"""
+        entry = self.entry(uuid)
+        end = entry.offset + entry.length
+        if not entry.length:
+            return memoryview(b"")
+
+        with self._lock:
+            if self._map is None or len(self._map) < end:
+                # Earlier views keep the old mapping alive until they're gone
+                with open(join(self.path, DATA_FILE), "rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return memoryview(self._map)[entry.offset : end]
+
+    def player(
+        self,
+        uuid: str,
+        selected_profile: Optional[SelectedProfile] = None,
+        **kwargs: Any,
+    ) -> Player:
+        """Player.from_response for the response saved for uuid"""
+        with self.get(uuid) as body:
+            return Player.from_response(body, uuid, selected_profile, **kwargs)
+
+    def players(
+        self, uuids: Optional[Iterable[str]] = None, **kwargs: Any
+    ) -> Iterator[Player]:
+        """
+        A Player for each of uuids (every saved uuid by default), built one
+        at a time. Pass streaming=True to only keep each player's own data.
+        """
+        for uuid in self if uuids is None else uuids:
+            yield self.player(uuid, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in (self._data, self._index):
+                if handle is not None:
+                    handle.close()
+            self._data = self._index = None
+
+            if self._map is not None:
+                try:
+                    self._map.close()
+                except BufferError:
+                    # A view from get() is still around, unmapped once it's freed
+                    pass
+                self._map = None
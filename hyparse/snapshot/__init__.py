@@ -0,0 +1,15 @@
+from .Snapshot import (
+    FORMAT,
+    VERSION,
+    Snapshot,
+    SnapshotEntry,
+    read_mapped,
+)
+
+__all__ = [
+    "FORMAT",
+    "VERSION",
+    "Snapshot",
+    "SnapshotEntry",
+    "read_mapped",
+]
@@ -0,0 +1,297 @@
+from os import PathLike
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from ..Member import Member
+from ..Player import Player
+from ..levels import get_skill_table, getSkillLevels
+from ..skills.Fishing import TIERS, TROPHY_FISH, rank_trophies
+
+FORMAT_VERSION = 1
+
+# Floors 0 (entrance) to 7 of catacombs and master catacombs
+DUNGEON_TYPES = ("catacombs", "master_catacombs")
+FLOORS = 8
+
+
+class TopK(NamedTuple):
+    """The k best rows of a column, best first"""
+
+    rows: Any
+    uuids: Any
+    values: Any
+
+
+class PlayerTable:
+    """
+    Stats of many players as NumPy columns, one row per player.
+
+    Holds per skill xp and levels, catacombs xp and level, completions per
+    floor, trophy fish catches per tier and purse. Queries work on whole
+    columns, so ranking thousands of players never touches a dict per row.
+
+    Columns are named:
+
+    - "purse", "catacombs_xp", "catacombs_level", "trophy_total"
+    - "xp.<skill>" and "level.<skill>", e.g. "level.SKILL_MINING"
+    - "completions.<dungeon type>.<floor>", e.g. "completions.catacombs.7"
+    - "trophy.<fish>", catches of every tier of that fish
+
+    table[name] is the column array. Purse is NaN for rows built from a
+    bare Member rather than a Player, as banking belongs to the profile.
+    """
+
+    def __init__(
+        self,
+        uuids: Any,
+        skills: Sequence[str],
+        skill_xp: Any,
+        catacombs_xp: Any,
+        completions: Any,
+        trophy_fish: Sequence[str],
+        trophy_counts: Any,
+        purse: Any,
+    ) -> None:
+        # Dashes are stripped first, a dashed uuid doesn't fit in 32 characters
+        self.uuids = np.asarray(
+            [str(uuid).replace("-", "") for uuid in uuids], dtype="<U32"
+        )
+        self.skills: List[str] = list(skills)
+        self.skill_xp = np.asarray(skill_xp, dtype=np.float64).reshape(
+            len(self.uuids), len(self.skills)
+        )
+        self.catacombs_xp = np.asarray(catacombs_xp, dtype=np.float64)
+        self.completions = np.asarray(completions, dtype=np.int32)
+        self.trophy_fish: List[str] = list(trophy_fish)
+        self.trophy_counts = np.asarray(trophy_counts, dtype=np.int32)
+        self.purse = np.asarray(purse, dtype=np.float64)
+
+        # Levels are derived, so they are recomputed rather than stored. One
+        # pass per level table, every skill follows "Skills" unless curves per
+        # skill were loaded
+        tables = [get_skill_table(skill) for skill in self.skills]
+        self.skill_levels = np.zeros(self.skill_xp.shape, dtype=np.intp)
+        for table in set(tables):
+            columns = [column for column, other in enumerate(tables) if other is table]
+            self.skill_levels[:, columns] = getSkillLevels(
+                self.skill_xp[:, columns], table
+            )["skill_level"]
+        self.catacombs_level = getSkillLevels(self.catacombs_xp, "Catacombs")[
+            "skill_level"
+        ]
+        self._rows: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def __repr__(self) -> str:
+        return f"<PlayerTable rows={len(self)} skills={len(self.skills)}>"
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid.replace("-", "") in self._row_index()
+
+    @classmethod
+    def from_players(
+        cls,
+        players: Iterable[Member],
+        trophy_fish: Sequence[str] = TROPHY_FISH,
+    ) -> "PlayerTable":
+        """
+        Build a table from Players or Members. Rows are looked up by uuid, so
+        raw member dicts are rejected, wrap them in Member(uuid, data).
+        """
+        members = list(players)
+        for member in members:
+            if not isinstance(member, Member):
+                raise TypeError(
+                    f"Expected a Player or Member, got {type(member).__name__}, "
+                    "wrap raw member data in Member(uuid, data)"
+                )
+
+        skills: Dict[str, int] = {}
+        experiences = []
+        for member in members:
+            experience = member.skyblock_data.get("player_data", {}).get("experience")
+            experience = experience or {}
+            for skill in experience:
+                skills.setdefault(skill, len(skills))
+            experiences.append(experience)
+
+        skill_xp = np.zeros((len(members), len(skills)), dtype=np.float64)
+        catacombs_xp = np.zeros(len(members), dtype=np.float64)
+        completions = np.zeros((len(members), len(DUNGEON_TYPES), FLOORS), np.int32)
+        purse = np.full(len(members), np.nan)
+
+        for row, (member, experience) in enumerate(zip(members, experiences)):
+            for skill, xp in experience.items():
+                skill_xp[row, skills[skill]] = xp
+
+            dungeon_types = member.skyblock_data.get("dungeons", {}).get(
+                "dungeon_types", {}
+            )
+            catacombs_xp[row] = dungeon_types.get("catacombs", {}).get("experience", 0)
+            for column, dungeon in enumerate(DUNGEON_TYPES):
+                floors = dungeon_types.get(dungeon, {}).get("tier_completions", {})
+                for floor, count in floors.items():
+                    if str(floor).isdigit() and int(floor) < FLOORS:
+                        completions[row, column, int(floor)] = count
+
+            if isinstance(member, Player):
+                purse[row] = member.purse(human_readable=False)
+
+        trophies = rank_trophies(
+            (member.skyblock_data for member in members), trophy_fish
+        )
+
+        return cls(
+            [member.uuid for member in members],
+            list(skills),
+            skill_xp,
+            catacombs_xp,
+            completions,
+            trophies["fish"],
+            trophies["counts"],
+            purse,
+        )
+
+    # ───────────────────────────────────── columns ─────────────────────────────────────
+    @property
+    def columns(self) -> List[str]:
+        names = ["purse", "catacombs_xp", "catacombs_level", "trophy_total"]
+        names += [f"xp.{skill}" for skill in self.skills]
+        names += [f"level.{skill}" for skill in self.skills]
+        names += [
+            f"completions.{dungeon}.{floor}"
+            for dungeon in DUNGEON_TYPES
+            for floor in range(FLOORS)
+        ]
+        names += [f"trophy.{fish}" for fish in self.trophy_fish]
+        return names
+
+    def __getitem__(self, name: str) -> Any:
+        if name == "purse":
+            return self.purse
+        if name == "catacombs_xp":
+            return self.catacombs_xp
+        if name == "catacombs_level":
+            return self.catacombs_level
+        if name == "trophy_total":
+            return self.trophy_counts.sum(axis=(1, 2))
+
+        kind, _, key = name.partition(".")
+        try:
+            if kind == "xp":
+                return self.skill_xp[:, self.skills.index(key)]
+            if kind == "level":
+                return self.skill_levels[:, self.skills.index(key)]
+            if kind == "trophy":
+                return self.trophy_counts[:, self.trophy_fish.index(key)].sum(axis=1)
+            if kind == "completions":
+                dungeon, _, floor = key.partition(".")
+                if floor.isdigit():
+                    dungeon_column = DUNGEON_TYPES.index(dungeon)
+                    return self.completions[:, dungeon_column, int(floor)]
+        except (ValueError, IndexError):
+            pass
+        raise KeyError(f"No column {name!r}")
+
+    def _row_index(self) -> Dict[str, int]:
+        if self._rows is None:
+            self._rows = {uuid: row for row, uuid in enumerate(self.uuids.tolist())}
+        return self._rows
+
+    def row(self, uuid: str) -> int:
+        return self._row_index()[uuid.replace("-", "")]
+
+    # ───────────────────────────────────── queries ─────────────────────────────────────
+    def top(self, column: str, k: int = 10, ascending: bool = False) -> TopK:
+        """
+        The k rows with the highest values of column (lowest if ascending),
+        best first. Rows where the column is NaN are never ranked.
+        """
+        values = self[column]
+        candidates = (
+            np.flatnonzero(~np.isnan(values)) if values.dtype.kind == "f" else None
+        )
+        keyed = values if candidates is None else values[candidates]
+        keyed = keyed if ascending else -keyed
+
+        k = min(k, len(keyed))
+        if k <= 0:
+            rows = np.empty(0, dtype=np.intp)
+        else:
+            best = np.argpartition(keyed, k - 1)[:k]
+            # Stable sort so ties keep their row order
+            best = best[np.argsort(keyed[best], kind="stable")]
+            rows = best if candidates is None else candidates[best]
+
+        return TopK(rows, self.uuids[rows], values[rows])
+
+    def percentile(self, column: str, q: Any) -> Any:
+        """The q-th percentile(s) of column, NaN rows left out"""
+        return np.nanpercentile(self[column], q)
+
+    def percentile_rank(self, column: str, uuid: str) -> float:
+        """Percentage of the other rows whose column is below this player's"""
+        values = self[column]
+        value = values[self.row(uuid)]
+        values = values[~np.isnan(values)] if values.dtype.kind == "f" else values
+        if len(values) < 2:
+            return 100.0
+        return float(np.count_nonzero(values < value) / (len(values) - 1) * 100)
+
+    def filter(self, mask: Any) -> "PlayerTable":
+        """
+        A table of the rows where mask is true, e.g.
+        table.filter(table["catacombs_level"] >= 40)
+        """
+        mask = np.asarray(mask)
+        return PlayerTable(
+            self.uuids[mask],
+            self.skills,
+            self.skill_xp[mask],
+            self.catacombs_xp[mask],
+            self.completions[mask],
+            self.trophy_fish,
+            self.trophy_counts[mask],
+            self.purse[mask],
+        )
+
+    # ──────────────────────────────────── save/load ────────────────────────────────────
+    def save(self, path: str | PathLike[str], compress: bool = True) -> None:
+        """Write the table to a .npz file, levels are recomputed on load"""
+        save = np.savez_compressed if compress else np.savez
+        with open(path, "wb") as f:
+            save(
+                f,
+                version=np.int32(FORMAT_VERSION),
+                uuids=self.uuids,
+                skills=np.asarray(self.skills, dtype=str),
+                skill_xp=self.skill_xp,
+                catacombs_xp=self.catacombs_xp,
+                completions=self.completions,
+                trophy_fish=np.asarray(self.trophy_fish, dtype=str),
+                trophy_counts=self.trophy_counts,
+                tiers=np.asarray(TIERS, dtype=str),
+                purse=self.purse,
+            )
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "PlayerTable":
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["version"]) != FORMAT_VERSION:
+                raise ValueError(f"Unsupported PlayerTable version {data['version']}")
+            if tuple(data["tiers"].tolist()) != TIERS:
+                raise ValueError("PlayerTable was saved with different trophy tiers")
+
+            return cls(
+                data["uuids"],
+                data["skills"].tolist(),
+                data["skill_xp"],
+                data["catacombs_xp"],
+                data["completions"],
+                data["trophy_fish"].tolist(),
+                data["trophy_counts"],
+                data["purse"],
+            )
@@ -0,0 +1,3 @@
+from .PlayerTable import PlayerTable, TopK
+
+__all__ = ["PlayerTable", "TopK"]
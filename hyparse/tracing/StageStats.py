@@ -0,0 +1,119 @@
+import sys
+from math import ceil
+from threading import Lock
+from typing import Dict, List, Optional, TextIO, TypedDict
+
+from .Tracer import StageEvent
+
+
+class StageSummary(TypedDict):
+    count: int
+    errors: int
+    total: float
+    p50: float
+    p95: float
+    p99: float
+    bytes: int
+    cache_hits: int
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class StageStats:
+    """
+    Tracer callback that collects durations per stage and summarizes them as
+    p50/p95/p99. Stages reported with a detail (e.g. an inventory section)
+    are kept apart as "stage[detail]" when by_detail is True.
+    """
+
+    def __init__(self, by_detail: bool = False) -> None:
+        self.by_detail = by_detail
+        self._lock = Lock()
+        self._durations: Dict[str, List[float]] = {}
+        self._bytes: Dict[str, int] = {}
+        self._cache_hits: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+
+    def __call__(self, event: StageEvent) -> None:
+        name = event.stage
+        if self.by_detail and event.detail is not None:
+            name = f"{name}[{event.detail}]"
+
+        with self._lock:
+            self._durations.setdefault(name, []).append(event.duration)
+            self._bytes[name] = self._bytes.get(name, 0) + (event.bytes or 0)
+            self._cache_hits[name] = self._cache_hits.get(name, 0) + bool(
+                event.cache_hit
+            )
+            self._errors[name] = self._errors.get(name, 0) + event.error
+
+    def __repr__(self) -> str:
+        return f"<StageStats stages={len(self._durations)}>"
+
+    def clear(self) -> None:
+        with self._lock:
+            for stats in (self._durations, self._bytes, self._cache_hits, self._errors):
+                stats.clear()
+
+    def summary(self) -> Dict[str, StageSummary]:
+        """Per stage counts, totals and percentiles, durations in seconds"""
+        with self._lock:
+            durations = {
+                name: sorted(values) for name, values in self._durations.items()
+            }
+            return {
+                name: {
+                    "count": len(ordered),
+                    "errors": self._errors[name],
+                    "total": sum(ordered),
+                    "p50": _percentile(ordered, 50),
+                    "p95": _percentile(ordered, 95),
+                    "p99": _percentile(ordered, 99),
+                    "bytes": self._bytes[name],
+                    "cache_hits": self._cache_hits[name],
+                }
+                for name, ordered in durations.items()
+            }
+
+    def report(self) -> str:
+        """summary() as a text table, milliseconds"""
+        rows = [
+            (
+                name,
+                str(stats["count"]),
+                f"{stats['p50'] * 1000:.3f}",
+                f"{stats['p95'] * 1000:.3f}",
+                f"{stats['p99'] * 1000:.3f}",
+                f"{stats['total'] * 1000:.3f}",
+                str(stats["bytes"]),
+                str(stats["cache_hits"]),
+            )
+            for name, stats in self.summary().items()
+        ]
+        header = (
+            "stage",
+            "count",
+            "p50 ms",
+            "p95 ms",
+            "p99 ms",
+            "total ms",
+            "bytes",
+            "hits",
+        )
+        widths = [
+            max(len(row[i]) for row in [header, *rows]) for i in range(len(header))
+        ]
+
+        lines = []
+        for row in [header, *rows]:
+            cells = [row[0].ljust(widths[0])]
+            cells += [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+            lines.append("  ".join(cells))
+        return "\n".join(lines)
+
+    def print_report(self, file: Optional[TextIO] = None) -> None:
+        print(self.report(), file=file or sys.stdout)
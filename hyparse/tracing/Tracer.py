@@ -0,0 +1,136 @@
+from contextvars import ContextVar, Token
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+
+class StageEvent(NamedTuple):
+    """One timed stage. duration is in seconds and includes nested stages."""
+
+    stage: str
+    duration: float
+    detail: Optional[str] = None
+    bytes: Optional[int] = None
+    cache_hit: Optional[bool] = None
+    error: bool = False
+
+
+Callback = Callable[[StageEvent], Any]
+
+_current: ContextVar[Optional["Tracer"]] = ContextVar("hyparse_tracer", default=None)
+# Tokens of the with blocks entered in this context, innermost last
+_tokens: ContextVar[Tuple[Token, ...]] = ContextVar("hyparse_tracer_tokens", default=())
+
+
+class Tracer:
+    """
+    Reports a StageEvent to every callback for each stage that runs while it
+    is active. Activate it with a with block; it stays active for the current
+    thread or asyncio task and anything they copy their context into.
+
+        stats = StageStats()
+        with Tracer(stats):
+            Player(API_KEY, "TheFieryWarrior").inventory().load_all()
+        stats.print_report()
+    """
+
+    def __init__(self, *callbacks: Callback) -> None:
+        self.callbacks: List[Callback] = list(callbacks)
+        self._lock = Lock()
+
+    def __enter__(self) -> "Tracer":
+        _tokens.set(_tokens.get() + (_current.set(self),))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        *outer, token = _tokens.get()
+        _tokens.set(tuple(outer))
+        _current.reset(token)
+
+    def __repr__(self) -> str:
+        return f"<Tracer callbacks={len(self.callbacks)}>"
+
+    def add_callback(self, callback: Callback) -> None:
+        self.callbacks.append(callback)
+
+    def emit(self, event: StageEvent) -> None:
+        # Stages can finish on several threads at once
+        with self._lock:
+            for callback in self.callbacks:
+                callback(event)
+
+
+class Span:
+    """A stage being timed, set bytes and cache_hit on it before it ends"""
+
+    __slots__ = ("tracer", "stage", "detail", "bytes", "cache_hit", "_start")
+
+    def __init__(self, tracer: Tracer, stage: str, detail: Optional[str]) -> None:
+        self.tracer = tracer
+        self.stage = stage
+        self.detail = detail
+        self.bytes: Optional[int] = None
+        self.cache_hit: Optional[bool] = None
+        self._start = 0.0
+
+    def __enter__(self) -> "Span":
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, *_: Any) -> None:
+        self.tracer.emit(
+            StageEvent(
+                self.stage,
+                perf_counter() - self._start,
+                self.detail,
+                self.bytes,
+                self.cache_hit,
+                exc_type is not None,
+            )
+        )
+
+
+class _NullSpan:
+    """Stands in for Span when nothing is tracing, ignores everything"""
+
+    __slots__ = ()
+    bytes = None
+    cache_hit = None
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        pass
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def get_tracer() -> Optional[Tracer]:
+    """The Tracer active in this context, if any"""
+    return _current.get()
+
+
+def stage(name: str, detail: Optional[str] = None) -> Any:
+    """Time a stage for the active Tracer, costs a context lookup without one"""
+    tracer = _current.get()
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, detail)
+
+
+def record(
+    name: str,
+    duration: float,
+    detail: Optional[str] = None,
+    bytes: Optional[int] = None,
+    cache_hit: Optional[bool] = None,
+) -> None:
+    """Report a stage that was timed elsewhere, e.g. in a worker process"""
+    tracer = _current.get()
+    if tracer is not None:
+        tracer.emit(StageEvent(name, duration, detail, bytes, cache_hit))
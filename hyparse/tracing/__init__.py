@@ -0,0 +1,12 @@
+from .Tracer import StageEvent, Tracer, get_tracer, record, stage
+from .StageStats import StageStats, StageSummary
+
+__all__ = [
+    "StageEvent",
+    "Tracer",
+    "get_tracer",
+    "record",
+    "stage",
+    "StageStats",
+    "StageSummary",
+]
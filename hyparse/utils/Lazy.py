@@ -0,0 +1,54 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+LAZY_ATTRIBUTES = "__lazy_attributes__"
+
+
+class _LazyPackage(ModuleType):
+    """
+    Module type of a package set up by lazy_attributes.
+
+    Most attributes share their name with the submodule defining them
+    (Player in Player.py), and importing a submodule binds it on its package.
+    That binding is skipped for lazy names so they keep resolving to the
+    class or function, as they did when __init__ imported them eagerly.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if (
+            isinstance(value, ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+            and name in self.__dict__.get(LAZY_ATTRIBUTES, ())
+        ):
+            return
+        super().__setattr__(name, value)
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module level __getattr__ and __dir__ for package, importing each of
+    attributes (name → submodule relative to package) on first use.
+
+        __getattr__, __dir__ = lazy_attributes(__name__, {"Player": ".Player"})
+    """
+    module = sys.modules[package]
+    module.__class__ = _LazyPackage
+    setattr(module, LAZY_ATTRIBUTES, attributes)
+
+    def __getattr__(name: str) -> Any:
+        submodule = attributes.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(submodule, package), name)
+        module.__dict__[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module.__dict__) | set(attributes))
+
+    return __getattr__, __dir__
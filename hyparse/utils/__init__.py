@@ -1,3 +1,4 @@
 from .utils import json_readable
+from .Lazy import lazy_attributes
 
-__all__ = ["json_readable"]
+__all__ = ["json_readable", "lazy_attributes"]
@@ -0,0 +1,65 @@
+from hyparse.cache import LRUCache
+
+from conftest import FakeClock
+
+
+def test_get_and_set():
+    cache = LRUCache()
+    cache.set("a", b"1")
+
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_evicts_least_recently_used_entry():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_evicts_by_total_size():
+    cache = LRUCache(max_entries=None, max_size=10)
+    cache.set("a", b"x" * 6)
+    cache.set("b", b"x" * 6)
+
+    assert "a" not in cache
+    assert cache.stats()["size"] == 6
+
+
+def test_oversized_value_is_not_cached():
+    cache = LRUCache(max_size=4)
+    cache.set("a", b"123")
+    cache.set("b", b"too large")
+
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = LRUCache(clock=clock)
+    cache.set("a", b"1", ttl=10)
+    cache.set("b", b"2")
+
+    clock.now += 11
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+    assert cache.stats()["expirations"] == 1
+
+
+def test_overwrite_updates_size():
+    cache = LRUCache()
+    cache.set("a", b"1234")
+    cache.set("a", b"12")
+
+    assert len(cache) == 1
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,125 @@
+import sys
+
+import pytest
+
+from hyparse.cache import NBTCache, get_nbt_cache, set_nbt_cache
+from hyparse.player import Inventory
+from hyparse.player.Inventory.NBT import _nbt_to_json
+
+from conftest import make_item, make_section
+
+BLOB = make_section(make_item("HYPERION", uuid="a-1"), make_item("DIRT", 64))
+OTHER_BLOB = make_section(make_item("TERMINATOR"))
+
+SKYBLOCK_DATA = {
+    "inventory": {
+        "inv_contents": {"type": 0, "data": BLOB},
+        "backpack_contents": {"0": {"type": 0, "data": OTHER_BLOB}},
+    }
+}
+
+
+@pytest.fixture
+def shared_cache():
+    cache = NBTCache()
+    previous = set_nbt_cache(cache)
+    yield cache
+    set_nbt_cache(previous)
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Count the blobs decoded by Inventory and (inline) by the executor"""
+    calls = []
+
+    def counting(blob, fields=None):
+        calls.append(blob)
+        return _nbt_to_json(blob, fields)
+
+    for module in ("Inventory", "Executor"):
+        module = sys.modules[f"hyparse.player.Inventory.{module}"]
+        monkeypatch.setattr(module, "_nbt_to_json", counting)
+    return calls
+
+
+def test_get_returns_a_fresh_copy():
+    cache = NBTCache()
+    cache.set(BLOB, _nbt_to_json(BLOB))
+
+    first = cache.get(BLOB)
+    first["i"].clear()
+
+    assert cache.get(BLOB) == _nbt_to_json(BLOB)
+    assert cache.get(OTHER_BLOB) is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_are_keyed_by_content():
+    cache = NBTCache()
+    cache.set(BLOB, {"i": []})
+
+    # An equal blob that is a different str object still hits
+    assert "".join(list(BLOB)) in cache
+    assert OTHER_BLOB not in cache
+    assert NBTCache.digest(BLOB) != NBTCache.digest(OTHER_BLOB)
+
+
+def test_size_eviction():
+    cache = NBTCache(max_size=64)
+    cache.set(BLOB, {"i": ["x" * 40]})
+    cache.set(OTHER_BLOB, {"i": ["y" * 40]})
+
+    assert BLOB not in cache
+    assert cache.get(OTHER_BLOB) == {"i": ["y" * 40]}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_disk_tier_is_shared(tmp_path):
+    writer = NBTCache(disk_path=tmp_path / "nbt.sqlite3")
+    writer.set(BLOB, _nbt_to_json(BLOB))
+    writer.close()
+
+    reader = NBTCache(disk_path=tmp_path / "nbt.sqlite3")
+
+    assert reader.get(BLOB) == _nbt_to_json(BLOB)
+    assert reader.get(BLOB) == _nbt_to_json(BLOB)
+    assert reader.stats()["disk_hits"] == 1
+    assert reader.stats()["hits"] == 2
+
+
+def test_unchanged_sections_are_decoded_once(shared_cache, decodes):
+    first = Inventory(SKYBLOCK_DATA, lazy_load=False).load_all()
+    second = Inventory(SKYBLOCK_DATA, lazy_load=True)
+    third = Inventory(SKYBLOCK_DATA, lazy_load=False)
+
+    assert second.player_inventory == first["inv_contents"]
+    assert second.backpacks == {"0": first["backpack_contents/0"]["i"]}
+    assert third.load_all() == first
+    assert sorted(decodes) == sorted([BLOB, OTHER_BLOB])
+
+
+def test_select_reads_from_cache(shared_cache, decodes):
+    Inventory(SKYBLOCK_DATA, lazy_load=True).player_inventory
+
+    selected = Inventory(SKYBLOCK_DATA, lazy_load=True).select(
+        "inv_contents", ["tag.ExtraAttributes.id"]
+    )
+
+    assert [slot["tag"]["ExtraAttributes"]["id"] for slot in selected] == [
+        "HYPERION",
+        "DIRT",
+    ]
+    assert decodes == [BLOB]
+
+
+def test_caching_can_be_turned_off(decodes):
+    previous = set_nbt_cache(None)
+    try:
+        assert get_nbt_cache() is None
+        Inventory(SKYBLOCK_DATA, lazy_load=True).player_inventory
+        Inventory(SKYBLOCK_DATA, lazy_load=True).player_inventory
+    finally:
+        set_nbt_cache(previous)
+
+    assert decodes == [BLOB, BLOB]
@@ -0,0 +1,89 @@
+from hyparse import Client, Player
+from hyparse.cache import DiskCache, ResponseCache
+
+from conftest import PLAYER_NAME, UUID, FakeClock
+
+API_KEY = "ABCDEFG"
+
+
+def test_per_endpoint_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(ttls={"profiles": 5, "uuid": 500}, clock=clock)
+    cache.set("profiles", UUID, b"{}")
+    cache.set("uuid", "name", UUID.encode())
+
+    clock.now += 10
+
+    assert cache.get("profiles", UUID) is None
+    assert cache.get("uuid", "name") == UUID.encode()
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    first = ResponseCache(disk_path=tmp_path / "cache.sqlite3")
+    first.set("profiles", UUID, b'{"profiles": []}')
+    first.close()
+
+    second = ResponseCache(disk_path=tmp_path / "cache.sqlite3")
+
+    assert second.get("profiles", UUID) == b'{"profiles": []}'
+    assert second.get("profiles", UUID) == b'{"profiles": []}'
+    assert second.stats()["disk_hits"] == 1
+    assert second.stats()["hits"] == 2
+    assert second.stats()["misses"] == 0
+
+
+def test_disk_entries_expire(tmp_path):
+    clock = FakeClock()
+    disk = DiskCache(tmp_path / "cache.sqlite3", clock=clock)
+    disk.set("a", b"1", expires_at=clock.now + 5)
+    disk.set("b", b"2")
+
+    clock.now += 10
+
+    assert disk.get("a") is None
+    assert disk.get("b") == (b"2", None)
+    assert disk.purge_expired() == 0
+    assert len(disk) == 1
+
+
+def test_invalidate(tmp_path):
+    cache = ResponseCache(disk_path=tmp_path / "cache.sqlite3")
+    cache.set("profiles", UUID, b"{}")
+
+    cache.invalidate("profiles", UUID)
+
+    assert cache.get("profiles", UUID) is None
+
+
+def test_player_uses_cached_responses(stub_player):
+    client = Client(cache=ResponseCache())
+
+    first = Player(API_KEY, player_name=PLAYER_NAME, client=client)
+    second = Player(API_KEY, player_name=PLAYER_NAME.lower(), client=client)
+
+    assert first.profile_id == second.profile_id
+    assert len(stub_player.requests) == 2
+    # The second name is answered by the client's name index, not the cache
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_cached_profiles_are_independent_copies(stub_player):
+    client = Client(cache=ResponseCache())
+
+    first = Player(API_KEY, uuid=UUID, client=client)
+    first["player_data"] = {"changed": True}
+    second = Player(API_KEY, uuid=UUID, client=client)
+
+    assert second["player_data"] == {}
+
+
+def test_failed_requests_are_not_cached(stub_player):
+    client = Client(cache=ResponseCache())
+
+    for _ in range(2):
+        try:
+            Player(API_KEY, player_name="unknown_user", client=client)
+        except Exception:
+            pass
+
+    assert len(stub_player.requests) == 2
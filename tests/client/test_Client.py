@@ -0,0 +1,66 @@
+import pytest
+import requests
+
+from hyparse import Client, Player
+from hyparse.client import get_default_client
+
+from conftest import UUID
+
+API_KEY = "ABCDEFG"
+
+
+def test_keep_alive_reuses_connections(stub_server):
+    with Client() as client:
+        for _ in range(5):
+            assert client.get(f"{stub_server.url}/v2/skyblock/profiles").ok
+
+        stats = client.stats.snapshot()
+
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 4
+
+
+def test_players_share_client_connections(stub_player):
+    client = Client(pool_size=2)
+
+    players = [Player(API_KEY, uuid=UUID, client=client) for _ in range(3)]
+
+    assert all(player.uuid == UUID for player in players)
+    assert client.stats.requests == 3
+    assert client.stats.new_connections == 1
+    assert client.stats.reused_connections == 2
+
+
+def test_read_timeout(stub_server):
+    stub_server.delay = 0.5
+    client = Client(timeout=(1.0, 0.05))
+
+    with pytest.raises(requests.Timeout):
+        client.get(f"{stub_server.url}/v2/skyblock/profiles")
+
+
+def test_stats_reset(stub_server):
+    client = Client()
+    client.get(f"{stub_server.url}/v2/skyblock/profiles")
+
+    client.stats.reset()
+
+    assert client.stats.snapshot() == {
+        "requests": 0,
+        "new_connections": 0,
+        "reused_connections": 0,
+        "throttled": 0,
+    }
+
+
+def test_invalid_pool_size():
+    with pytest.raises(ValueError):
+        Client(pool_size=0)
+
+
+def test_default_client_is_shared(stub_player):
+    first = Player(API_KEY, uuid=UUID)
+    second = Player(API_KEY, uuid=UUID)
+
+    assert first._client is second._client is get_default_client()
@@ -0,0 +1,114 @@
+from time import time
+
+import pytest
+
+from hyparse import Client, Player, resolve_uuids
+from hyparse.cache import DEFAULT_TTLS, ResponseCache
+from hyparse.client import NameIndex
+from hyparse.exceptions import MojangAPIError
+
+from conftest import PLAYER_NAME, UUID
+
+API_KEY = "ABCDEFG"
+OTHER_UUID = "069a79f444e94726a5befca90e38aaf5"
+
+
+def test_lookup_is_case_insensitive():
+    index = NameIndex()
+    index.add(PLAYER_NAME, UUID)
+
+    assert index.get_uuid(PLAYER_NAME.upper()) == UUID
+    assert index.get_name(UUID) == PLAYER_NAME
+    assert PLAYER_NAME.lower() in index
+
+
+def test_rename_replaces_old_name():
+    index = NameIndex()
+    index.add("OldName", UUID)
+    index.add("NewName", UUID)
+
+    assert index.get_uuid("OldName") is None
+    assert index.get_name(UUID) == "NewName"
+    assert len(index) == 1
+
+
+def test_index_persists(tmp_path):
+    filename = tmp_path / "names.sqlite3"
+    first = NameIndex(filename)
+    first.add_many([(PLAYER_NAME, UUID), ("Notch", OTHER_UUID)])
+    first.close()
+
+    assert NameIndex(filename).get_uuid("notch") == OTHER_UUID
+
+
+def test_max_age_expires_entries():
+    now = [0.0]
+    index = NameIndex(max_age=10, clock=lambda: now[0])
+    index.add(PLAYER_NAME, UUID)
+
+    now[0] = 11
+
+    assert index.get_uuid(PLAYER_NAME) is None
+
+
+def test_resolve_uuids_dedupes_and_batches(stub_player):
+    client = Client()
+    names = [PLAYER_NAME, PLAYER_NAME.upper()] + [f"missing{i}" for i in range(12)]
+
+    resolved = resolve_uuids(names, client=client)
+
+    assert resolved[PLAYER_NAME] == UUID
+    assert resolved[PLAYER_NAME.upper()] == UUID
+    assert resolved["missing0"] is None
+    # 13 distinct names need two bulk requests of at most 10
+    assert [method for method, _ in stub_player.requests] == ["POST", "POST"]
+
+
+def test_resolve_uuids_uses_index(stub_player):
+    client = Client()
+    client.name_index.add(PLAYER_NAME, UUID)
+
+    assert client.resolve_uuids([PLAYER_NAME]) == {PLAYER_NAME: UUID}
+    assert stub_player.requests == []
+
+
+def test_player_only_hits_mojang_on_miss(stub_player):
+    client = Client()
+    client.resolve_uuids([PLAYER_NAME.lower()])
+
+    player = Player(API_KEY, player_name=PLAYER_NAME, client=client)
+
+    assert player.uuid == UUID
+    assert [url for _, url in stub_player.requests if "minecraft" in url] == [
+        "/profiles/minecraft"
+    ]
+
+
+def test_default_index_expires_names_like_the_uuid_cache(stub_player):
+    client = Client()
+    now = [time()]
+    client.name_index._clock = lambda: now[0]
+    Player(API_KEY, player_name=PLAYER_NAME, client=client)
+
+    now[0] += DEFAULT_TTLS["uuid"] - 1
+    Player(API_KEY, player_name=PLAYER_NAME, client=client)
+    now[0] += 2
+    Player(API_KEY, player_name=PLAYER_NAME, client=client)
+
+    assert client.name_index.max_age == DEFAULT_TTLS["uuid"]
+    assert Client(cache=ResponseCache(ttls={"uuid": 60})).name_index.max_age == 60
+    # Looked up again only once the entry is past its age
+    mojang = [url for _, url in stub_player.requests if "minecraft" in url]
+    assert len(mojang) == 2
+
+
+def test_bulk_failure_raises(stub_player):
+    stub_player.routes["/profiles/minecraft"] = lambda *args: (500, {}, {})
+
+    with pytest.raises(MojangAPIError):
+        Client().resolve_uuids(["a"])
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError):
+        Client().resolve_uuids(["a"], batch_size=11)
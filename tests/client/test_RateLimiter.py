@@ -0,0 +1,115 @@
+import pytest
+
+from threading import Thread
+from time import monotonic, sleep
+
+from hyparse import Client
+from hyparse.client import Priority, RateLimiter
+
+
+def test_blocks_until_window_resets():
+    limiter = RateLimiter(limit=2, window=0.2)
+    start = monotonic()
+
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release()
+
+    assert monotonic() - start >= 0.15
+
+
+def test_headers_override_local_count():
+    limiter = RateLimiter(limit=100, window=60)
+    limiter.acquire()
+    limiter.release(
+        {"RateLimit-Limit": "120", "RateLimit-Remaining": "7", "RateLimit-Reset": "30"}
+    )
+
+    assert limiter.limit == 120
+    assert limiter.tokens == 7
+
+
+def test_server_window_rollover_restores_tokens():
+    limiter = RateLimiter(limit=5, window=0.3)
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.tokens == 0
+
+    limiter.acquire(timeout=2)
+    limiter.release({"RateLimit-Remaining": "4", "RateLimit-Reset": "30"})
+
+    assert limiter.tokens == 4
+
+
+def test_throttled_response_empties_bucket():
+    limiter = RateLimiter(limit=10, window=60)
+    limiter.acquire()
+    limiter.release({"Retry-After": "1"}, throttled=True)
+
+    assert limiter.tokens == 0
+
+
+def test_interactive_requests_go_first():
+    limiter = RateLimiter(limit=1, window=0.2)
+    limiter.acquire()
+    limiter.release()
+    order = []
+
+    def worker(priority):
+        limiter.acquire(priority)
+        order.append(priority)
+        limiter.release()
+
+    background = Thread(target=worker, args=(Priority.BACKGROUND,))
+    background.start()
+    sleep(0.05)
+    interactive = Thread(target=worker, args=(Priority.INTERACTIVE,))
+    interactive.start()
+    background.join()
+    interactive.join()
+
+    assert order == [Priority.INTERACTIVE, Priority.BACKGROUND]
+
+
+def test_acquire_timeout_leaves_queue():
+    limiter = RateLimiter(limit=1, window=60)
+    limiter.acquire()
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.05)
+
+    assert limiter.waiting == 0
+
+
+def test_pacing_spreads_requests():
+    limiter = RateLimiter(limit=4, window=0.4, pacing=True)
+    start = monotonic()
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+
+    assert monotonic() - start >= 0.25
+
+
+def test_client_retries_throttled_requests(stub_server):
+    calls = []
+
+    def throttled_once(path, query, headers, body):
+        calls.append(headers.get("API-Key"))
+        if len(calls) == 1:
+            return 429, {"RateLimit-Remaining": "0", "RateLimit-Reset": "0"}, {}
+        return 200, {"RateLimit-Remaining": "9", "RateLimit-Reset": "60"}, {}
+
+    stub_server.routes["/v2/skyblock/profiles"] = throttled_once
+    client = Client()
+
+    response = client.get(
+        f"{stub_server.url}/v2/skyblock/profiles", headers={"API-Key": "key"}
+    )
+
+    assert response.status_code == 200
+    assert calls == ["key", "key"]
+    assert client.stats.throttled == 1
+    assert client.rate_limiter("key").tokens == 9
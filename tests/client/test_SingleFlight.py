@@ -0,0 +1,221 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
+
+import pytest
+
+from hyparse import Client, Player
+from hyparse.client import SingleFlight
+
+from conftest import PLAYER_NAME, UUID
+
+API_KEY = "ABCDEFG"
+
+
+def blocked_call(release: Event, result="result"):
+    """A call that blocks until release is set, counting how often it ran"""
+    calls = []
+
+    def call():
+        calls.append(1)
+        release.wait(5)
+        return result
+
+    return call, calls
+
+
+def test_concurrent_calls_for_a_key_are_coalesced():
+    flight = SingleFlight()
+    release = Event()
+    call, calls = blocked_call(release)
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(flight.do, "key", call) for _ in range(4)]
+        while flight.stats()["coalesced"] < 3:
+            pass
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    assert flight.stats() == {"calls": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_finished_calls_are_not_reused():
+    flight = SingleFlight()
+
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight.stats()["coalesced"] == 0
+
+
+def test_different_keys_are_not_coalesced():
+    flight = SingleFlight()
+    barrier = Barrier(2)
+
+    def call(value):
+        barrier.wait(5)
+        return value
+
+    with ThreadPoolExecutor(2) as pool:
+        first = pool.submit(flight.do, "a", lambda: call("a"))
+        second = pool.submit(flight.do, "b", lambda: call("b"))
+
+        assert (first.result(), second.result()) == ("a", "b")
+
+
+def test_exceptions_are_copied_for_waiters():
+    flight = SingleFlight()
+    release = Event()
+
+    def fail():
+        release.wait(5)
+        raise KeyError("gone")
+
+    with ThreadPoolExecutor(2) as pool:
+        futures = [pool.submit(flight.do, "key", fail) for _ in range(2)]
+        while flight.stats()["coalesced"] < 1:
+            pass
+        release.set()
+
+        errors = []
+        for future in futures:
+            with pytest.raises(KeyError) as info:
+                future.result()
+            errors.append(info.value)
+
+    # The caller that made the call gets its exception, the other a copy of
+    # its own chained from it
+    made, waited = sorted(errors, key=lambda error: error.__cause__ is not None)
+    assert waited is not made
+    assert waited.__cause__ is made
+    assert waited.args == made.args
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_coroutine_waiters_get_their_own_exception():
+    flight = SingleFlight()
+    release = Event()
+
+    def fail():
+        release.wait(5)
+        raise KeyError("gone")
+
+    async def main():
+        waiters = [asyncio.create_task(flight.do_async("key", fail)) for _ in range(3)]
+        while flight.stats()["coalesced"] < 2:
+            await asyncio.sleep(0.001)
+        release.set()
+        return await asyncio.gather(*waiters, return_exceptions=True)
+
+    errors = asyncio.run(main())
+
+    assert all(isinstance(error, KeyError) for error in errors)
+    assert len({id(error) for error in errors}) == 3
+    assert len({id(error.__cause__) for error in errors}) == 1
+
+
+class Interrupt(BaseException):
+    pass
+
+
+def test_interrupts_are_not_shared():
+    flight = SingleFlight()
+    release = Event()
+
+    def interrupted():
+        release.wait(5)
+        raise Interrupt
+
+    with ThreadPoolExecutor(2) as pool:
+        futures = [pool.submit(flight.do, "key", interrupted) for _ in range(2)]
+        while flight.stats()["coalesced"] < 1:
+            pass
+        release.set()
+        errors = sorted(type(future.exception()).__name__ for future in futures)
+
+    # Only the interrupted caller sees the interrupt, the waiter isn't left hanging
+    assert errors == ["Interrupt", "RuntimeError"]
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_coroutines_and_threads_join_the_same_call():
+    flight = SingleFlight()
+    release = Event()
+    call, calls = blocked_call(release)
+
+    async def main():
+        waiters = [asyncio.create_task(flight.do_async("key", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        # A thread asking meanwhile waits on the coroutines' call
+        thread = asyncio.get_running_loop().run_in_executor(
+            None, flight.do, "key", call
+        )
+        while flight.stats()["coalesced"] < 3:
+            await asyncio.sleep(0.001)
+
+        # A waiter giving up doesn't cancel the call for the others
+        waiters[0].cancel()
+        release.set()
+        return await asyncio.gather(*waiters[1:], thread)
+
+    assert asyncio.run(main()) == ["result"] * 3
+    assert len(calls) == 1
+
+
+def test_threaded_players_share_requests(stub_player):
+    stub_player.delay = 0.1
+    client = Client()
+
+    with ThreadPoolExecutor(6) as pool:
+        players = list(
+            pool.map(
+                lambda _: Player(API_KEY, player_name=PLAYER_NAME, client=client),
+                range(6),
+            )
+        )
+
+    assert [url.split("?")[0] for _, url in stub_player.requests] == [
+        f"/users/profiles/minecraft/{PLAYER_NAME}",
+        "/v2/skyblock/profiles",
+    ]
+    assert all(player.uuid == UUID for player in players)
+    assert client.single_flight.stats()["coalesced"] > 0
+
+
+def test_threaded_players_dont_see_each_others_writes(stub_player):
+    stub_player.delay = 0.1
+    client = Client()
+
+    with ThreadPoolExecutor(2) as pool:
+        first, second = pool.map(
+            lambda _: Player(API_KEY, uuid=UUID, client=client), range(2)
+        )
+    second["coin_purse"] = 1_000
+
+    assert client.single_flight.stats()["coalesced"] == 1
+    assert "coin_purse" not in first
+    assert "coin_purse" not in first.profiles[first.profile_index]["members"][UUID]
+    assert second["coin_purse"] == 1_000
+
+
+def test_different_api_keys_are_not_coalesced(stub_player):
+    stub_player.delay = 0.1
+    client = Client()
+
+    with ThreadPoolExecutor(2) as pool:
+        list(
+            pool.map(
+                lambda key: Player(key, uuid=UUID, client=client), ["KEY_A", "KEY_B"]
+            )
+        )
+
+    assert len(stub_player.requests) == 2
+
+
+def test_coalescing_can_be_turned_off(stub_player):
+    client = Client(coalesce=False)
+
+    Player(API_KEY, uuid=UUID, client=client)
+
+    assert client.single_flight is None
@@ -0,0 +1,201 @@
+import pytest
+
+from base64 import b64encode
+from gzip import compress
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from json import dumps, load, loads
+from os import path
+from threading import Lock, Thread
+from time import sleep
+from typing import Any, Callable, Dict, Generator, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from nbtlib import Byte, Compound, File, Int, List as NBTList, String
+
+from hyparse import Client, Player
+
+UUID = "0959dfbde98d4b348271ad0c5728f4fe"
+PLAYER_NAME = "TheFieryWarrior"
+
+TEST_JSON = path.join(path.dirname(__file__), "json", "test_Player.json")
+
+# A route gets (path, query, headers, body) and returns (status, headers, body)
+Route = Callable[
+    [str, Dict[str, List[str]], Dict[str, str], bytes],
+    Tuple[int, Dict[str, str], Any],
+]
+
+
+def encode_nbt(root: File) -> bytes:
+    buffer = BytesIO()
+    root.write(buffer)
+    return buffer.getvalue()
+
+
+def make_blob(root: File) -> str:
+    """Encode an NBT root the way inventory data is stored: gzip then base64"""
+    return b64encode(compress(encode_nbt(root))).decode()
+
+
+def make_item(item_id: str, count: int = 1, uuid: str | None = None) -> Compound:
+    extra = Compound({"id": String(item_id)})
+    if uuid is not None:
+        extra["uuid"] = String(uuid)
+    return Compound(
+        {
+            "Count": Byte(count),
+            "tag": Compound(
+                {
+                    "display": Compound(
+                        {"Name": String(item_id.title()), "Lore": NBTList[String]()}
+                    ),
+                    "ExtraAttributes": extra,
+                    "HideFlags": Int(254),
+                }
+            ),
+        }
+    )
+
+
+def make_section(*items: Compound) -> str:
+    """A blob whose "i" list holds items, with Compound() for empty slots"""
+    return make_blob(File({"i": NBTList[Compound](items)}))
+
+
+class FakeClock:
+    """A clock for TTLs and ages, moved by setting now"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubServer:
+    """A local HTTP/1.1 server standing in for the Hypixel and Mojang APIs."""
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, Route] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _handle(self) -> None:
+                with stub._lock:
+                    stub.in_flight += 1
+                    stub.peak_in_flight = max(stub.peak_in_flight, stub.in_flight)
+                    stub.requests.append((self.command, self.path))
+                try:
+                    if stub.delay:
+                        sleep(stub.delay)
+                    length = int(self.headers.get("Content-Length") or 0)
+                    request_body = self.rfile.read(length) if length else b""
+                    status, headers, body = stub.dispatch(
+                        self.path, dict(self.headers), request_body
+                    )
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+                if not isinstance(body, bytes):
+                    body = dumps(body).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _handle
+            do_POST = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def dispatch(
+        self, raw_path: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Dict[str, str], Any]:
+        parts = urlsplit(raw_path)
+        query = parse_qs(parts.query)
+        # Longest matching prefix wins so "/a/b" can override "/a"
+        for prefix in sorted(self.routes, key=len, reverse=True):
+            if parts.path.startswith(prefix):
+                return self.routes[prefix](parts.path, query, headers, body)
+        return 404, {}, {"success": False, "cause": "Not found"}
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def profile_data() -> Dict[str, Any]:
+    with open(TEST_JSON) as file:
+        return load(file)
+
+
+@pytest.fixture
+def stub_server(profile_data) -> Generator[StubServer, None, None]:
+    server = StubServer()
+
+    def profiles(path, query, headers, body):
+        return 200, {}, profile_data
+
+    def mojang(path, query, headers, body):
+        name = path.rsplit("/", 1)[-1]
+        if name.lower() == PLAYER_NAME.lower():
+            return 200, {}, {"id": UUID, "name": PLAYER_NAME}
+        return 404, {}, {"errorMessage": f"Couldn't find any profile with name {name}"}
+
+    def mojang_bulk(path, query, headers, body):
+        names = loads(body)
+        if len(names) > 10:
+            return 400, {}, {"errorMessage": "Not more that 10 profile name per call"}
+        found = [name for name in names if name.lower() == PLAYER_NAME.lower()]
+        return 200, {}, [{"id": UUID, "name": PLAYER_NAME} for _ in found]
+
+    server.routes["/v2/skyblock/profiles"] = profiles
+    server.routes["/users/profiles/minecraft/"] = mojang
+    server.routes["/profiles/minecraft"] = mojang_bulk
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def stub_player(stub_server, monkeypatch) -> StubServer:
+    """Point every Player at the local stub server"""
+    monkeypatch.setattr(Player, "_base_url", f"{stub_server.url}/v2/skyblock")
+    monkeypatch.setattr(
+        Player, "_mojang_url", f"{stub_server.url}/users/profiles/minecraft"
+    )
+    monkeypatch.setattr(
+        Client, "mojang_bulk_url", f"{stub_server.url}/profiles/minecraft"
+    )
+    return stub_server
@@ -0,0 +1,133 @@
+import json
+import numpy as np
+import pytest
+
+from unittest.mock import patch
+
+from hyparse.levels import (
+    LevelTable,
+    SkillLevel,
+    get_level_table,
+    getSkillLevel,
+    getSkillLevels,
+)
+from hyparse.levels.Levels import JSON_PATH
+
+
+def reference_level(initial_exp, is_catacombs=False):
+    """The original linear scan over levels.json"""
+    with open(JSON_PATH) as f:
+        skill_data = json.load(f)["Catacombs" if is_catacombs else "Skills"]
+
+    cumulative_xp = {int(level): row[1] for level, row in skill_data.items()}
+    xp_required = {int(level): row[0] for level, row in skill_data.items()}
+
+    for level in sorted(cumulative_xp):
+        if initial_exp < cumulative_xp[level]:
+            skill_level = level - 1
+            break
+    else:
+        skill_level = max(cumulative_xp)
+
+    return {
+        "skill_level": skill_level,
+        "remaining_xp": initial_exp - cumulative_xp.get(skill_level, 0),
+        "xp_required_to_level_up": xp_required.get(skill_level + 1, 0),
+    }
+
+
+@pytest.mark.parametrize("is_catacombs", [False, True])
+def test_matches_reference_implementation(is_catacombs):
+    table = get_level_table("Catacombs" if is_catacombs else "Skills")
+    # Every boundary, either side of it, and some random values
+    samples = [0, -5, 0.5, 1e12]
+    for total in table.cumulative_xp:
+        samples += [total - 1, total, total + 0.25]
+    samples += list(np.random.default_rng(0).uniform(0, 8e8, 200))
+
+    for xp in samples:
+        assert getSkillLevel(xp, is_catacombs) == reference_level(xp, is_catacombs)
+
+
+def test_levels_json_is_read_once():
+    get_level_table("Skills")
+
+    with patch("builtins.open") as mock_open:
+        for _ in range(10):
+            getSkillLevel(1_000_000)
+
+    mock_open.assert_not_called()
+
+
+def test_overflow_levels():
+    catacombs = get_level_table("Catacombs")
+    xp = catacombs.cumulative_xp[-1] + 2.5 * 200_000_000
+
+    info = getSkillLevel(xp, is_catacombs=True, overflow=True)
+
+    assert info["skill_level"] == 52
+    assert info["remaining_xp"] == 100_000_000
+    assert info["xp_required_to_level_up"] == 200_000_000
+    assert getSkillLevel(xp, is_catacombs=True)["skill_level"] == 50
+
+
+def test_skills_overflow_uses_last_level_cost():
+    skills = get_level_table("Skills")
+    xp = skills.cumulative_xp[-1] + skills.xp_required[-1]
+
+    assert getSkillLevel(xp, overflow=True)["skill_level"] == 61
+
+
+@pytest.mark.parametrize("name", ["Skills", "Catacombs"])
+@pytest.mark.parametrize("overflow", [False, True])
+def test_vectorized_matches_scalar(name, overflow):
+    xp = np.random.default_rng(1).uniform(0, 2e9, 1000)
+    xp[:3] = [0, get_level_table(name).cumulative_xp[5], 1e11]
+
+    arrays = getSkillLevels(xp, table=name, overflow=overflow)
+
+    for i, value in enumerate(xp):
+        expected = getSkillLevel(value, name == "Catacombs", overflow)
+        assert arrays["skill_level"][i] == expected["skill_level"]
+        assert arrays["remaining_xp"][i] == pytest.approx(expected["remaining_xp"])
+        assert arrays["xp_required_to_level_up"][i] == pytest.approx(
+            expected["xp_required_to_level_up"]
+        )
+
+
+def test_vectorized_keeps_shape():
+    arrays = getSkillLevels(np.zeros((4, 3)), table="Catacombs")
+
+    assert arrays["skill_level"].shape == (4, 3)
+
+
+def test_table_arrays_are_read_only():
+    cumulative, required = get_level_table("Skills").arrays()
+
+    with pytest.raises(ValueError):
+        cumulative[0] = 1
+
+
+def test_custom_table():
+    table = LevelTable.from_levels("Tiny", {"2": [20, 30], "1": [10, 10]})
+
+    assert table.level(15) == {
+        "skill_level": 1,
+        "remaining_xp": 5,
+        "xp_required_to_level_up": 20,
+    }
+    assert getSkillLevels([35], table=table)["skill_level"].tolist() == [2]
+
+
+def test_misaligned_table_is_rejected():
+    with pytest.raises(ValueError):
+        LevelTable("Broken", [1, 2], [1])
+
+
+@pytest.mark.parametrize("overflow", [False, True])
+def test_compact_levels_match_dicts(overflow):
+    for xp in (0, 1234.5, 55_172_425, 10**10):
+        compact = getSkillLevel(xp, overflow=overflow, compact=True)
+
+        assert isinstance(compact, SkillLevel)
+        assert compact.to_dict() == getSkillLevel(xp, overflow=overflow)
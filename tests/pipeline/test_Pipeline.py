@@ -0,0 +1,105 @@
+import io
+import json
+
+import pytest
+
+from hyparse import Client
+from hyparse.pipeline import (
+    Checkpoint,
+    iter_records,
+    read_identifiers,
+    run_pipeline,
+)
+from hyparse.tracing import Tracer
+
+from conftest import PLAYER_NAME, UUID
+
+API_KEY = "ABCDEFG"
+
+
+def records(output: io.StringIO):
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_read_identifiers():
+    lines = ["TheFieryWarrior\n", "\n", "# a comment\n", f"  {UUID}  \n"]
+
+    assert list(read_identifiers(lines)) == [PLAYER_NAME, UUID]
+
+
+def test_records_have_every_view(stub_player):
+    (record,) = iter_records(API_KEY, [PLAYER_NAME], client=Client())
+
+    assert record["input"] == PLAYER_NAME
+    assert record["uuid"] == UUID
+    assert set(record) >= {"skills", "catacombs", "trophy_fish", "purse", "inventory"}
+    assert record["catacombs"]["level"]["skill_level"] >= 0
+
+
+def test_failures_become_error_records(stub_player):
+    (record,) = iter_records(API_KEY, ["NobodyHere"], ["purse"], client=Client())
+
+    assert record == {
+        "input": "NobodyHere",
+        "error": "UserNotFound: Minecraft user was not found",
+    }
+
+
+def test_unknown_views_are_rejected():
+    with pytest.raises(ValueError):
+        next(iter_records(API_KEY, [UUID], ["wealth"]))
+
+
+def test_input_is_consumed_lazily(stub_player):
+    pulled = []
+
+    def identifiers():
+        for _ in range(50):
+            pulled.append(UUID)
+            yield UUID
+
+    stream = iter_records(API_KEY, identifiers(), ["purse"], concurrency=2)
+    next(stream)
+
+    # Two workers keep at most four players queued
+    assert len(pulled) <= 5
+    assert len(list(stream)) == 49
+
+
+def test_tracer_sees_worker_stages(stub_player):
+    events = []
+
+    with Tracer(events.append):
+        list(iter_records(API_KEY, [UUID, UUID], ["purse"], client=Client()))
+
+    assert sum(event.stage == "fetch_profiles" for event in events) == 2
+
+
+def test_resume_from_checkpoint(stub_player, tmp_path):
+    players = [UUID, PLAYER_NAME, "NobodyHere"]
+    path = tmp_path / "crawl.ckpt"
+
+    with Checkpoint(path) as checkpoint:
+        checkpoint.mark(UUID)
+
+    output = io.StringIO()
+    with Checkpoint(path) as checkpoint:
+        stats = run_pipeline(
+            API_KEY, players, output, ["purse"], checkpoint=checkpoint, client=Client()
+        )
+
+    assert stats == {"done": 1, "failed": 1, "skipped": 1}
+    assert sorted(record["input"] for record in records(output)) == [
+        "NobodyHere",
+        PLAYER_NAME,
+    ]
+    # Only successes are checkpointed, failures are retried next time
+    assert Checkpoint(path).done == {UUID, PLAYER_NAME}
+
+
+def test_torn_checkpoint_line_is_retried(tmp_path):
+    path = tmp_path / "crawl.ckpt"
+    path.write_text(f"{UUID}\n{PLAYER_NAME[:4]}")
+
+    with Checkpoint(path) as checkpoint:
+        assert checkpoint.done == {UUID}
@@ -0,0 +1,127 @@
+import io
+import json
+
+import pytest
+
+from hyparse.__main__ import main
+
+from conftest import PLAYER_NAME, UUID
+
+
+def test_crawl_and_resume(stub_player, tmp_path, capsys):
+    players = tmp_path / "players.txt"
+    players.write_text(f"{PLAYER_NAME}\n")
+    output = tmp_path / "out.ndjson"
+    checkpoint = tmp_path / "crawl.ckpt"
+    args = [
+        str(players),
+        "-k",
+        "ABCDEFG",
+        "-o",
+        str(output),
+        "--views",
+        "skills",
+        "purse",
+        "--checkpoint",
+        str(checkpoint),
+    ]
+
+    assert main(args) == 0
+    players.write_text(f"{PLAYER_NAME}\n{UUID}\n")
+    assert main(args) == 0
+
+    lines = output.read_text().splitlines()
+    assert [json.loads(line)["input"] for line in lines] == [PLAYER_NAME, UUID]
+    assert set(json.loads(lines[0])) == {
+        "input",
+        "uuid",
+        "profile_id",
+        "cute_name",
+        "skills",
+        "purse",
+    }
+    assert json.loads(capsys.readouterr().err.splitlines()[-1]) == {
+        "done": 1,
+        "failed": 0,
+        "skipped": 1,
+    }
+
+
+def test_api_key_is_required(monkeypatch):
+    monkeypatch.delenv("HYPIXEL_API_KEY", raising=False)
+
+    with pytest.raises(SystemExit):
+        main(["-"])
+
+
+def test_reads_stdin_and_writes_stdout(stub_player, monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO(f"# players\n\n{PLAYER_NAME}\n"))
+
+    assert main(["-k", "ABCDEFG", "--views", "purse"]) == 0
+
+    out, err = capsys.readouterr()
+    (record,) = [json.loads(line) for line in out.splitlines()]
+    assert record["input"] == PLAYER_NAME
+    assert record["uuid"] == UUID
+    assert "purse" in record
+    assert json.loads(err.splitlines()[-1])["done"] == 1
+
+
+def test_bad_players_become_error_records(stub_player, tmp_path, capsys):
+    players = tmp_path / "players.txt"
+    players.write_text(f"NobodyHere\n{UUID}\n")
+
+    assert main([str(players), "-k", "ABCDEFG", "--views", "purse"]) == 0
+
+    out, err = capsys.readouterr()
+    records = {record["input"]: record for record in map(json.loads, out.splitlines())}
+    assert records["NobodyHere"] == {
+        "input": "NobodyHere",
+        "error": "UserNotFound: Minecraft user was not found",
+    }
+    assert "purse" in records[UUID]
+    assert json.loads(err.splitlines()[-1]) == {"done": 1, "failed": 1, "skipped": 0}
+
+
+def test_output_file_is_replaced_without_a_checkpoint(stub_player, tmp_path):
+    players = tmp_path / "players.txt"
+    players.write_text(f"{UUID}\n")
+    output = tmp_path / "out.ndjson"
+    output.write_text("left over from an earlier crawl\n")
+
+    assert main([str(players), "-k", "ABCDEFG", "-o", str(output)]) == 0
+    assert main([str(players), "-k", "ABCDEFG", "-o", str(output)]) == 0
+
+    (line,) = output.read_text().splitlines()
+    assert json.loads(line)["uuid"] == UUID
+
+
+def test_resume_skips_checkpointed_players(stub_player, tmp_path, capsys):
+    players = tmp_path / "players.txt"
+    players.write_text(f"{UUID}\n{PLAYER_NAME}\n")
+    checkpoint = tmp_path / "crawl.ckpt"
+    checkpoint.write_text(f"{UUID}\n")
+    output = tmp_path / "out.ndjson"
+    args = [str(players), "-k", "ABCDEFG", "-o", str(output)]
+
+    assert main([*args, "--checkpoint", str(checkpoint)]) == 0
+
+    (line,) = output.read_text().splitlines()
+    assert json.loads(line)["input"] == PLAYER_NAME
+    assert checkpoint.read_text().splitlines() == [UUID, PLAYER_NAME]
+    assert json.loads(capsys.readouterr().err.splitlines()[-1])["skipped"] == 1
+    # Only the player from the name was fetched
+    profiles = [url for _, url in stub_player.requests if "/skyblock/" in url]
+    assert len(profiles) == 1
+
+
+def test_views_are_selected(stub_player, tmp_path, capsys):
+    players = tmp_path / "players.txt"
+    players.write_text(f"{UUID}\n")
+
+    assert main([str(players), "-k", "ABCDEFG", "--views", "catacombs"]) == 0
+    (record,) = map(json.loads, capsys.readouterr().out.splitlines())
+    assert set(record) == {"input", "uuid", "profile_id", "cute_name", "catacombs"}
+
+    with pytest.raises(SystemExit):
+        main([str(players), "-k", "ABCDEFG", "--views", "wealth"])
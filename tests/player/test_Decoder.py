@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+
+from nbtlib import (
+    Byte,
+    ByteArray,
+    Compound,
+    Double,
+    Float,
+    Int,
+    IntArray,
+    List,
+    Long,
+    LongArray,
+    Short,
+    String,
+)
+
+from nbtlib import File
+
+from hyparse.player.Inventory.Decoder import (
+    compile_fields,
+    decode_nbt,
+    project,
+)
+from hyparse.player.Inventory.NBT import _nbt_to_json, _nbt_to_json_nbtlib
+
+from conftest import encode_nbt as to_bytes, make_blob as to_blob
+
+
+def normalize(value):
+    """nbtlib keeps arrays as NumPy arrays, the native decoder returns lists"""
+    if isinstance(value, dict):
+        return {key: normalize(item) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+    return value
+
+
+EVERY_TAG = File(
+    {
+        "byte": Byte(-5),
+        "short": Short(-300),
+        "int": Int(2**31 - 1),
+        "long": Long(-(2**63)),
+        "float": Float(1.5),
+        "double": Double(-2.25),
+        "string": String("§6Hyperion ✪ ünïcödé"),
+        "byte_array": ByteArray([-128, 0, 127]),
+        "int_array": IntArray([1, -2, 3]),
+        "long_array": LongArray([2**40, -1]),
+        "empty_list": List[Int](),
+        "numbers": List[Short]([1, 2, 3]),
+        "strings": List[String](["a", "b"]),
+        "nested": List[List[Int]]([List[Int]([1]), List[Int]([2, 3])]),
+        "compounds": List[Compound]([Compound({"id": String("HYPERION")}), Compound()]),
+        "compound": Compound({"inner": Compound({"x": Int(1)})}),
+    }
+)
+
+
+def test_decodes_every_tag_type():
+    decoded = decode_nbt(to_bytes(EVERY_TAG))
+
+    assert decoded["long"] == -(2**63)
+    assert decoded["float"] == 1.5
+    assert decoded["string"] == "§6Hyperion ✪ ünïcödé"
+    assert decoded["byte_array"] == [-128, 0, 127]
+    assert decoded["long_array"] == [2**40, -1]
+    assert decoded["nested"] == [[1], [2, 3]]
+    assert decoded["compounds"] == [{"id": "HYPERION"}, {}]
+    assert decoded["compound"] == {"inner": {"x": 1}}
+
+
+def test_matches_nbtlib_output():
+    blob = to_blob(EVERY_TAG)
+
+    assert _nbt_to_json(blob) == normalize(_nbt_to_json_nbtlib(blob))
+
+
+def test_returns_plain_python_types():
+    decoded = decode_nbt(to_bytes(EVERY_TAG))
+
+    assert type(decoded["int"]) is int
+    assert type(decoded["string"]) is str
+    assert type(decoded["numbers"]) is list
+    assert type(decoded["compound"]) is dict
+
+
+def test_accepts_memoryview():
+    data = to_bytes(EVERY_TAG)
+
+    assert decode_nbt(memoryview(data)) == decode_nbt(data)
+
+
+def test_accepts_writable_memoryview():
+    data = to_bytes(EVERY_TAG)
+    writable = memoryview(bytearray(data))
+    fields = ["compound.inner.x", "compounds.id", "string"]
+
+    assert decode_nbt(writable) == decode_nbt(data)
+    assert decode_nbt(writable, fields) == decode_nbt(data, fields)
+
+
+def test_keeps_key_order():
+    decoded = decode_nbt(to_bytes(EVERY_TAG))
+
+    assert list(decoded) == list(EVERY_TAG)
+
+
+def test_empty_blob():
+    assert _nbt_to_json("") == {}
+
+
+def test_truncated_data():
+    data = to_bytes(EVERY_TAG)
+
+    with pytest.raises(ValueError):
+        decode_nbt(data[: len(data) // 2])
+
+
+def test_non_compound_root():
+    with pytest.raises(ValueError):
+        decode_nbt(b"\x08\x00\x00\x00\x01a")
+
+
+def test_compile_fields():
+    assert compile_fields(["a.b", "a.c", "d"]) == {
+        "a": {"b": True, "c": True},
+        "d": True,
+    }
+    # A shorter path keeps the whole subtree
+    assert compile_fields(["a", "a.b"]) == {"a": True}
+    assert compile_fields(["a.b", "a"]) == {"a": True}
+
+    with pytest.raises(ValueError):
+        compile_fields(["a..b"])
+
+
+def test_projected_decode():
+    decoded = decode_nbt(
+        to_bytes(EVERY_TAG), ["compound.inner.x", "compounds.id", "string"]
+    )
+
+    assert decoded == {
+        "string": "§6Hyperion ✪ ünïcödé",
+        "compounds": [{"id": "HYPERION"}, {}],
+        "compound": {"inner": {"x": 1}},
+    }
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["numbers", "nested"],
+        ["strings.deeper", "byte"],
+        ["compounds", "empty_list"],
+        ["missing.path"],
+        ["nested.too.deep", "long_array"],
+    ],
+)
+def test_projected_decode_matches_projecting_full_decode(fields):
+    data = to_bytes(EVERY_TAG)
+    projection = compile_fields(fields)
+
+    assert decode_nbt(data, projection) == (project(decode_nbt(data), projection) or {})
+    assert decode_nbt(memoryview(data), projection) == decode_nbt(data, projection)
+    assert decode_nbt(bytearray(data), projection) == decode_nbt(data, projection)
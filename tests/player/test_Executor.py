@@ -0,0 +1,70 @@
+import pytest
+
+from hyparse.player import NBTExecutor, configure_executor, get_executor
+from hyparse.player.Inventory import Executor
+from hyparse.player.Inventory.NBT import _nbt_to_json
+
+from conftest import make_item, make_section
+
+BLOBS = [
+    make_section(*(make_item(f"ITEM_{n}_{i}", i + 1) for i in range(n)))
+    for n in (1, 8, 3, 12, 5)
+]
+
+
+def test_small_batches_are_decoded_inline():
+    executor = NBTExecutor(max_workers=4)
+
+    assert executor.strategy(BLOBS[:1]) == "inline"
+    assert executor.strategy(BLOBS) == "inline"
+    assert NBTExecutor(max_workers=1, inline_threshold=0).strategy(BLOBS) == "inline"
+
+
+def test_large_batches_use_processes_or_threads(monkeypatch):
+    executor = NBTExecutor(max_workers=4, inline_threshold=0, process_threshold=0)
+    assert executor.strategy(BLOBS) == "processes"
+
+    monkeypatch.setattr(Executor, "_free_threaded", lambda: True)
+    assert executor.strategy(BLOBS) == "threads"
+
+
+@pytest.mark.parametrize("strategy", ["inline", "threads", "processes"])
+def test_results_keep_order(strategy):
+    executor = NBTExecutor(max_workers=2)
+    try:
+        assert executor.map(BLOBS, strategy) == [_nbt_to_json(b) for b in BLOBS]
+    finally:
+        executor.shutdown()
+
+
+def test_pools_are_reused():
+    executor = NBTExecutor(max_workers=2)
+    executor.map(BLOBS, "threads")
+    pool = executor._threads
+
+    executor.map(BLOBS, "threads")
+
+    assert executor._threads is pool
+    executor.shutdown()
+    assert executor._threads is None
+
+
+def test_chunks_are_balanced_by_size():
+    blobs = ["a" * 10, "b" * 1, "c" * 6, "d" * 5]
+
+    groups = Executor._chunk(blobs, 2)
+
+    assert sorted(sum(groups, [])) == [0, 1, 2, 3]
+    assert sorted(sum(len(blobs[i]) for i in group) for group in groups) == [11, 11]
+    assert len(Executor._chunk(blobs, 10)) == len(blobs)
+
+
+def test_configure_executor_replaces_shared_executor():
+    previous = get_executor()
+    try:
+        executor = configure_executor(max_workers=3, inline_threshold=1)
+
+        assert get_executor() is executor is not previous
+        assert executor.max_workers == 3
+    finally:
+        configure_executor()
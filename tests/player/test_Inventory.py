@@ -0,0 +1,120 @@
+from copy import deepcopy
+
+from nbtlib import Compound
+
+from hyparse.player import Inventory
+
+from conftest import make_item, make_section
+
+SKYBLOCK_DATA = {
+    "inventory": {
+        "inv_contents": {
+            "type": 0,
+            "data": make_section(
+                make_item("HYPERION", uuid="a-1"),
+                Compound(),
+                make_item("SPIRIT_LEAP", 16),
+            ),
+        },
+        "ender_chest_contents": {
+            "type": 0,
+            "data": make_section(make_item("DIRT", 64)),
+        },
+        "bag_contents": {
+            "talisman_bag": {"type": 0, "data": make_section(make_item("RING"))}
+        },
+        "backpack_contents": {
+            "0": {"type": 0, "data": make_section(make_item("TERMINATOR"))},
+        },
+    }
+}
+
+FIELDS = ["tag.ExtraAttributes.id", "Count"]
+
+
+def test_lazy_sections_are_decoded_on_access():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    assert inventory._parsed_nbt == {}
+    assert inventory.player_inventory["i"][1] == {}
+    assert "inv_contents" in inventory._parsed_nbt
+
+
+def test_backpacks():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    backpacks = inventory.backpacks
+
+    assert list(backpacks) == ["0"]
+    assert backpacks["0"][0]["tag"]["ExtraAttributes"]["id"] == "TERMINATOR"
+
+
+def test_select_keeps_slots():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    selected = inventory.select("inv_contents", FIELDS)
+
+    assert selected == [
+        {"Count": 1, "tag": {"ExtraAttributes": {"id": "HYPERION"}}},
+        {},
+        {"Count": 16, "tag": {"ExtraAttributes": {"id": "SPIRIT_LEAP"}}},
+    ]
+    # Projected reads don't populate the full decode cache
+    assert "inv_contents" not in inventory._parsed_nbt
+
+
+def test_select_from_decoded_section_matches():
+    lazy = Inventory(SKYBLOCK_DATA, lazy_load=True)
+    decoded = Inventory(SKYBLOCK_DATA, lazy_load=True)
+    decoded.player_inventory
+
+    assert decoded.select("inv_contents", FIELDS) == lazy.select("inv_contents", FIELDS)
+
+
+def test_select_nested_section():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    assert inventory.select(
+        "bag_contents/talisman_bag", ["tag.ExtraAttributes.id"]
+    ) == [{"tag": {"ExtraAttributes": {"id": "RING"}}}]
+    assert inventory.select("backpack_contents/0", ["Count"]) == [{"Count": 1}]
+
+
+def test_select_missing_section():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    assert inventory.select("personal_vault_contents", FIELDS) == []
+
+
+def test_equality_compares_decoded_sections():
+    assert Inventory(SKYBLOCK_DATA, lazy_load=True) == Inventory(
+        SKYBLOCK_DATA, lazy_load=True
+    )
+    assert Inventory(SKYBLOCK_DATA, lazy_load=True) != Inventory({}, lazy_load=True)
+
+
+def test_equal_raw_data_is_not_decoded():
+    first = Inventory(SKYBLOCK_DATA, lazy_load=True)
+    second = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    assert first == second
+    assert first._parsed_nbt == second._parsed_nbt == {}
+
+
+def test_update_only_drops_changed_sections():
+    newer = deepcopy(SKYBLOCK_DATA)
+    newer["inventory"]["ender_chest_contents"]["data"] = make_section(make_item("SAND"))
+    newer["inventory"]["backpack_contents"]["1"] = {
+        "type": 0,
+        "data": make_section(make_item("DIRT")),
+    }
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=False)
+    player_inventory = inventory.player_inventory
+
+    changed = inventory.update(newer)
+
+    assert sorted(changed) == ["backpack_contents/1", "ender_chest_contents"]
+    assert inventory.player_inventory is player_inventory
+    assert set(inventory.backpacks) == {"0", "1"}
+    assert inventory.count("SAND") == 1
+    assert inventory.update(newer) == []
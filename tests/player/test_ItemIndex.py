@@ -0,0 +1,81 @@
+from nbtlib import Compound
+
+from hyparse.player import Inventory, ItemIndex, ItemRecord
+
+from conftest import make_item, make_section
+
+SKYBLOCK_DATA = {
+    "inventory": {
+        "inv_contents": {
+            "type": 0,
+            "data": make_section(
+                make_item("HYPERION", uuid="a-1"),
+                Compound(),
+                make_item("SPIRIT_LEAP", 16),
+            ),
+        },
+        "ender_chest_contents": {
+            "type": 0,
+            "data": make_section(make_item("SPIRIT_LEAP", 64), make_item("DIRT", 3)),
+        },
+        "backpack_contents": {
+            "0": {"type": 0, "data": make_section(make_item("HYPERION", uuid="a-2"))},
+            "1": {"type": 0, "data": ""},
+        },
+    }
+}
+
+
+def test_find_items_by_id():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    assert inventory.find_items(id="HYPERION") == [
+        ItemRecord("inv_contents", 0, "HYPERION", 1, "a-1"),
+        ItemRecord("backpack_contents/0", 0, "HYPERION", 1, "a-2"),
+    ]
+    assert inventory.find_items(id="TERMINATOR") == []
+
+
+def test_find_items_by_uuid():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    assert inventory.find_items(uuid="a-2") == [
+        ItemRecord("backpack_contents/0", 0, "HYPERION", 1, "a-2")
+    ]
+    assert inventory.find_items(id="DIRT", uuid="a-2") == []
+
+
+def test_count_sums_stacks_across_sections():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    assert inventory.count(id="SPIRIT_LEAP") == 80
+    assert inventory.count(id="HYPERION") == 2
+    assert inventory.count(id="TERMINATOR") == 0
+
+
+def test_index_is_built_once_without_full_decode():
+    inventory = Inventory(SKYBLOCK_DATA, lazy_load=True)
+
+    index = inventory.item_index()
+
+    assert inventory.item_index() is index
+    assert inventory._parsed_nbt == {}
+    assert len(index) == 5
+    assert index.ids() == ["HYPERION", "SPIRIT_LEAP", "DIRT"]
+
+
+def test_index_matches_decoded_inventory():
+    lazy = Inventory(SKYBLOCK_DATA, lazy_load=True).item_index()
+    eager = Inventory(SKYBLOCK_DATA, lazy_load=False).item_index()
+
+    assert list(lazy) == list(eager)
+
+
+def test_from_sections_skips_slots_without_id():
+    index = ItemIndex.from_sections(
+        [("wardrobe_contents", [{}, {"id": 1, "Count": 1}, {"tag": {}}])]
+    )
+
+    assert len(index) == 0
+    assert index.sections == ["wardrobe_contents"]
+    assert "HYPERION" not in index
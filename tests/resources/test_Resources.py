@@ -0,0 +1,276 @@
+import json
+import socket
+from importlib import import_module
+from threading import Event, Thread
+
+import pytest
+
+from hyparse import Client, Member
+from hyparse.exceptions import ResourceUnavailable
+from hyparse.levels import get_level_table, getSkillLevel, set_level_tables
+from hyparse.levels.Levels import JSON_PATH
+from hyparse.resources import (
+    Resources,
+    compile_skill_tables,
+    update_level_tables,
+)
+from hyparse.table import PlayerTable
+
+from conftest import FakeClock
+
+SKILLS_PATH = "/v2/resources/skyblock/skills"
+
+# The module, hyparse.resources.Resources is the class
+resources_module = import_module("hyparse.resources.Resources")
+
+
+def skills_resource(scale: float = 1.0):
+    """The skills resource, with the bundled curve times scale for most skills"""
+    with open(JSON_PATH) as f:
+        bundled = json.load(f)["Skills"]
+
+    curve = [
+        {"level": int(level), "totalExpRequired": row[1] * scale, "unlocks": []}
+        for level, row in bundled.items()
+    ]
+    return {
+        "success": True,
+        "lastUpdated": 1_700_000_000_000,
+        "version": "0.20.1",
+        "skills": {
+            "MINING": {"name": "Mining", "maxLevel": 60, "levels": curve},
+            "FISHING": {"name": "Fishing", "maxLevel": 50, "levels": curve[:50]},
+            "RUNECRAFTING": {
+                "name": "Runecrafting",
+                "maxLevel": 3,
+                "levels": [
+                    {"level": 1, "totalExpRequired": 50.0},
+                    {"level": 2, "totalExpRequired": 150.0},
+                    {"level": 3, "totalExpRequired": 425.0},
+                ],
+            },
+        },
+    }
+
+
+class Served:
+    """What the stub server answers for the skills resource"""
+
+    def __init__(self) -> None:
+        self.body = skills_resource()
+        self.etag = '"v1"'
+        self.status = 200
+        self.conditional = []
+
+    def __call__(self, path, query, headers, body):
+        self.conditional.append(
+            (headers.get("If-None-Match"), headers.get("If-Modified-Since"))
+        )
+        if self.status != 200:
+            return self.status, {}, {"success": False}
+        validators = {
+            "ETag": self.etag,
+            "Last-Modified": "Sat, 18 Oct 2026 10:00:00 GMT",
+        }
+        if headers.get("If-None-Match") == self.etag:
+            return 304, validators, b""
+        return 200, validators, self.body
+
+
+@pytest.fixture
+def served(stub_server, monkeypatch):
+    served = Served()
+    stub_server.routes[SKILLS_PATH] = served
+    monkeypatch.setattr(
+        Resources, "base_url", f"{stub_server.url}/v2/resources/skyblock"
+    )
+    yield served
+    set_level_tables(None)
+
+
+def test_fresh_copy_is_not_revalidated(served):
+    clock = FakeClock()
+    resources = Resources(client=Client(), clock=clock, max_age=60)
+
+    first = resources.get("skills")
+    clock.now += 30
+    second = resources.get("skills")
+
+    assert first.source == "network"
+    assert first.etag == '"v1"'
+    assert first.version == "0.20.1"
+    assert second.source == "cache"
+    assert second.data is first.data
+    assert len(served.conditional) == 1
+
+
+def test_stale_copy_is_revalidated(served):
+    clock = FakeClock()
+    resources = Resources(client=Client(), clock=clock, max_age=60)
+    first = resources.get("skills")
+    clock.now += 61
+
+    second = resources.get("skills")
+
+    assert second.source == "not_modified"
+    assert second.data is first.data
+    assert second.fetched_at == clock.now
+    assert served.conditional[1] == ('"v1"', "Sat, 18 Oct 2026 10:00:00 GMT")
+    assert resources.get("skills").source == "cache"
+    assert resources.stats() == {
+        "requests": 2,
+        "downloaded": 1,
+        "not_modified": 1,
+        "stale": 0,
+    }
+
+
+def test_changed_resource_is_downloaded(served):
+    resources = Resources(client=Client())
+    resources.get("skills")
+    served.body = skills_resource(scale=2.0)
+    served.etag = '"v2"'
+
+    resource = resources.get("skills", revalidate=True)
+
+    assert resource.source == "network"
+    assert resource.etag == '"v2"'
+    assert resource.data == served.body
+
+
+def test_disk_cache_survives_restarts(served, tmp_path):
+    path = tmp_path / "resources.sqlite"
+    with Resources(path, client=Client()) as resources:
+        resources.get("skills")
+
+    with Resources(path, client=Client(), offline=True) as resources:
+        offline = resources.get("skills")
+    with Resources(path, client=Client(), max_age=0) as resources:
+        revalidated = resources.get("skills")
+
+    assert offline.source == "cache"
+    assert offline.data == served.body
+    assert revalidated.source == "not_modified"
+    assert len(served.conditional) == 2
+
+
+def test_entries_of_another_cache_version_are_ignored(served, tmp_path, monkeypatch):
+    path = tmp_path / "resources.sqlite"
+    with Resources(path, client=Client()) as resources:
+        resources.get("skills")
+
+    monkeypatch.setattr(resources_module, "CACHE_VERSION", 2)
+    with Resources(path, client=Client()) as resources:
+        assert resources.get("skills").source == "network"
+        assert served.conditional[-1] == (None, None)
+
+
+def test_errors_fall_back_to_the_cached_copy(served):
+    resources = Resources(client=Client(), max_age=0)
+    resources.get("skills")
+    served.status = 500
+
+    resource = resources.get("skills")
+
+    assert resource.source == "stale"
+    assert resource.data == served.body
+    assert resources.stats()["stale"] == 1
+    with pytest.raises(ResourceUnavailable):
+        resources.get("collections")
+
+
+def test_requests_are_made_without_the_lock(served, stub_server):
+    resources = Resources(client=Client(), max_age=0)
+    resources.get("skills")
+    started, release, waited = Event(), Event(), []
+
+    def slow(*request):
+        started.set()
+        waited.append(release.wait(5))
+        return served(*request)
+
+    stub_server.routes[SKILLS_PATH] = slow
+    thread = Thread(target=resources.get, args=("skills",))
+    thread.start()
+    started.wait(5)
+    # Would wait for the request above if it held the lock
+    stats = resources.stats()
+    release.set()
+    thread.join(5)
+
+    assert waited == [True]
+    assert stats["requests"] == 2
+    assert resources.stats()["not_modified"] == 1
+
+
+def test_offline_without_a_copy():
+    with pytest.raises(ResourceUnavailable):
+        Resources(offline=True).get("skills")
+
+
+def unreachable_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_level_tables_follow_the_resource(served):
+    served.body = skills_resource(scale=2.0)
+    bundled_catacombs = getSkillLevel(1_000_000, is_catacombs=True)
+
+    assert update_level_tables(Resources(client=Client())) == "network"
+
+    assert getSkillLevel(100)["skill_level"] == 1
+    assert getSkillLevel(55_172_425 * 2)["skill_level"] == 50
+    assert get_level_table("SKILL_RUNECRAFTING").max_level == 3
+    assert getSkillLevel(1_000_000, is_catacombs=True) == bundled_catacombs
+
+
+def test_level_tables_fall_back_to_the_bundled_json(served, monkeypatch):
+    update_level_tables(Resources(client=Client()))
+    monkeypatch.setattr(Resources, "base_url", unreachable_url())
+
+    assert update_level_tables(Resources(client=Client())) == "bundled"
+
+    assert getSkillLevel(55_172_425)["skill_level"] == 50
+    with pytest.raises(KeyError):
+        get_level_table("SKILL_RUNECRAFTING")
+
+
+def test_skills_follow_their_own_curve(served):
+    update_level_tables(Resources(client=Client()))
+    experience = {"SKILL_RUNECRAFTING": 160.0, "SKILL_MINING": 160.0}
+    member = Member("a" * 32, {"player_data": {"experience": experience}})
+
+    levels = member.skill_levels
+    table = PlayerTable.from_players([member])
+
+    # Runecrafting reaches level 2 at 150 xp, the shared curve at 175
+    assert getSkillLevel(160, skill="SKILL_RUNECRAFTING")["skill_level"] == 2
+    assert getSkillLevel(160)["skill_level"] == 1
+    assert levels["SKILL_RUNECRAFTING"]["skill_level"] == 2
+    assert levels["SKILL_MINING"]["skill_level"] == 1
+    assert table["level.SKILL_RUNECRAFTING"].tolist() == [2]
+    assert table["level.SKILL_MINING"].tolist() == [1]
+    # A skill the resource doesn't list uses the shared curve
+    assert getSkillLevel(160, skill="SKILL_SOCIAL")["skill_level"] == 1
+
+
+def test_compiled_tables_match_the_bundled_curve():
+    tables = compile_skill_tables(skills_resource())
+
+    assert tables["Skills"].cumulative_xp == get_level_table("Skills").cumulative_xp
+    assert tables["Skills"].xp_required == get_level_table("Skills").xp_required
+    assert tables["SKILL_FISHING"].max_level == 50
+    assert tables["SKILL_RUNECRAFTING"].xp_required == (50.0, 100.0, 275.0)
+
+
+def test_malformed_resource_is_rejected():
+    resource = skills_resource()
+    resource["skills"]["MINING"]["levels"][3]["totalExpRequired"] = 0
+
+    with pytest.raises(ValueError):
+        compile_skill_tables(resource)
+    with pytest.raises(ValueError):
+        compile_skill_tables({"success": True, "skills": {}})
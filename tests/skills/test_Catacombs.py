@@ -0,0 +1,32 @@
+from hyparse.skills.Dungeons import Catacombs, FloorStats
+
+CATACOMBS = {
+    "tier_completions": {"0": 3, "7": 120, "total": 123},
+    "fastest_time": {"7": 301_250, "best": 301_250},
+    "best_score": {"0": 250, "7": 317},
+}
+
+
+def test_compact_format_data():
+    floors = Catacombs(CATACOMBS).format_data(compact=True)
+
+    assert floors[7] == FloorStats(120, "05:01.250", None, None, 317)
+    assert floors[0].completions == 3
+    assert floors[0].fastest_time is None
+
+
+def test_to_dict_matches_format_data():
+    catacombs = Catacombs(CATACOMBS)
+
+    compact = catacombs.format_data(compact=True)
+
+    assert {floor: stats.to_dict() for floor, stats in compact.items()} == (
+        catacombs.format_data()
+    )
+
+
+def test_format_data_is_computed_once():
+    catacombs = Catacombs(CATACOMBS)
+
+    assert catacombs.format_data() is catacombs.format_data()
+    assert catacombs.format_data(compact=True) is catacombs.format_data(compact=True)
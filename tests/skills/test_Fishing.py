@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from hyparse.skills.Fishing import (
+    TIERS,
+    Fishing,
+    HighestTrophy,
+    TrophyCounts,
+    rank_trophies,
+)
+
+SKYBLOCK_DATA = {
+    "trophy_fish": {
+        "blobfish": 30,
+        "blobfish_bronze": 20,
+        "blobfish_silver": 8,
+        "golden_fish_gold": 1,
+        "rewards": [1, 2],
+        "total_caught": 59,
+        "last_caught": "blobfish/silver",
+    }
+}
+
+
+def test_compact_trophies_match_dicts():
+    fishing = Fishing(SKYBLOCK_DATA)
+
+    compact = fishing.get_trophies(compact=True)
+
+    assert compact["blobfish"] == TrophyCounts(normal=30, bronze=20, silver=8)
+    assert {
+        name: value.to_dict() if isinstance(value, TrophyCounts) else value
+        for name, value in compact.items()
+    } == fishing.trophies
+
+
+def test_compact_highest_trophies_match_dicts():
+    fishing = Fishing(SKYBLOCK_DATA)
+
+    compact = fishing.get_highest_trophies(compact=True)
+
+    assert compact["blobfish"] == HighestTrophy(8, "silver")
+    assert compact["golden_fish"] == HighestTrophy(1, "gold")
+    assert compact["total_caught"] == 59
+    assert {
+        name: value.to_dict() if isinstance(value, HighestTrophy) else value
+        for name, value in compact.items()
+    } == fishing.highest_trophies
+
+
+def test_no_trophy_fish():
+    with pytest.raises(ValueError):
+        Fishing({}).get_highest_trophies(compact=True)
+
+
+def test_tiered_keys_are_grouped_by_fish():
+    trophies = Fishing(SKYBLOCK_DATA).trophies
+
+    assert set(trophies) == {
+        "blobfish",
+        "golden_fish",
+        "last_caught",
+        "rewards",
+        "total_caught",
+    }
+    assert trophies["golden_fish"] == {
+        "normal": 0,
+        "bronze": 0,
+        "silver": 0,
+        "gold": 1,
+        "diamond": 0,
+    }
+
+
+def test_aggregate_is_computed_once():
+    fishing = Fishing(SKYBLOCK_DATA)
+
+    fishing.trophies
+    aggregate = fishing._aggregate
+    fishing.highest_trophies
+
+    assert aggregate is not None
+    assert fishing._aggregate is aggregate
+
+
+def test_unknown_fish_and_zero_counts():
+    fishing = Fishing({"trophy_fish": {"new_fish_diamond": 0, "new_fish": 4}})
+
+    assert fishing.highest_trophies["new_fish"] == {"count": 0, "rank": "diamond"}
+    assert fishing.trophies["new_fish"]["normal"] == 4
+
+
+def test_rank_trophies():
+    players = [
+        SKYBLOCK_DATA,
+        Fishing({"trophy_fish": {"blobfish_diamond": 2}}),
+        {},
+    ]
+
+    arrays = rank_trophies(players, fish=["blobfish", "golden_fish"])
+
+    assert arrays["fish"] == ["blobfish", "golden_fish"]
+    assert arrays["counts"].shape == (3, 2, len(TIERS))
+    assert arrays["counts"][0, 0].tolist() == [30, 20, 8, 0, 0]
+    assert arrays["highest"].tolist() == [
+        [TIERS.index("silver"), TIERS.index("gold")],
+        [TIERS.index("diamond"), -1],
+        [-1, -1],
+    ]
+    # Best blobfish first
+    assert np.argsort(-arrays["highest"][:, 0], kind="stable").tolist() == [1, 0, 2]
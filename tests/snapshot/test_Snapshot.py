@@ -0,0 +1,133 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from hyparse import Player
+from hyparse.exceptions import HypixelSuccessError
+from hyparse.snapshot import Snapshot
+
+from conftest import TEST_JSON, UUID
+
+OTHER_UUID = "a" * 32
+
+
+@pytest.fixture
+def body() -> bytes:
+    with open(TEST_JSON, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture(autouse=True)
+def offline():
+    """Fail any test that touches the network"""
+    with patch("requests.Session.request", side_effect=AssertionError("online")):
+        yield
+
+
+def test_from_response(body):
+    for response in (body, body.decode(), memoryview(body), json.loads(body)):
+        player = Player.from_response(response, UUID)
+        assert player.profile_id == player.profiles[player.profile_index]["profile_id"]
+        assert player.uuid == UUID
+
+
+def test_from_response_streaming(body):
+    player = Player.from_response(memoryview(body), UUID, streaming=True)
+
+    assert list(player.coop_members()) == [UUID]
+
+
+def test_unsuccessful_response():
+    with pytest.raises(HypixelSuccessError):
+        Player.from_response(b'{"success": false, "cause": "Invalid"}', UUID)
+
+
+def test_from_file(body, tmp_path):
+    path = tmp_path / "profiles.json"
+    path.write_bytes(body)
+
+    player = Player.from_file(path, UUID)
+
+    assert player.skyblock_data == Player.from_response(body, UUID).skyblock_data
+
+
+def test_round_trip(body, tmp_path):
+    directory = tmp_path / "snapshot"
+    with Snapshot(directory, writable=True) as snapshot:
+        snapshot.add(UUID, body, fetched_at=1.0)
+        snapshot.add(OTHER_UUID, b"{}")
+
+    with Snapshot(directory) as snapshot:
+        assert len(snapshot) == 2
+        assert list(snapshot) == [UUID, OTHER_UUID]
+        assert snapshot.entry(UUID).fetched_at == 1.0
+        assert bytes(snapshot.get(UUID)) == body
+        assert snapshot.player(UUID).uuid == UUID
+
+    assert Player.from_file(directory, UUID).uuid == UUID
+
+
+def test_newest_entry_wins_and_reads_see_appends(body, tmp_path):
+    with Snapshot(tmp_path, writable=True) as snapshot:
+        snapshot.add(UUID, b"{}")
+        assert bytes(snapshot.get(UUID)) == b"{}"
+
+        snapshot.add(UUID, body)
+        assert bytes(snapshot.get(UUID)) == body
+        assert len(snapshot) == 1
+
+
+def test_players(body, tmp_path):
+    with Snapshot(tmp_path, writable=True) as snapshot:
+        snapshot.add(UUID, body)
+        snapshot.add(OTHER_UUID, body)
+
+    with Snapshot(tmp_path) as snapshot:
+        players = list(snapshot.players([UUID], streaming=True))
+
+    assert [player.uuid for player in players] == [UUID]
+    assert list(players[0].coop_members()) == [UUID]
+
+
+def test_torn_writes_are_ignored(body, tmp_path):
+    with Snapshot(tmp_path, writable=True) as snapshot:
+        snapshot.add(UUID, body)
+
+    # A crash after the index line was written but before the data was
+    with open(tmp_path / "index.ndjson", "a") as f:
+        f.write(
+            json.dumps(
+                {
+                    "uuid": OTHER_UUID,
+                    "offset": len(body),
+                    "length": 10,
+                    "fetched_at": 0.0,
+                }
+            )
+            + "\n"
+        )
+        f.write('{"uuid": "torn')
+
+    with Snapshot(tmp_path) as snapshot:
+        assert list(snapshot) == [UUID]
+
+
+def test_views_outlive_close(body, tmp_path):
+    with Snapshot(tmp_path, writable=True) as snapshot:
+        snapshot.add(UUID, body)
+
+    snapshot = Snapshot(tmp_path)
+    view = snapshot.get(UUID)
+    snapshot.close()
+
+    assert bytes(view[:1]) == b"{"
+
+
+def test_not_a_snapshot(tmp_path):
+    (tmp_path / "snapshot.json").write_text('{"format": "other"}')
+
+    with pytest.raises(ValueError):
+        Snapshot(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        Snapshot(tmp_path / "missing")
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+from hyparse import Member, Player
+from hyparse.levels import getSkillLevel
+from hyparse.table import PlayerTable
+
+from conftest import UUID
+
+API_KEY = "ABCDEFG"
+
+
+def member(mining=0.0, fishing=None, catacombs=0.0, floor_7=0, trophies=None):
+    experience = {"SKILL_MINING": mining}
+    if fishing is not None:
+        experience["SKILL_FISHING"] = fishing
+    return {
+        "player_data": {"experience": experience},
+        "dungeons": {
+            "dungeon_types": {
+                "catacombs": {
+                    "experience": catacombs,
+                    "tier_completions": {"7": floor_7, "total": floor_7},
+                },
+                "master_catacombs": {"tier_completions": {"1": 2}},
+            }
+        },
+        "trophy_fish": trophies or {},
+    }
+
+
+@pytest.fixture
+def table():
+    return PlayerTable.from_players(
+        [
+            Member("a" * 32, member(100, catacombs=50, floor_7=1)),
+            Member("b" * 32, member(5_000_000, 900, catacombs=5e6, floor_7=30)),
+            Member("c" * 32, member(50_000, trophies={"gusher": 3, "gusher_gold": 1})),
+            Member("d" * 32, member(20_000_000, 10, catacombs=1e8)),
+        ]
+    )
+
+
+def test_columns_match_per_player_levels(table):
+    xp = [100, 5_000_000, 50_000, 20_000_000]
+
+    assert table.skills == ["SKILL_MINING", "SKILL_FISHING"]
+    assert table["xp.SKILL_MINING"].tolist() == xp
+    assert table["xp.SKILL_FISHING"].tolist() == [0, 900, 0, 10]
+    assert table["level.SKILL_MINING"].tolist() == [
+        getSkillLevel(value)["skill_level"] for value in xp
+    ]
+    assert table["catacombs_level"][1] == getSkillLevel(5e6, True)["skill_level"]
+    assert table["completions.catacombs.7"].tolist() == [1, 30, 0, 0]
+    assert table["completions.master_catacombs.1"].tolist() == [2, 2, 2, 2]
+    assert table["trophy.gusher"].tolist() == [0, 0, 4, 0]
+    assert table["trophy_total"].tolist() == [0, 0, 4, 0]
+    assert np.isnan(table["purse"]).all()
+    assert all(isinstance(table[name], np.ndarray) for name in table.columns)
+
+
+def test_unknown_columns(table):
+    for name in ("xp.SKILL_TAMING", "completions.catacombs.9", "completions.x.1", "?"):
+        with pytest.raises(KeyError):
+            table[name]
+
+
+def test_top(table):
+    top = table.top("xp.SKILL_MINING", 2)
+
+    assert top.uuids.tolist() == ["d" * 32, "b" * 32]
+    assert top.values.tolist() == [20_000_000, 5_000_000]
+    assert table.top("catacombs_xp", 1, ascending=True).uuids.tolist() == ["c" * 32]
+    assert len(table.top("xp.SKILL_MINING", 10).rows) == 4
+
+
+def test_top_skips_nan(stub_player, table):
+    player = Player(API_KEY, uuid=UUID)
+    mixed = PlayerTable.from_players([player, Member("a" * 32, member(1))])
+
+    assert mixed.top("purse", 5).uuids.tolist() == [UUID]
+
+
+def test_percentiles(table):
+    assert table.percentile("completions.catacombs.7", 50) == 0.5
+    assert table.percentile("xp.SKILL_MINING", [0, 100]).tolist() == [100, 20_000_000]
+    assert table.percentile_rank("xp.SKILL_MINING", "d" * 32) == 100.0
+    assert table.percentile_rank("xp.SKILL_MINING", "a" * 32) == 0.0
+
+
+def test_filter(table):
+    veterans = table.filter(table["completions.catacombs.7"] > 0)
+
+    assert veterans.uuids.tolist() == ["a" * 32, "b" * 32]
+    assert veterans.row("b" * 32) == 1
+    assert "c" * 32 not in veterans
+
+
+def test_filter_matching_nothing(table):
+    nobody = table.filter(table["catacombs_xp"] > 1e12)
+
+    assert len(nobody) == 0
+    assert nobody["level.SKILL_MINING"].tolist() == []
+    assert nobody.top("catacombs_xp").uuids.tolist() == []
+
+
+def test_empty_table():
+    table = PlayerTable.from_players([])
+
+    assert len(table) == 0
+    assert table.skills == []
+    assert "a" * 32 not in table
+    assert table.top("purse").rows.tolist() == []
+
+
+def test_save_and_load(table, tmp_path):
+    path = tmp_path / "players.npz"
+    table.save(path)
+
+    loaded = PlayerTable.load(path)
+
+    assert loaded.uuids.tolist() == table.uuids.tolist()
+    assert loaded.skills == table.skills
+    for name in table.columns:
+        np.testing.assert_array_equal(loaded[name], table[name])
+
+
+def test_raw_member_dicts_are_rejected():
+    with pytest.raises(TypeError):
+        PlayerTable.from_players([Member("a" * 32, member(1)), member(2), {}])
+
+
+def test_dashed_uuids_are_kept_whole():
+    dashed = "0959dfbd-e98d-4b34-8271-ad0c5728f4fe"
+    table = PlayerTable.from_players(
+        [Member(dashed, member(1)), Member("a" * 32, member(2))]
+    )
+
+    assert table.uuids.tolist() == [dashed.replace("-", ""), "a" * 32]
+    assert table.row(dashed) == 0
+    assert dashed in table
+    assert table.row("a" * 32) == 1
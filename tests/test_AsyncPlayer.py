@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+
+from hyparse import AsyncPlayer, Client, Player, fetch_players
+from hyparse.AsyncPlayer import _is_uuid
+from hyparse.exceptions import UserNotFound
+
+from conftest import PLAYER_NAME, UUID
+
+API_KEY = "ABCDEFG"
+
+
+def test_create_with_name(stub_player):
+    player = asyncio.run(AsyncPlayer.create(API_KEY, player_name=PLAYER_NAME))
+
+    assert isinstance(player, Player)
+    assert player.uuid == UUID
+    assert player.profile_id == "i_hate_unit_testing"
+
+
+def test_create_with_uuid_and_selected_profile(stub_player):
+    player = asyncio.run(
+        AsyncPlayer.create(API_KEY, uuid=UUID, selected_profile="Zucchini")
+    )
+
+    assert player.profile_id == "abcdef12345"
+    assert "SKILL_COMBAT" in player.skill_levels
+    assert player.dungeons.cata_level["skill_level"] == 0
+    # Only the uuid was given, so Mojang must not have been asked
+    assert all("minecraft" not in url for _, url in stub_player.requests)
+
+
+def test_fetch_players_preserves_order(stub_player):
+    dashed = f"{UUID[:8]}-{UUID[8:12]}-{UUID[12:16]}-{UUID[16:20]}-{UUID[20:]}"
+    players = asyncio.run(
+        fetch_players(API_KEY, [PLAYER_NAME, UUID, dashed], concurrency=2)
+    )
+
+    assert [player.uuid for player in players] == [UUID, UUID, UUID]
+
+
+def test_fetch_players_runs_concurrently(stub_player):
+    stub_player.delay = 0.1
+    # The same uuid over and over, which would otherwise be coalesced
+    client = Client(coalesce=False)
+
+    asyncio.run(fetch_players(API_KEY, [UUID] * 8, concurrency=4, client=client))
+
+    assert stub_player.peak_in_flight > 1
+    assert stub_player.peak_in_flight <= 4
+
+
+def test_identical_fetches_are_coalesced(stub_player):
+    stub_player.delay = 0.1
+    client = Client()
+
+    players = asyncio.run(fetch_players(API_KEY, [UUID] * 8, client=client))
+
+    assert len(stub_player.requests) == 1
+    assert len({id(player) for player in players}) == 8
+    assert all(player.profiles is players[0].profiles for player in players)
+    # Building the player, and the profiles request it made
+    assert client.single_flight.stats() == {
+        "calls": 2,
+        "coalesced": 7,
+        "in_flight": 0,
+    }
+
+
+def test_coalesced_players_dont_see_each_others_writes(stub_player):
+    first, second = asyncio.run(fetch_players(API_KEY, [UUID] * 2, client=Client()))
+    player_data, levels = first["player_data"], first.skill_levels
+
+    second["player_data"] = {"experience": {"SKILL_MINING": 1_000_000.0}}
+
+    assert first["player_data"] is player_data
+    assert first.skill_levels is levels
+    assert levels == {}
+    assert second.skill_levels["SKILL_MINING"]["skill_level"] > 1
+    # Each one's profiles hold its own member data
+    for player in (first, second):
+        members = player.profiles[player.profile_index]["members"]
+        assert members[UUID] is player.skyblock_data
+
+
+def test_fetch_players_return_exceptions(stub_player):
+    results = asyncio.run(
+        fetch_players(API_KEY, [PLAYER_NAME, "unknown_user"], return_exceptions=True)
+    )
+
+    assert isinstance(results[0], Player)
+    assert isinstance(results[1], UserNotFound)
+
+
+def test_fetch_players_raises_by_default(stub_player):
+    with pytest.raises(UserNotFound):
+        asyncio.run(fetch_players(API_KEY, ["unknown_user"]))
+
+
+def test_fetch_players_rejects_zero_concurrency():
+    with pytest.raises(ValueError):
+        asyncio.run(fetch_players(API_KEY, [UUID], concurrency=0))
+
+
+def test_is_uuid():
+    assert _is_uuid(UUID)
+    assert _is_uuid("0959dfbd-e98d-4b34-8271-ad0c5728f4fe")
+    assert not _is_uuid(PLAYER_NAME)
+    assert not _is_uuid("Technoblade")
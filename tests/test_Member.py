@@ -0,0 +1,177 @@
+from hyparse import Member, Player
+from hyparse.player import Inventory
+
+from conftest import UUID, make_item, make_section
+
+API_KEY = "ABCDEFG"
+COOP_UUIDS = ["a" * 32, "b" * 32]
+
+RESPONSE = {
+    "success": True,
+    "profiles": [
+        {
+            "profile_id": "coop",
+            "members": {
+                UUID: {"player_data": {"experience": {"SKILL_MINING": 100}}},
+                COOP_UUIDS[0]: {
+                    "player_data": {"experience": {"SKILL_FISHING": 60}},
+                    "dungeons": {"dungeon_types": {"catacombs": {"experience": 50}}},
+                    "inventory": {
+                        "inv_contents": {
+                            "type": 0,
+                            "data": make_section(make_item("HYPERION")),
+                        }
+                    },
+                },
+                COOP_UUIDS[1]: {"player_data": {}},
+            },
+            "cute_name": "Apple",
+            "selected": True,
+        }
+    ],
+}
+
+
+def coop_player(stub_player, **kwargs) -> Player:
+    stub_player.routes["/v2/skyblock/profiles"] = lambda *_: (200, {}, RESPONSE)
+    return Player(API_KEY, uuid=UUID, **kwargs)
+
+
+def test_every_member_is_returned(stub_player):
+    player = coop_player(stub_player)
+
+    members = player.coop_members()
+
+    assert list(members) == [UUID, *COOP_UUIDS]
+    assert members[UUID] is player
+    assert all(isinstance(member, Member) for member in members.values())
+
+
+def test_coop_members_make_no_requests(stub_player):
+    player = coop_player(stub_player)
+    requests = len(stub_player.requests)
+
+    for member in player.coop_members().values():
+        member.skill_levels
+        member.dungeons
+        member.fishing
+        member.inventory().load_all()
+
+    assert len(stub_player.requests) == requests
+
+
+def test_member_views(stub_player):
+    member = coop_player(stub_player).coop_members()[COOP_UUIDS[0]]
+
+    assert member.skill_levels["SKILL_FISHING"]["skill_level"] == 1
+    assert member.dungeons.cata_level["skill_level"] == 1
+    assert isinstance(member.inventory(), Inventory)
+    assert member.inventory().find_items(id="HYPERION")[0].section == "inv_contents"
+    assert coop_player(stub_player).coop_members()[COOP_UUIDS[1]].skill_levels == {}
+
+
+def test_members_share_profile_data(stub_player):
+    player = coop_player(stub_player)
+
+    member = player.coop_members()[COOP_UUIDS[0]]
+
+    assert member.skyblock_data is player.profiles[0]["members"][COOP_UUIDS[0]]
+    assert "dungeons" in member
+    assert member["player_data"] == {"experience": {"SKILL_FISHING": 60}}
+
+
+def test_streaming_keeps_only_the_player(stub_player):
+    player = coop_player(stub_player, streaming=True)
+
+    assert player.coop_members() == {UUID: player}
+
+
+def test_compact_skill_levels(stub_player):
+    player = coop_player(stub_player)
+
+    compact = player.get_skill_levels(compact=True)
+
+    assert {name: level.to_dict() for name, level in compact.items()} == (
+        player.skill_levels
+    )
+
+
+def test_views_are_memoized(stub_player):
+    player = coop_player(stub_player)
+    member = player.coop_members()[COOP_UUIDS[0]]
+
+    assert member.dungeons is member.dungeons
+    assert member.fishing is member.fishing
+    assert member.inventory() is member.inventory()
+    assert member.inventory(lazy_load=False) is not member.inventory()
+    assert member.skill_levels is member.skill_levels
+    assert player.inventory() is player.inventory()
+    assert len(player._inventories) == 1
+
+
+def test_setting_data_invalidates_its_views(stub_player):
+    member = coop_player(stub_player).coop_members()[COOP_UUIDS[0]]
+    dungeons = member.dungeons
+    levels = member.skill_levels
+
+    member["player_data"] = {"experience": {"SKILL_FISHING": 1_000_000}}
+
+    assert member.skill_levels is not levels
+    assert member.skill_levels["SKILL_FISHING"]["skill_level"] > 1
+    assert member.dungeons is dungeons
+
+
+def test_invalidate_after_changing_data_in_place(stub_player):
+    member = coop_player(stub_player).coop_members()[COOP_UUIDS[0]]
+    member.dungeons.cata_level
+    member.skill_levels
+    member["player_data"]["experience"]["SKILL_FISHING"] = 1_000_000
+    member["dungeons"]["dungeon_types"]["catacombs"]["experience"] = 1_000_000
+
+    assert member.skill_levels["SKILL_FISHING"]["skill_level"] == 1
+
+    member.invalidate("player_data")
+    assert member.skill_levels["SKILL_FISHING"]["skill_level"] > 1
+    assert member.dungeons.cata_level["skill_level"] == 1
+
+    member.invalidate()
+    assert member.dungeons.cata_level["skill_level"] > 1
+
+
+def test_replacing_the_inventory_keeps_unchanged_sections(stub_player):
+    member = coop_player(stub_player).coop_members()[COOP_UUIDS[0]]
+    inventory = member.inventory()
+    inventory.load_all()
+
+    member["inventory"] = {
+        **member["inventory"],
+        "ender_chest_contents": {"type": 0, "data": make_section(make_item("DIRT"))},
+    }
+
+    assert member.inventory() is inventory
+    assert "inv_contents" in inventory._parsed_nbt
+    assert inventory.count("DIRT") == 1
+
+
+def test_invalidating_an_inventory_changed_in_place(stub_player):
+    member = coop_player(stub_player).coop_members()[COOP_UUIDS[0]]
+    inventory = member.inventory()
+    inventory.load_all()
+    member["inventory"]["inv_contents"]["data"] = make_section(make_item("DIRT"))
+
+    member.invalidate("inventory")
+
+    assert member.inventory() is not inventory
+    assert member.inventory().count("DIRT") == 1
+    assert member.inventory().count("HYPERION") == 0
+
+
+def test_drop_caches(stub_player):
+    member = coop_player(stub_player).coop_members()[COOP_UUIDS[0]]
+    dungeons, inventory = member.dungeons, member.inventory()
+
+    member.drop_caches()
+
+    assert member.dungeons is not dungeons
+    assert member.inventory() is not inventory
+    assert member._views.keys() == {("dungeons", None), ("inventory", True)}
@@ -24,7 +24,7 @@ def mock_requests() -> Generator[Tuple[MagicMock, Dict[str, Any]], None, None]:
     with open(TEST_JSON) as file:
         MOCK_PROFILE_DATA = load(file)
 
-    with patch("hyparse.Player.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
 
         def side_effect(url, *args, **kwargs):
             mock_resp = MagicMock()
@@ -83,7 +83,7 @@ def test_purse(mock_requests):
 
 
 def test_errors_on_failed_invalid_api_key():
-    with patch("hyparse.Player.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         # Simulate 403 error
         mock_resp = MagicMock()
         mock_resp.status_code = 403
@@ -95,7 +95,7 @@ def test_errors_on_failed_invalid_api_key():
 
 
 def test_errors_on_failed_fetch_request():
-    with patch("hyparse.Player.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         # Simulate a 404 Error
         mock_resp = MagicMock()
         mock_resp.status_code = 404
@@ -114,7 +114,7 @@ def test_errors_on_failed_fetch_request():
 
 
 def test_errors_on_minecraft_user_not_found():
-    with patch("hyparse.Player.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_resp = MagicMock()
         mock_resp.status_code = 404
         mock_get.return_value = mock_resp
@@ -0,0 +1,198 @@
+from copy import deepcopy
+
+import pytest
+
+from hyparse import Client, Player
+from hyparse.cache import ResponseCache
+from hyparse.ProfileDiff import diff_members, fingerprint, section_fingerprints
+
+from conftest import UUID, make_item, make_section
+
+API_KEY = "ABCDEFG"
+
+MEMBER = {
+    "player_data": {"experience": {"SKILL_MINING": 100.0, "SKILL_FISHING": 50.0}},
+    "dungeons": {
+        "dungeon_types": {
+            "catacombs": {"tier_completions": {"0": 1, "7": 3, "total": 4}},
+        }
+    },
+    "inventory": {
+        "inv_contents": {"type": 0, "data": make_section(make_item("HYPERION"))},
+        "backpack_contents": {
+            "0": {"type": 0, "data": make_section(make_item("TERMINATOR"))},
+        },
+    },
+}
+
+
+def diff(before, after):
+    return diff_members(
+        before, after, section_fingerprints(before), section_fingerprints(after)
+    )
+
+
+def response(member):
+    return {
+        "success": True,
+        "profiles": [
+            {
+                "profile_id": "apple",
+                "cute_name": "Apple",
+                "selected": True,
+                "members": {UUID: member},
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def served(stub_player):
+    """The member data the stub server returns, mutable between fetches"""
+    member = deepcopy(MEMBER)
+    stub_player.routes["/v2/skyblock/profiles"] = lambda *_: (
+        200,
+        {},
+        response(member),
+    )
+    return member
+
+
+def test_fingerprint_ignores_key_order():
+    assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+def test_inventory_blobs_are_fingerprinted_per_section():
+    assert set(section_fingerprints(MEMBER)) == {
+        "player_data",
+        "dungeons",
+        "inventory/inv_contents",
+        "inventory/backpack_contents/0",
+    }
+
+
+def test_unchanged_member():
+    result = diff(MEMBER, deepcopy(MEMBER))
+
+    assert not result
+    assert result.sections_changed == ()
+    assert result.skill_xp == {}
+    assert result.completions == {}
+
+
+def test_changes_are_reported():
+    after = deepcopy(MEMBER)
+    after["player_data"]["experience"]["SKILL_MINING"] = 250.0
+    after["player_data"]["experience"]["SKILL_COMBAT"] = 10.0
+    after["dungeons"]["dungeon_types"]["catacombs"]["tier_completions"]["7"] = 5
+    after["dungeons"]["dungeon_types"]["master_catacombs"] = {
+        "tier_completions": {"1": 1}
+    }
+    del after["inventory"]["backpack_contents"]["0"]
+
+    result = diff(MEMBER, after)
+
+    assert result
+    assert result.sections_changed == (
+        "dungeons",
+        "inventory/backpack_contents/0",
+        "player_data",
+    )
+    assert result.inventory_sections == ["backpack_contents/0"]
+    assert result.skill_xp == {"SKILL_MINING": 150.0, "SKILL_COMBAT": 10.0}
+    assert result.completions == {
+        "catacombs": {"7": 2},
+        "master_catacombs": {"1": 1},
+    }
+    assert result.to_dict()["sections_changed"] == list(result.sections_changed)
+
+
+def test_refresh_skips_the_response_cache(served, stub_player):
+    player = Player(API_KEY, uuid=UUID, client=Client(cache=ResponseCache()))
+    served["player_data"]["experience"]["SKILL_MINING"] = 400.0
+
+    result = player.refresh()
+
+    assert len(stub_player.requests) == 2
+    assert result.sections_changed == ("player_data",)
+    assert result.skill_xp == {"SKILL_MINING": 300.0}
+    assert player["player_data"]["experience"]["SKILL_MINING"] == 400.0
+
+
+def test_refresh_keeps_unchanged_sections_decoded(served):
+    player = Player(API_KEY, uuid=UUID, client=Client())
+    inventory = player.inventory()
+    inventory.player_inventory
+    backpack = inventory.backpacks["0"]
+    served["inventory"]["backpack_contents"]["0"]["data"] = make_section(
+        make_item("DIRT")
+    )
+
+    result = player.refresh()
+
+    assert result.inventory_sections == ["backpack_contents/0"]
+    assert "inv_contents" in inventory._parsed_nbt
+    assert "backpack_contents/0" not in inventory._parsed_nbt
+    assert inventory.backpacks["0"] != backpack
+    assert inventory.count("DIRT") == 1
+
+
+def test_consecutive_refreshes(served):
+    player = Player(API_KEY, uuid=UUID, client=Client())
+    served["player_data"]["experience"]["SKILL_FISHING"] = 60.0
+
+    assert player.refresh().skill_xp == {"SKILL_FISHING": 10.0}
+    assert not player.refresh()
+
+
+def test_refresh_only_drops_views_of_changed_data(served):
+    player = Player(API_KEY, uuid=UUID, client=Client())
+    dungeons, fishing, levels = player.dungeons, player.fishing, player.skill_levels
+    served["player_data"]["experience"]["SKILL_MINING"] = 1_000_000.0
+
+    player.refresh()
+
+    assert player.dungeons is dungeons
+    assert player.fishing is fishing
+    assert player.dungeons._data is player.skyblock_data
+    assert player.skill_levels is not levels
+    assert player.skill_levels["SKILL_MINING"]["skill_level"] > 1
+
+
+def test_kept_views_let_go_of_the_old_data(served):
+    served["trophy_fish"] = {"gusher": 3, "gusher_gold": 1, "rewards": [1]}
+    player = Player(API_KEY, uuid=UUID, client=Client())
+    dungeons, fishing = player.dungeons, player.fishing
+    level, trophies = dungeons.cata_level, fishing.trophies
+    dungeons.catacombs.format_data()
+    served["player_data"]["experience"]["SKILL_MINING"] = 1_000_000.0
+
+    player.refresh()
+
+    data = player.skyblock_data
+    assert dungeons.dungeon_data is data["dungeons"]
+    assert dungeons.dungeon_types is data["dungeons"]["dungeon_types"]
+    assert dungeons.catacombs._data is data["dungeons"]["dungeon_types"]["catacombs"]
+    assert fishing._data is data
+    assert fishing._trophy_fishes is data["trophy_fish"]
+    assert fishing._extra_data["rewards"] is data["trophy_fish"]["rewards"]
+    # Results that hold none of the data carry over
+    assert dungeons.cata_level is level
+    assert fishing.trophies == trophies
+    assert fishing.trophies["rewards"] is data["trophy_fish"]["rewards"]
+
+
+def test_refresh_without_the_profile_keeps_the_player(stub_player, served):
+    player = Player(API_KEY, uuid=UUID, client=Client())
+    profiles, data = player.profiles, player.skyblock_data
+    gone = response(served)
+    gone["profiles"][0]["selected"] = False
+    stub_player.routes["/v2/skyblock/profiles"] = lambda *_: (200, {}, gone)
+
+    with pytest.raises(ValueError):
+        player.refresh()
+
+    assert player.profiles is profiles
+    assert (player.profile_id, player.profile_index) == ("apple", 0)
+    assert player.skyblock_data is data
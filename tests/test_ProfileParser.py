@@ -0,0 +1,145 @@
+import json
+
+import pytest
+
+from hyparse import Client, Player
+from hyparse.cache import ResponseCache
+from hyparse import ProfileParser
+from hyparse.ProfileParser import parse_profiles
+
+from conftest import UUID
+
+API_KEY = "ABCDEFG"
+COOP_UUID = "f" * 32
+
+RESPONSE = {
+    "success": True,
+    "profiles": [
+        {
+            "profile_id": "coop",
+            "members": {
+                COOP_UUID: {"player_data": {"experience": {"SKILL_MINING": 5}}},
+                UUID: {"player_data": {"experience": {"SKILL_MINING": 50}}},
+            },
+            "banking": {"balance": 1234.5},
+            "game_mode": "ironman",
+            "cute_name": "Apple",
+            "selected": True,
+        },
+        {
+            "profile_id": "solo",
+            "members": {UUID: {"player_data": {}}},
+            "banking": {"balance": 1.0},
+            "cute_name": "Banana",
+            "selected": False,
+        },
+    ],
+}
+
+
+def test_keeps_only_selected_member_and_banking():
+    data = parse_profiles(json.dumps(RESPONSE, indent=2).encode(), UUID)
+
+    selected, stub = data["profiles"]
+    assert data["success"] is True
+    assert selected == {
+        **RESPONSE["profiles"][0],
+        "members": {UUID: RESPONSE["profiles"][0]["members"][UUID]},
+    }
+    assert stub == {"profile_id": "solo", "cute_name": "Banana", "selected": False}
+
+
+def test_selects_by_cute_name():
+    data = parse_profiles(json.dumps(RESPONSE), UUID, selected_profile="banana")
+
+    stub, selected = data["profiles"]
+    assert stub == {"profile_id": "coop", "cute_name": "Apple", "selected": True}
+    assert selected["banking"] == {"balance": 1.0}
+    assert list(selected["members"]) == [UUID]
+
+
+def test_chunk_boundaries_anywhere():
+    response = {**RESPONSE, "note": "ünïcödé ✪", "count": 1234567890.125}
+    body = json.dumps(response, ensure_ascii=False).encode()
+
+    whole = parse_profiles(body, UUID)
+    byte_by_byte = parse_profiles((body[i : i + 1] for i in range(len(body))), UUID)
+
+    assert byte_by_byte == whole
+    assert whole["note"] == "ünïcödé ✪"
+    assert whole["count"] == 1234567890.125
+
+
+def test_buffers_are_read_in_chunks(monkeypatch):
+    members = {f"{index:032x}": {"padding": "x" * 1000} for index in range(100)}
+    response = {
+        "success": True,
+        "profiles": [{**RESPONSE["profiles"][0], "members": {**members, UUID: {}}}],
+    }
+    body = json.dumps(response).encode()
+    monkeypatch.setattr(ProfileParser, "CHUNK_SIZE", 256)
+
+    held = []
+    more = ProfileParser._Reader._more
+
+    def recording_more(reader):
+        result = more(reader)
+        held.append(len(reader.text))
+        return result
+
+    monkeypatch.setattr(ProfileParser._Reader, "_more", recording_more)
+    data = parse_profiles(memoryview(body), UUID)
+
+    assert data["profiles"][0]["members"] == {UUID: {}}
+    # About one member's worth of text at a time, never the whole body
+    assert max(held) < 4 * 1024 < len(body)
+
+
+def test_unsuccessful_and_empty_responses():
+    assert parse_profiles('{"success": false, "cause": "Invalid API key"}', UUID) == {
+        "success": False,
+        "cause": "Invalid API key",
+    }
+    assert parse_profiles('{"success": true, "profiles": null}', UUID) == {
+        "success": True,
+        "profiles": None,
+    }
+    assert parse_profiles('{"profiles": [ ]}', UUID) == {"profiles": []}
+
+
+@pytest.mark.parametrize(
+    "body", ['{"profiles": [{"members": {}}', '{"success": true} []', '{"a" 1}', ""]
+)
+def test_malformed_json_raises(body):
+    with pytest.raises(json.JSONDecodeError):
+        parse_profiles(body, UUID)
+
+
+def test_streaming_player_matches_full_player(stub_player, profile_data):
+    stub_player.routes["/v2/skyblock/profiles"] = lambda *_: (200, {}, RESPONSE)
+
+    full = Player(API_KEY, uuid=UUID)
+    streamed = Player(API_KEY, uuid=UUID, streaming=True)
+
+    assert streamed.profile_id == full.profile_id == "coop"
+    assert streamed.skill_levels == full.skill_levels
+    assert streamed.purse(human_readable=False) == 1234.5
+    assert streamed.cute_name == "Apple"
+    assert streamed.profiles[1] == {
+        "profile_id": "solo",
+        "cute_name": "Banana",
+        "selected": False,
+    }
+    assert COOP_UUID not in streamed.profiles[0]["members"]
+
+
+def test_streaming_player_from_cache(stub_player):
+    stub_player.routes["/v2/skyblock/profiles"] = lambda *_: (200, {}, RESPONSE)
+    client = Client(cache=ResponseCache())
+
+    Player(API_KEY, uuid=UUID, client=client)
+    cached = Player(API_KEY, uuid=UUID, client=client, streaming=True)
+
+    assert len(stub_player.requests) == 1
+    assert list(cached.profiles[0]["members"]) == [UUID]
+    assert "members" not in cached.profiles[1]
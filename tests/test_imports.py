@@ -0,0 +1,90 @@
+import importlib.util
+import sys
+from importlib import import_module
+from os import path
+
+import pytest
+
+import hyparse
+from hyparse.utils.Lazy import LAZY_ATTRIBUTES
+
+BENCH_IMPORT = path.join(path.dirname(__file__), "..", "benchmarks", "bench_import.py")
+
+
+def load_benchmark():
+    spec = importlib.util.spec_from_file_location("bench_import", BENCH_IMPORT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bench_import = load_benchmark()
+
+# Timings vary too much between machines (and a loaded CI runner) for the
+# suite to hold the budgets exactly, benchmarks/bench_import.py does. The
+# suite only catches imports that got several times slower.
+BUDGET_MARGIN = 4
+
+LAZY_PACKAGES = [
+    "hyparse",
+    "hyparse.cache",
+    "hyparse.client",
+    "hyparse.player",
+    "hyparse.player.Inventory",
+    "hyparse.skills",
+    "hyparse.skills.Dungeons",
+]
+
+
+@pytest.mark.parametrize("statement", list(bench_import.BUDGETS))
+def test_import_budget(statement):
+    # Each run is a fresh interpreter, best of a few so one slow run doesn't count
+    result = bench_import.measure(statement, repeat=3)
+
+    assert result["forbidden_imported"] == []
+    assert (
+        result["best_ms"] <= result["budget_ms"] * BUDGET_MARGIN
+    ), f"{statement!r} took {result['best_ms']}ms, budget {result['budget_ms']}ms"
+
+
+def test_lazy_attributes_resolve_to_objects():
+    import hyparse.Member
+    import hyparse.player.Inventory.Executor
+
+    from hyparse import Member, Player
+    from hyparse.player import Inventory
+
+    assert isinstance(Player, type) and isinstance(Member, type)
+    assert isinstance(hyparse.Member, type)
+    assert isinstance(Inventory, type)
+    assert "Player" in dir(hyparse)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        hyparse.Nothing
+
+    with pytest.raises(ImportError):
+        from hyparse import Nothing  # noqa: F401
+
+
+def test_submodules_are_still_importable():
+    from hyparse.Player import Player as FromModule
+
+    assert FromModule is hyparse.Player
+    assert sys.modules["hyparse.Player"].Player is FromModule
+
+
+@pytest.mark.parametrize("name", LAZY_PACKAGES)
+def test_dir_and_all_list_the_lazy_attributes(name):
+    package = import_module(name)
+    attributes = getattr(package, LAZY_ATTRIBUTES)
+
+    assert set(package.__all__) == set(attributes)
+    assert set(package.__all__) <= set(dir(package))
+    for attribute in package.__all__:
+        assert getattr(package, attribute) is not None
+
+    with pytest.raises(AttributeError, match="Nothing"):
+        getattr(package, "Nothing")
+    assert not hasattr(package, "__nothing__")
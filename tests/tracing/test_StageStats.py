@@ -0,0 +1,61 @@
+import io
+
+from hyparse.tracing import StageEvent, StageStats, Tracer, record
+
+
+def test_percentiles():
+    stats = StageStats()
+    for ms in range(1, 101):
+        stats(StageEvent("fetch_profiles", ms / 1000, bytes=10, cache_hit=ms > 90))
+
+    summary = stats.summary()["fetch_profiles"]
+
+    assert summary["count"] == 100
+    assert summary["p50"] == 0.050
+    assert summary["p95"] == 0.095
+    assert summary["p99"] == 0.099
+    assert summary["bytes"] == 1000
+    assert summary["cache_hits"] == 10
+
+
+def test_single_sample():
+    stats = StageStats()
+    stats(StageEvent("levels", 0.25))
+
+    summary = stats.summary()["levels"]
+
+    assert summary["p50"] == summary["p99"] == 0.25
+    assert summary["errors"] == 0
+
+
+def test_by_detail():
+    stats = StageStats(by_detail=True)
+    with Tracer(stats):
+        record("nbt_to_json", 0.1, "inv_contents", 100)
+        record("nbt_to_json", 0.2, "ender_chest_contents", 200)
+
+    assert set(stats.summary()) == {
+        "nbt_to_json[inv_contents]",
+        "nbt_to_json[ender_chest_contents]",
+    }
+
+
+def test_report():
+    stats = StageStats()
+    stats(StageEvent("minecraft_uuid", 0.002, error=True))
+    out = io.StringIO()
+
+    stats.print_report(out)
+
+    header, row = out.getvalue().splitlines()
+    assert header.split()[:5] == ["stage", "count", "p50", "ms", "p95"]
+    assert row.split()[:3] == ["minecraft_uuid", "1", "2.000"]
+
+
+def test_clear():
+    stats = StageStats()
+    stats(StageEvent("levels", 0.1))
+
+    stats.clear()
+
+    assert stats.summary() == {}
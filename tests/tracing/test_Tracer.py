@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from hyparse import Client, Player, fetch_players
+from hyparse.cache import NBTCache, set_nbt_cache
+from hyparse.exceptions import UserNotFound
+from hyparse.player import Inventory, NBTExecutor
+from hyparse.player.Inventory import Executor
+from hyparse.tracing import StageEvent, Tracer, get_tracer, stage
+
+from conftest import PLAYER_NAME, UUID, make_item, make_section
+
+API_KEY = "ABCDEFG"
+
+SKYBLOCK_DATA = {
+    "inventory": {
+        "inv_contents": {"type": 0, "data": make_section(make_item("HYPERION"))},
+        "ender_chest_contents": {"type": 0, "data": make_section(make_item("DIRT"))},
+    }
+}
+
+
+@pytest.fixture
+def nbt_cache():
+    previous = set_nbt_cache(NBTCache())
+    yield
+    set_nbt_cache(previous)
+
+
+def stages(events, name):
+    return [event for event in events if event.stage == name]
+
+
+def test_nothing_is_recorded_without_a_tracer():
+    assert get_tracer() is None
+    with stage("anything") as span:
+        span.bytes = 10
+
+    events = []
+    with Tracer(events.append) as tracer:
+        assert get_tracer() is tracer
+    assert get_tracer() is None
+    assert events == []
+
+
+def test_player_stages(stub_player):
+    client = Client()
+    events = []
+
+    with Tracer(events.append):
+        Player(API_KEY, player_name=PLAYER_NAME, client=client)
+        Player(API_KEY, player_name=PLAYER_NAME, client=client)
+
+    lookups = stages(events, "minecraft_uuid")
+    assert [event.cache_hit for event in lookups] == [False, True]
+    assert lookups[0].detail == PLAYER_NAME
+    assert lookups[0].bytes > 0
+
+    fetches = stages(events, "fetch_profiles")
+    decodes = stages(events, "decode_profiles")
+    assert len(fetches) == len(decodes) == 2
+    assert all(event.bytes > 0 and event.cache_hit is False for event in fetches)
+    assert all(
+        fetch.duration >= decode.duration for fetch, decode in zip(fetches, decodes)
+    )
+
+
+def test_failed_stage_is_flagged(stub_player):
+    events = []
+
+    with Tracer(events.append), pytest.raises(UserNotFound):
+        Player(API_KEY, player_name="NobodyHere", client=Client())
+
+    assert stages(events, "minecraft_uuid")[0].error is True
+
+
+def test_nbt_sections_and_cache_hits(nbt_cache):
+    events = []
+
+    with Tracer(events.append):
+        Inventory(SKYBLOCK_DATA, lazy_load=True).player_inventory
+        Inventory(SKYBLOCK_DATA, lazy_load=True).player_inventory
+
+    decodes = stages(events, "nbt_to_json")
+    assert [(event.detail, event.cache_hit) for event in decodes] == [
+        ("inv_contents", False),
+        ("inv_contents", True),
+    ]
+    assert decodes[0].bytes == len(SKYBLOCK_DATA["inventory"]["inv_contents"]["data"])
+
+
+def test_parallel_decodes_are_timed_per_section(nbt_cache, monkeypatch):
+    executor = NBTExecutor(max_workers=2, inline_threshold=0, process_threshold=0)
+    monkeypatch.setattr(Executor, "_default_executor", executor)
+    events = []
+
+    try:
+        with Tracer(events.append):
+            Inventory(SKYBLOCK_DATA, lazy_load=False)
+    finally:
+        executor.shutdown()
+
+    assert executor.strategy(["a", "b"]) == "processes"
+    assert sorted(event.detail for event in stages(events, "nbt_to_json")) == [
+        "ender_chest_contents",
+        "inv_contents",
+    ]
+    assert all(event.duration > 0 for event in events)
+
+
+def test_level_stages(stub_player):
+    player = Player(API_KEY, uuid=UUID, client=Client())
+    player["player_data"]["experience"] = {"SKILL_MINING": 1_000_000}
+    events = []
+
+    with Tracer(events.append):
+        player.skill_levels
+        player.dungeons.cata_level
+
+    assert [event.detail for event in stages(events, "levels")] == [
+        "skills",
+        "catacombs",
+    ]
+
+
+def test_tracer_follows_async_fetches(stub_player):
+    events = []
+
+    async def traced():
+        with Tracer(events.append):
+            await fetch_players(API_KEY, [PLAYER_NAME, UUID], client=Client())
+
+    asyncio.run(traced())
+
+    assert len(stages(events, "fetch_profiles")) == 2
+    assert all(isinstance(event, StageEvent) for event in events)